@@ -0,0 +1,4 @@
+"""
+Page-object latency benchmarks
+Run with: python -m benchmarks
+"""
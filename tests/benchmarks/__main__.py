@@ -0,0 +1,95 @@
+"""
+Page-object latency benchmarks
+Usage:
+    python -m benchmarks [--iterations 30] [--browser chrome] [--headless]
+                         [--base-url URL] [--latency-ms 0]
+                         [--only NAME] [--output FILE] [--compare FILE]
+Runs against the local stand-in app unless --base-url is given.
+"""
+import argparse
+import logging
+import time
+import uuid
+from contextlib import ExitStack
+from datetime import datetime
+from config.config import Config
+from standin.server import StandInServer
+from utils.command_counter import CommandCounter
+from utils.driver_factory import create_driver
+from utils.asset_cache import quit_driver
+from utils.launch_profile import LAUNCH_PROFILES
+from utils.resource_policy import RESOURCE_PROFILES
+from utils.seeding import SeedClient
+from benchmarks.operations import BENCHMARKS, BenchmarkContext
+from benchmarks.runner import BenchmarkRunner, format_table, load_report, save_report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark page-object operations")
+    parser.add_argument("--iterations", type=int, default=30, help="Timed iterations per operation")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed iterations per operation")
+    parser.add_argument("--browser", default=Config.DEFAULT_BROWSER)
+    parser.add_argument("--headless", action="store_true", default=Config.HEADLESS)
+    parser.add_argument("--launch-profile", choices=LAUNCH_PROFILES, default=Config.LAUNCH_PROFILE)
+    parser.add_argument("--resource-profile", choices=list(RESOURCE_PROFILES), default=Config.RESOURCE_PROFILE)
+    parser.add_argument("--element-cache", action="store_true", default=Config.ELEMENT_CACHE,
+                        help="Reuse located elements until the next navigation or click")
+    parser.add_argument("--base-url", help="Benchmark a running app instead of the stand-in")
+    parser.add_argument("--latency-ms", type=int, default=Config.STANDIN_LATENCY_MS,
+                        help="Stand-in response latency")
+    parser.add_argument("--only", action="append", help="Only run operations whose name contains this")
+    parser.add_argument("--output", help="JSON result file (default: reports/benchmarks/<timestamp>.json)")
+    parser.add_argument("--compare", help="Earlier JSON result file to compare with")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    
+    benchmarks = [
+        b for b in BENCHMARKS if not args.only or any(part in b.name for part in args.only)
+    ]
+    Config.ELEMENT_CACHE = args.element_cache
+    server = None
+    # Whatever was started is shut down in reverse order, even if a later step fails
+    with ExitStack() as cleanup:
+        if args.base_url:
+            target = args.base_url
+        else:
+            server = StandInServer(latency_ms=args.latency_ms).start()
+            cleanup.callback(server.stop)
+            target = server.url
+        Config.BASE_URL = Config.API_BASE_URL = target
+        
+        start = time.perf_counter()
+        driver = create_driver(args.browser, args.headless, args.launch_profile, args.resource_profile)
+        startup_ms = (time.perf_counter() - start) * 1000
+        cleanup.callback(quit_driver, driver)
+        seed_client = SeedClient()
+        cleanup.callback(seed_client.close)
+        seed_client.login_as_admin()
+        
+        counter = CommandCounter.for_driver(driver)
+        ctx = BenchmarkContext(driver, seed_client, uuid.uuid4().hex[:6])
+        runner = BenchmarkRunner(ctx, counter, args.iterations, args.warmup)
+        runner.run_all(benchmarks)
+    
+    report = runner.report({
+        "browser": args.browser,
+        "headless": args.headless,
+        "launch_profile": args.launch_profile,
+        "resource_profile": args.resource_profile,
+        "element_cache": args.element_cache,
+        "startup_ms": round(startup_ms, 1),
+        "target": "standin" if server else target,
+        "latency_ms": args.latency_ms if server else None,
+    })
+    output = args.output or f"reports/benchmarks/{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    baseline = load_report(args.compare) if args.compare else None
+    print(format_table(report, baseline))
+    print(f"\nResults saved to {save_report(report, output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmarked page-object operations
+Each benchmark prepares the page once, resets it before every iteration
+without timing, then times a single page-object call
+"""
+import itertools
+from collections import namedtuple
+from config.config import Config
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.menu_page import MenuPage
+from pages.register_page import RegisterPage
+
+# prepare(ctx) runs once, setup(ctx) before each iteration, run(ctx) is timed
+Benchmark = namedtuple("Benchmark", ["name", "prepare", "setup", "run"])
+
+
+class BenchmarkContext:
+    """State shared by the benchmarks of one run"""
+    
+    def __init__(self, driver, seed_client, run_id):
+        """
+        Args:
+            driver: WebDriver instance
+            seed_client: SeedClient logged in as admin
+            run_id: Short id making created names unique per run
+        """
+        self.driver = driver
+        self.seed_client = seed_client
+        self.run_id = run_id
+        self.sequence = itertools.count(1)
+        self.login_page = LoginPage(driver)
+        self.register_page = RegisterPage(driver)
+        self.menu_page = MenuPage(driver)
+        self.base_page = BasePage(driver)
+    
+    def unique(self, base):
+        """Get a name no other iteration or run has used"""
+        return f"bench-{self.run_id}-{next(self.sequence)}-{base}"
+    
+    def login_as_admin(self):
+        """Log in through the UI and open the menu page"""
+        self.logout()
+        self.login_page.navigate().login(Config.ADMIN_USER_EMAIL, Config.ADMIN_USER_PASSWORD)
+        self.menu_page.navigate()
+    
+    def logout(self):
+        """Drop the browser session"""
+        self.driver.delete_all_cookies()
+        self.base_page.invalidate_page_state()
+
+
+def _nothing(ctx):
+    pass
+
+
+def _register(ctx):
+    name = ctx.unique("user")
+    ctx.register_page.register(name, f"{name}@bench.test", "+216 98 000 000", "BenchPass123!")
+
+
+def _open_menu_modal(ctx):
+    ctx.menu_page.navigate().click_add_menu_button()
+
+
+BENCHMARKS = [
+    Benchmark(
+        "LoginPage.login",
+        prepare=_nothing,
+        setup=lambda ctx: (ctx.logout(), ctx.login_page.navigate()),
+        run=lambda ctx: ctx.login_page.login(Config.ADMIN_USER_EMAIL, Config.ADMIN_USER_PASSWORD)
+    ),
+    Benchmark(
+        "RegisterPage.register",
+        prepare=lambda ctx: ctx.logout(),
+        setup=lambda ctx: ctx.register_page.navigate(),
+        run=_register
+    ),
+    Benchmark(
+        "MenuPage.get_menu_count",
+        prepare=lambda ctx: (
+            ctx.seed_client.create_menus(
+                [{"name": ctx.unique("menu"), "description": "Benchmark menu"} for _ in range(10)]
+            ),
+            ctx.login_as_admin()
+        ),
+        setup=lambda ctx: ctx.menu_page.navigate(),
+        run=lambda ctx: ctx.menu_page.get_menu_count()
+    ),
+    Benchmark(
+        "MenuPage.create_menu",
+        prepare=lambda ctx: ctx.login_as_admin(),
+        setup=_open_menu_modal,
+        run=lambda ctx: ctx.menu_page.create_menu(ctx.unique("menu"), "Benchmark menu")
+    ),
+    Benchmark(
+        "BasePage.is_element_visible[hit]",
+        prepare=lambda ctx: ctx.login_as_admin(),
+        setup=_nothing,
+        run=lambda ctx: ctx.base_page.is_element_visible(MenuPage.PAGE_HEADING)
+    ),
+    Benchmark(
+        "BasePage.is_element_visible[miss]",
+        prepare=lambda ctx: ctx.login_as_admin(),
+        setup=_nothing,
+        run=lambda ctx: ctx.base_page.is_element_visible(MenuPage.MODAL)
+    ),
+]
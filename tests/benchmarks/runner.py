@@ -0,0 +1,160 @@
+"""
+Benchmark runner
+Times page-object operations, counts their WebDriver commands and
+writes the results as JSON that can be compared across commits
+"""
+import json
+import logging
+import math
+import platform
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, pct):
+    """Percentile of a list of numbers, interpolating between closest ranks"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(durations, command_counts):
+    """
+    Build the result entry of one benchmark
+    Args:
+        durations: Seconds per timed iteration
+        command_counts: Counter of WebDriver commands per timed iteration
+    """
+    totals = [sum(counts.values()) for counts in command_counts]
+    by_command = sum(command_counts, Counter())
+    millis = [d * 1000 for d in durations]
+    return {
+        "iterations": len(durations),
+        "p50_ms": round(percentile(millis, 50), 2),
+        "p95_ms": round(percentile(millis, 95), 2),
+        "p99_ms": round(percentile(millis, 99), 2),
+        "mean_ms": round(sum(millis) / len(millis), 2),
+        "min_ms": round(min(millis), 2),
+        "max_ms": round(max(millis), 2),
+        "commands_mean": round(sum(totals) / len(totals), 2),
+        "commands_max": max(totals),
+        "commands_by_type": {
+            name: round(count / len(totals), 2) for name, count in by_command.most_common()
+        },
+    }
+
+
+class BenchmarkRunner:
+    """Runs benchmarks against one driver and collects their results"""
+    
+    def __init__(self, ctx, counter, iterations=30, warmup=3):
+        """
+        Args:
+            ctx: BenchmarkContext
+            counter: CommandCounter attached to the context's driver
+            iterations: Timed iterations per benchmark
+            warmup: Untimed iterations run first
+        """
+        self.ctx = ctx
+        self.counter = counter
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results = {}
+    
+    def run(self, benchmark):
+        """Run one benchmark and store its summary"""
+        logger.info(f"Benchmarking {benchmark.name} ({self.iterations} iterations)")
+        benchmark.prepare(self.ctx)
+        durations, command_counts = [], []
+        for iteration in range(self.warmup + self.iterations):
+            benchmark.setup(self.ctx)
+            self.counter.reset()
+            start = time.perf_counter()
+            benchmark.run(self.ctx)
+            elapsed = time.perf_counter() - start
+            if iteration >= self.warmup:
+                durations.append(elapsed)
+                command_counts.append(self.counter.snapshot())
+        self.results[benchmark.name] = summarize(durations, command_counts)
+        return self.results[benchmark.name]
+    
+    def run_all(self, benchmarks):
+        for benchmark in benchmarks:
+            self.run(benchmark)
+        return self.results
+    
+    def report(self, metadata):
+        """Full JSON document: run metadata plus results"""
+        return {
+            "meta": dict(metadata, **{
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "commit": current_commit(),
+                "python": platform.python_version(),
+                "iterations": self.iterations,
+                "warmup": self.warmup,
+            }),
+            "results": self.results,
+        }
+
+
+def current_commit():
+    """Short hash of the checked out commit, or None outside a git tree"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_report(report, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    return path
+
+
+def load_report(path):
+    return json.loads(Path(path).read_text())
+
+
+def format_table(report, baseline=None):
+    """
+    Text table of a report, with p50/p95 and command changes against a baseline
+    Args:
+        report: Report from BenchmarkRunner.report()
+        baseline: Optional earlier report to compare with
+    """
+    base_results = (baseline or {}).get("results", {})
+    header = f"{'Operation':<38}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'cmds':>8}"
+    if baseline:
+        header += f"{'p50 Δ':>10}{'p95 Δ':>10}{'cmds Δ':>9}"
+    lines = [header, "-" * len(header)]
+    for name, result in report["results"].items():
+        line = (
+            f"{name:<38}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+            f"{result['p99_ms']:>10.1f}{result['commands_mean']:>8.1f}"
+        )
+        previous = base_results.get(name)
+        if previous:
+            line += (
+                f"{_change(result['p50_ms'], previous['p50_ms']):>10}"
+                f"{_change(result['p95_ms'], previous['p95_ms']):>10}"
+                f"{result['commands_mean'] - previous['commands_mean']:>+9.1f}"
+            )
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _change(current, previous):
+    if not previous:
+        return "n/a"
+    return f"{(current - previous) / previous * 100:+.0f}%"
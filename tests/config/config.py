@@ -17,6 +17,18 @@ class Config:
     # Application URLs
     BASE_URL = os.getenv('BASE_URL', 'https://localhost:7000')
     
+    # API used for test data seeding
+    API_BASE_URL = os.getenv('API_BASE_URL', BASE_URL)
+    API_LOGIN_PATH = os.getenv('API_LOGIN_PATH', '/api/auth/login')
+    API_REGISTER_PATH = os.getenv('API_REGISTER_PATH', '/api/auth/register')
+    API_MENUS_PATH = os.getenv('API_MENUS_PATH', '/api/menus')
+    API_CATEGORIES_PATH = os.getenv('API_CATEGORIES_PATH', '/api/categories')
+    API_ITEMS_PATH = os.getenv('API_ITEMS_PATH', '/api/items')
+    API_USERS_PATH = os.getenv('API_USERS_PATH', '/api/users')
+    API_VERIFY_SSL = os.getenv('API_VERIFY_SSL', 'false').lower() == 'true'
+    API_TIMEOUT = float(os.getenv('API_TIMEOUT', '10'))
+    SEED_POOL_SIZE = int(os.getenv('SEED_POOL_SIZE', '16'))
+    
     # Test User Credentials
     TEST_USER_EMAIL = os.getenv('TEST_USER_EMAIL', 'testuser@goldenfork.com')
     TEST_USER_PASSWORD = os.getenv('TEST_USER_PASSWORD', 'TestPass123!')
@@ -30,12 +42,90 @@ class Config:
     # Browser Configuration
     DEFAULT_BROWSER = os.getenv('DEFAULT_BROWSER', 'chrome').lower()
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
-    IMPLICIT_WAIT = int(os.getenv('IMPLICIT_WAIT', '10'))
     EXPLICIT_WAIT = int(os.getenv('EXPLICIT_WAIT', '20'))
     
-    # Screenshot Configuration
+    # Wait Policy (implicit waits are always 0, see pages/wait_policy.py)
+    STATE_WAIT = float(os.getenv('STATE_WAIT', '1'))
+    ALERT_WAIT = float(os.getenv('ALERT_WAIT', '5'))
+    POLL_INTERVAL = float(os.getenv('POLL_INTERVAL', '0.1'))
+    
+    # Blazor Readiness (replaces fixed sleeps after interactions)
+    READY_QUIET_MS = int(os.getenv('READY_QUIET_MS', '50'))
+    READY_RESPONSE_MS = int(os.getenv('READY_RESPONSE_MS', '1000'))
+    READY_BUSY_SELECTOR = os.getenv('READY_BUSY_SELECTOR', '.loading-spinner')
+    
+    # Element Cache (reuse located elements until the next navigation or click)
+    ELEMENT_CACHE = os.getenv('ELEMENT_CACHE', 'false').lower() == 'true'
+    STALE_RETRIES = int(os.getenv('STALE_RETRIES', '2'))
+    
+    # Browser Launch (standard or fast-start, see utils/launch_profile.py)
+    LAUNCH_PROFILE = os.getenv('LAUNCH_PROFILE', 'standard').lower()
+    FAST_START_PROFILE_ROOT = os.getenv('FAST_START_PROFILE_ROOT', '')
+    CHROME_HEADLESS_SHELL = os.getenv('CHROME_HEADLESS_SHELL', '')
+    
+    # Driver Lifecycle
+    DRIVER_MODE = os.getenv('DRIVER_MODE', 'function').lower()
+    DRIVER_RECYCLE_AFTER = int(os.getenv('DRIVER_RECYCLE_AFTER', '50'))
+    
+    # Session Cache
+    SESSION_CACHE = os.getenv('SESSION_CACHE', 'true').lower() == 'true'
+    # The query keeps the URL clear of "*.ico" block patterns
+    SESSION_BOOTSTRAP_PATH = os.getenv('SESSION_BOOTSTRAP_PATH', '/favicon.ico?session')
+    
+    # Failure Artifacts (screenshot, HTML, URL and console, one folder per run)
     SCREENSHOT_ON_FAILURE = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
     SCREENSHOT_DIR = os.getenv('SCREENSHOT_DIR', 'screenshots')
+    ARTIFACT_WRITERS = int(os.getenv('ARTIFACT_WRITERS', '2'))
+    
+    # Step Timing (per page-object method, see pages/step_timer.py)
+    STEP_TIMING = os.getenv('STEP_TIMING', 'false').lower() == 'true'
+    STEP_REPORT_DIR = os.getenv('STEP_REPORT_DIR', 'reports/steps')
+    SLOWEST_STEPS = int(os.getenv('SLOWEST_STEPS', '0'))
+    
+    # Locator Profiling (number of locators to report, 0 = off)
+    LOCATOR_PROFILE = int(os.getenv('LOCATOR_PROFILE', '0'))
+    LOCATOR_PROFILE_FILE = os.getenv('LOCATOR_PROFILE_FILE', 'reports/locator_profile.json')
+    
+    # Step Budgets (per-test baseline of commands, sleeps and waits)
+    STEP_BUDGET = os.getenv('STEP_BUDGET', 'off').lower()
+    STEP_BUDGET_MARGIN = float(os.getenv('STEP_BUDGET_MARGIN', '0.2'))
+    STEP_BUDGET_TIME_SLACK = float(os.getenv('STEP_BUDGET_TIME_SLACK', '0.5'))
+    STEP_BASELINE_FILE = os.getenv('STEP_BASELINE_FILE', 'step_baseline.json')
+    
+    # Change-Impact Selection (test -> page-object methods and locators it used)
+    IMPACT_MAP_FILE = os.getenv('IMPACT_MAP_FILE', 'impact_map.json')
+    
+    # Run History and Flaky Tests (off, retry or quarantine above the threshold)
+    RUN_HISTORY = os.getenv('RUN_HISTORY', 'true').lower() == 'true'
+    RUN_HISTORY_FILE = os.getenv('RUN_HISTORY_FILE', 'reports/run_history.db')
+    FLAKE_POLICY = os.getenv('FLAKE_POLICY', 'off').lower()
+    FLAKE_THRESHOLD = float(os.getenv('FLAKE_THRESHOLD', '0.2'))
+    FLAKE_MIN_RUNS = int(os.getenv('FLAKE_MIN_RUNS', '5'))
+    FLAKE_WINDOW = int(os.getenv('FLAKE_WINDOW', '50'))
+    FLAKE_RERUNS = int(os.getenv('FLAKE_RERUNS', '2'))
+    
+    # Resource Policy (Chrome and Edge: full-fidelity or functional-minimal)
+    RESOURCE_PROFILE = os.getenv('RESOURCE_PROFILE', 'full-fidelity').lower()
+    RESOURCE_BLOCK_PATTERNS = os.getenv('RESOURCE_BLOCK_PATTERNS', '')
+    RESOURCE_SIZES_FILE = os.getenv('RESOURCE_SIZES_FILE', 'reports/resource_sizes.json')
+    RESOURCE_STATS = os.getenv('RESOURCE_STATS', 'false').lower() == 'true'
+    
+    # Shared Asset Cache (Chrome and Edge; empty dir = one temporary cache per run)
+    ASSET_CACHE = os.getenv('ASSET_CACHE', 'false').lower() == 'true'
+    ASSET_CACHE_DIR = os.getenv('ASSET_CACHE_DIR', '')
+    
+    # Parallel Scheduling (default = pytest-xdist --dist, longest-first = by recorded durations)
+    SCHEDULE = os.getenv('SCHEDULE', 'default').lower()
+    
+    # Stand-in App (local replacement for the real deployment)
+    STANDIN_PORT = int(os.getenv('STANDIN_PORT', '0'))
+    STANDIN_LATENCY_MS = int(os.getenv('STANDIN_LATENCY_MS', '0'))
+    STANDIN_SESSION_TTL = int(os.getenv('STANDIN_SESSION_TTL', '3600'))
+    
+    # Test Data (pool = precomputed seeded values, live = Faker per call)
+    TEST_DATA_MODE = os.getenv('TEST_DATA_MODE', 'pool').lower()
+    TEST_DATA_SEED = os.getenv('TEST_DATA_SEED', '')
+    TEST_DATA_POOL_SIZE = int(os.getenv('TEST_DATA_POOL_SIZE', '16'))
     
     # Test Configuration
     CREATE_TEST_USERS = os.getenv('CREATE_TEST_USERS', 'true').lower() == 'true'
@@ -54,3 +144,34 @@ class Config:
         reports_dir = Path(__file__).parent.parent / 'reports'
         reports_dir.mkdir(exist_ok=True)
         return reports_dir
+    
+    @classmethod
+    def get_step_report_path(cls):
+        """Get absolute path for per-test step timing records"""
+        step_dir = Path(__file__).parent.parent / cls.STEP_REPORT_DIR
+        step_dir.mkdir(parents=True, exist_ok=True)
+        return step_dir
+    
+    @classmethod
+    def get_resource_sizes_path(cls):
+        """Get absolute path of the known resource sizes file"""
+        sizes_path = Path(__file__).parent.parent / cls.RESOURCE_SIZES_FILE
+        sizes_path.parent.mkdir(parents=True, exist_ok=True)
+        return sizes_path
+    
+    @classmethod
+    def get_locator_profile_path(cls):
+        """Get absolute path of the locator profile report"""
+        return Path(__file__).parent.parent / cls.LOCATOR_PROFILE_FILE
+    
+    @classmethod
+    def get_run_history_path(cls):
+        """Get absolute path of the run history database"""
+        history_path = Path(__file__).parent.parent / cls.RUN_HISTORY_FILE
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        return history_path
+    
+    @classmethod
+    def get_step_baseline_path(cls):
+        """Get absolute path of the step budget baseline file"""
+        return Path(__file__).parent.parent / cls.STEP_BASELINE_FILE
@@ -5,12 +5,53 @@ Provides WebDriver setup, configuration, and test utilities
 import pytest
 import os
 from datetime import datetime
+import logging
+import json
+import time
 from pathlib import Path
-from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
 from config.config import Config
+from pages.wait_policy import WaitPolicy
+from pages.step_timer import StepTimer
+from pages.locator_profiler import LocatorProfiler
+from utils.driver_factory import create_driver
+from utils.launch_profile import LAUNCH_PROFILES
+from utils.driver_pool import DriverPool
+from utils.session_cache import SessionCache
+from utils.namespace import DataNamespace
+from utils.identity import IdentityGenerator
+from utils.cleanup import CleanupRegistry
+from utils.seeding import SeedClient
+from utils.command_counter import CommandCounter
+from utils.step_budget import StepBudget
+from utils.impact import CoverageMap, analyze_changes
+from utils.artifacts import ArtifactCollector, write_index
+from utils.run_history import RunHistory, FLAKE_POLICIES, QUARANTINE_REASON, add_report, code_version
+from utils.scheduling import LongestFirstScheduling, SCHEDULES
+from utils.resource_policy import RESOURCE_PROFILES, ResourceCounter, ResourceSizes, resource_accounting_enabled
+from utils.asset_cache import configure_asset_cache, quit_driver, remove_shared_cache
+from utils.locator_report import merge_profiles, format_table, save_profile
+from standin.server import StandInServer
+from data.test_data import configure_test_data, start_test_data
+
+logger = logging.getLogger(__name__)
+
+# Step timing records of finished tests, for the terminal summary
+STEP_RECORDS = []
+
+# Failure artifact index entries of failed tests, from all workers
+FAILURE_ARTIFACTS = []
+
+# Outcome, duration and attempts of each test in this run, for the run history
+TEST_RESULTS = {}
+
+# Requests loaded and blocked per test on Chrome and Edge
+RESOURCE_STATS = []
+
+# Locator statistics per test, when profiling locators
+LOCATOR_PROFILES = []
 
 
 def pytest_addoption(parser):
@@ -27,74 +68,463 @@ def pytest_addoption(parser):
         default=Config.HEADLESS,
         help="Run browser in headless mode"
     )
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default=Config.LAUNCH_PROFILE,
+        choices=LAUNCH_PROFILES,
+        help="standard: stock browser, fast-start: lean flags and a tmpfs profile"
+    )
+    parser.addoption(
+        "--resource-profile",
+        action="store",
+        default=Config.RESOURCE_PROFILE,
+        choices=list(RESOURCE_PROFILES),
+        help="Chrome/Edge: functional-minimal blocks images, fonts, media and analytics"
+    )
+    parser.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=Config.ASSET_CACHE,
+        help="Chrome/Edge: start every browser from a shared cache of the app bundle"
+    )
+    parser.addoption(
+        "--element-cache",
+        action="store_true",
+        default=Config.ELEMENT_CACHE,
+        help="Reuse located elements until the next navigation or click"
+    )
+    parser.addoption(
+        "--driver-mode",
+        action="store",
+        default=Config.DRIVER_MODE,
+        choices=["function", "pooled"],
+        help="function: new browser per test, pooled: one reset browser per worker"
+    )
+    parser.addoption(
+        "--recycle-after",
+        action="store",
+        type=int,
+        default=Config.DRIVER_RECYCLE_AFTER,
+        help="Replace the pooled browser after this many tests"
+    )
+    parser.addoption(
+        "--standin",
+        action="store_true",
+        default=False,
+        help="Run against the local stand-in app instead of BASE_URL"
+    )
+    parser.addoption(
+        "--standin-latency",
+        action="store",
+        type=int,
+        default=Config.STANDIN_LATENCY_MS,
+        help="Response latency of the stand-in app in milliseconds"
+    )
+    parser.addoption(
+        "--data-seed",
+        action="store",
+        type=int,
+        default=int(Config.TEST_DATA_SEED) if Config.TEST_DATA_SEED else None,
+        help="Seed for generated test data, reuse a logged seed to reproduce a run"
+    )
+    parser.addoption(
+        "--slowest-steps",
+        action="store",
+        type=int,
+        default=Config.SLOWEST_STEPS,
+        help="Show the N slowest page-object steps (0 to disable)"
+    )
+    parser.addoption(
+        "--profile-locators",
+        action="store",
+        type=int,
+        default=Config.LOCATOR_PROFILE,
+        help="Time every locator resolution and show the N most expensive (0 to disable)"
+    )
+    parser.addoption(
+        "--step-budget",
+        action="store",
+        default=Config.STEP_BUDGET,
+        choices=["off", "warn", "fail"],
+        help="What to do when a test exceeds its step baseline"
+    )
+    parser.addoption(
+        "--update-step-baseline",
+        action="store_true",
+        default=False,
+        help="Record this run's passed tests as the new step baseline"
+    )
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="Record the page-object methods and locators each test uses"
+    )
+    parser.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="REF",
+        help="Only run tests affected by changes since this git ref"
+    )
+    parser.addoption(
+        "--flake-policy",
+        action="store",
+        default=Config.FLAKE_POLICY,
+        choices=FLAKE_POLICIES,
+        help="retry: rerun flaky tests on failure, quarantine: run them as non-blocking xfail"
+    )
+    parser.addoption(
+        "--schedule",
+        action="store",
+        default=Config.SCHEDULE,
+        choices=SCHEDULES,
+        help="longest-first: hand out tests to xdist workers by recorded duration"
+    )
+
+
+def pytest_configure(config):
+    """Seed the test data pool and name the run, xdist workers use the controller's"""
+    workerinput = getattr(config, "workerinput", None)
+    seed = workerinput["data_seed"] if workerinput else config.getoption("--data-seed")
+    config.data_seed = configure_test_data(seed)
+    config.artifact_run = (
+        workerinput["artifact_run"] if workerinput else datetime.now().strftime("%Y%m%d_%H%M%S")
+    )
+    config.started_at = time.time()
+    Config.ELEMENT_CACHE = config.getoption("--element-cache")
+    # Step timing is opt-in, these options read the step records
+    readers = [
+        option for option, wanted in (
+            ("--slowest-steps", config.getoption("--slowest-steps") > 0),
+            ("--step-budget", config.getoption("--step-budget") != "off"),
+            ("--update-step-baseline", config.getoption("--update-step-baseline")),
+            ("--record-impact", config.getoption("--record-impact")),
+        ) if wanted
+    ]
+    if readers and not Config.STEP_TIMING:
+        logger.info(f"Step timing on for {', '.join(readers)}")
+        Config.STEP_TIMING = True
+    if config.getoption("--asset-cache"):
+        Config.ASSET_CACHE = True
+        config.asset_cache_temporary = configure_asset_cache(config.artifact_run)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the data seed and run name to a starting xdist worker"""
+    node.workerinput["data_seed"] = node.config.data_seed
+    node.workerinput["artifact_run"] = node.config.artifact_run
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Use longest-first scheduling with --schedule longest-first"""
+    if config.getoption("--schedule") != "longest-first":
+        return None
+    durations = {}
+    if Config.get_run_history_path().exists():
+        history = RunHistory()
+        durations = history.durations()
+        history.close()
+    if not durations:
+        logger.warning("No recorded test durations yet, longest-first schedule treats all tests alike")
+    config.parallel_schedule = LongestFirstScheduling(config, log, durations)
+    return config.parallel_schedule
+
+
+def pytest_report_header(config):
+    return f"test data seed: {config.data_seed} (reproduce with --data-seed {config.data_seed})"
+
+
+def pytest_collection_modifyitems(config, items):
+    """Select tests by change impact, then retry or quarantine flaky ones"""
+    select_changed(config, items)
+    apply_flake_policy(config, items)
+
+
+def select_changed(config, items):
+    """Deselect tests not affected by changes since --changed-since"""
+    ref = config.getoption("--changed-since")
+    if not ref:
+        return
+    coverage = CoverageMap()
+    changes = analyze_changes(ref, coverage)
+    selected = [item for item in items if coverage.is_affected(item.nodeid, changes)]
+    deselected = [item for item in items if not coverage.is_affected(item.nodeid, changes)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    logger.info(f"Changes since {ref}: {', '.join(changes['summary']) or 'none'}")
+    config.impact_summary = f"impact selection since {ref}: {len(selected)} of {len(selected) + len(deselected)} tests"
+
+
+def apply_flake_policy(config, items):
+    """Mark tests whose flake score reaches FLAKE_THRESHOLD for retry or quarantine"""
+    policy = config.getoption("--flake-policy")
+    config.flaky_tests = {}
+    if policy == "off" or not Config.get_run_history_path().exists():
+        return
+    if policy == "retry" and not config.pluginmanager.hasplugin("rerunfailures"):
+        logger.warning("Flake policy 'retry' needs pytest-rerunfailures, flaky tests are not retried")
+        return
+    history = RunHistory()
+    flaky = history.flaky_tests()
+    history.close()
+    for item in items:
+        if item.nodeid not in flaky:
+            continue
+        if policy == "retry":
+            item.add_marker(pytest.mark.flaky(reruns=Config.FLAKE_RERUNS))
+        else:
+            item.add_marker(pytest.mark.xfail(
+                reason=f"{QUARANTINE_REASON}: flake score {flaky[item.nodeid]:.2f}", strict=False
+            ))
+        config.flaky_tests[item.nodeid] = flaky[item.nodeid]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def standin_app(request):
+    """
+    Stand-in app fixture - serves the app locally when --standin is given
+    Scope: session - one in-memory app per worker
+    """
+    if not request.config.getoption("--standin"):
+        yield None
+        return
+    
+    server = StandInServer(latency_ms=request.config.getoption("--standin-latency")).start()
+    original_urls = (Config.BASE_URL, Config.API_BASE_URL)
+    Config.BASE_URL = Config.API_BASE_URL = server.url
+    yield server
+    Config.BASE_URL, Config.API_BASE_URL = original_urls
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Driver pool fixture - one warm browser per worker
+    Scope: session - shared across all tests of a worker
+    """
+    browser_name = request.config.getoption("--browser").lower()
+    headless = request.config.getoption("--headless")
+    recycle_after = request.config.getoption("--recycle-after")
+    profile = request.config.getoption("--launch-profile")
+    resources = request.config.getoption("--resource-profile")
+    
+    pool = DriverPool(lambda: create_driver(browser_name, headless, profile, resources), recycle_after)
+    yield pool
+    pool.close()
 
 
 @pytest.fixture(scope="function")
 def browser(request):
     """
     WebDriver fixture - creates and manages browser instance
-    Scope: function - new browser for each test
+    Scope: function - new browser for each test, or a reset pooled
+    browser when running with --driver-mode=pooled
     """
     browser_name = request.config.getoption("--browser").lower()
     headless = request.config.getoption("--headless")
+    pooled = request.config.getoption("--driver-mode") == "pooled"
+    profile = request.config.getoption("--launch-profile")
+    resource_profile = request.config.getoption("--resource-profile")
+    pool = request.getfixturevalue("driver_pool") if pooled else None
     
+    budget_mode = request.config.getoption("--step-budget")
+    budget = request.getfixturevalue("step_budget") if budget_mode != "off" else None
+    profile_locators = request.config.getoption("--profile-locators") > 0
+    collector = request.getfixturevalue("artifact_collector") if Config.SCREENSHOT_ON_FAILURE else None
     driver = None
+    record = None
+    resources = None
     
     try:
-        # Chrome browser
-        if browser_name == "chrome":
-            options = webdriver.ChromeOptions()
-            if headless:
-                options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-            # Accept insecure certificates for localhost
-            options.add_argument("--ignore-certificate-errors")
-            options.add_experimental_option('excludeSwitches', ['enable-logging'])
-            
-            # Selenium 4.6+ automatically manages drivers
-            driver = webdriver.Chrome(options=options)
-        
-        # Firefox browser
-        elif browser_name == "firefox":
-            options = webdriver.FirefoxOptions()
-            if headless:
-                options.add_argument("--headless")
-            options.accept_insecure_certs = True
-            
-            # Selenium 4.6+ automatically manages drivers
-            driver = webdriver.Firefox(options=options)
-        
-        # Edge browser
-        elif browser_name == "edge":
-            options = webdriver.EdgeOptions()
-            if headless:
-                options.add_argument("--headless")
-            options.add_argument("--ignore-certificate-errors")
-            
-            # Selenium 4.6+ automatically manages drivers
-            driver = webdriver.Edge(options=options)
-        
+        start = time.perf_counter()
+        if pooled:
+            driver = pool.acquire()
         else:
-            raise ValueError(f"Unsupported browser: {browser_name}")
-        
-        # Configure implicit wait
-        driver.implicitly_wait(Config.IMPLICIT_WAIT)
-        driver.maximize_window()
+            driver = create_driver(browser_name, headless, profile, resource_profile)
+        startup_time = time.perf_counter() - start
+        WaitPolicy.for_driver(driver).reset()
+        if browser_name != "firefox" and resource_accounting_enabled(resource_profile):
+            resources = ResourceCounter.for_driver(driver, request.getfixturevalue("resource_sizes"))
+            resources.reset()
+        if Config.STEP_TIMING:
+            CommandCounter.for_driver(driver).reset()
+            StepTimer.for_driver(driver).reset()
+        if profile_locators:
+            LocatorProfiler.for_driver(driver).reset()
         
         # Make driver available to test
         yield driver
         
     finally:
-        # Teardown: Take screenshot on failure
-        if driver and request.node.rep_call.failed and Config.SCREENSHOT_ON_FAILURE:
-            take_screenshot(driver, request.node.nodeid)
-        
-        # Close browser
+        # Report time spent waiting during the test
         if driver:
-            driver.quit()
+            logger.info(f"Wait timing: {WaitPolicy.for_driver(driver).summary()}")
+            if Config.STEP_TIMING:
+                first_get = CommandCounter.for_driver(driver).first_sent.get("get")
+                first_get_time = first_get - start if first_get else None
+                record = save_step_record(
+                    request.node, StepTimer.for_driver(driver), startup_time, first_get_time, budget
+                )
+        if resources:
+            save_resource_stats(request.node, resources.collect())
+        if driver and profile_locators:
+            request.node.user_properties.append(("locator_profile", LocatorProfiler.for_driver(driver).report()))
+        
+        # Teardown: Capture failure artifacts, written in the background
+        rep_call = getattr(request.node, "rep_call", None)
+        if driver and rep_call and rep_call.failed and collector:
+            capture_failure(collector, driver, request.node)
+        
+        # Close browser, or reset it for the next test
+        if driver and pooled:
+            pool.release(driver)
+        elif driver:
+            quit_driver(driver)
+    
+    # Fail a passing test that sent more commands or waited longer than its baseline
+    if record and record["budget_overruns"] and record["passed"] and budget_mode == "fail":
+        pytest.fail("Step budget exceeded: " + "; ".join(record["budget_overruns"]))
+
+
+@pytest.fixture(scope="session")
+def artifact_collector(request):
+    """
+    Failure artifact collector - writes artifacts on background threads
+    Scope: session - waits for pending writes when the worker finishes
+    """
+    collector = ArtifactCollector(
+        Config.get_screenshot_path() / request.config.artifact_run, Config.ARTIFACT_WRITERS
+    )
+    yield collector
+    collector.close()
+
+
+@pytest.fixture(scope="session")
+def resource_sizes():
+    """
+    Known resource sizes - estimates the bytes of blocked requests
+    Scope: session - sizes seen by this worker are saved at the end
+    """
+    sizes = ResourceSizes()
+    yield sizes
+    sizes.save()
+
+
+@pytest.fixture(scope="session")
+def step_budget():
+    """
+    Step budget fixture - per-test baseline of commands, sleeps and waits
+    Scope: session - baseline file is read once per worker
+    """
+    return StepBudget()
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """
+    Session cache fixture - one UI login per role
+    Scope: session - shared across all tests of a worker
+    """
+    cache = SessionCache(enabled=Config.SESSION_CACHE)
+    yield cache
+    cache.invalidate()
+
+
+@pytest.fixture
+def login_as(browser, session_cache):
+    """
+    Authenticate the test browser as a role ("test_user" or "admin")
+    Usage: login_as("admin")
+    """
+    def _login_as(role):
+        session_cache.login(browser, role)
+        return browser
+    return _login_as
+
+
+@pytest.fixture(scope="session")
+def data_namespace():
+    """
+    Data namespace fixture - prefix for data created by this worker
+    Scope: session - one namespace per worker
+    """
+    return DataNamespace()
+
+
+@pytest.fixture(scope="session")
+def identity_generator(data_namespace):
+    """
+    Identity generator fixture - unique usernames, emails and phones
+    Scope: session - one sequence per worker
+    """
+    return IdentityGenerator(data_namespace)
+
+
+@pytest.fixture
+def unique_user(identity_generator, cleanup_registry):
+    """
+    New user data never registered before
+    Usage: unique_user(password="TestPass123!")
+    The user is deleted at cleanup if the test registers it.
+    """
+    def _unique_user(password="TestPass123!"):
+        user = identity_generator.next(password)
+        cleanup_registry.track_user(email=user["email"])
+        return user
+    return _unique_user
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(request, data_namespace):
+    """
+    Cleanup registry fixture - deletes created test data when the worker finishes
+    Scope: session - enabled by CLEANUP_TEST_DATA
+    """
+    registry = CleanupRegistry(data_namespace, enabled=Config.CLEANUP_TEST_DATA)
+    client = request.getfixturevalue("seed_client") if registry.enabled else None
+    yield registry
+    if client:
+        registry.run(client)
+
+
+@pytest.fixture(scope="session")
+def seed_client():
+    """
+    Seeding client fixture - creates test data through the app's API
+    Scope: session - one pooled, admin-authenticated client per worker
+    """
+    client = SeedClient().login_as_admin()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def worker_user_credentials(data_namespace, test_user_credentials, request):
+    """
+    Credentials of a user owned by this worker
+    Registered through the API on first use in parallel runs,
+    the shared test user otherwise
+    """
+    if not (data_namespace.is_parallel and Config.CREATE_TEST_USERS):
+        return test_user_credentials
+    credentials = data_namespace.user_credentials()
+    if not data_namespace.user_registered:
+        request.getfixturevalue("seed_client").create_user(**credentials)
+        request.getfixturevalue("cleanup_registry").track_user(email=credentials["email"])
+        data_namespace.user_registered = True
+    return credentials
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Seed the test's data before its fixtures draw any"""
+    start_test_data(item.nodeid)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -107,21 +537,169 @@ def pytest_runtest_makereport(item, call):
     setattr(item, f"rep_{rep.when}", rep)
 
 
-def take_screenshot(driver, test_name):
+def pytest_runtest_logreport(report):
+    """Collect outcomes, step timing records and failure artifacts, including those sent by xdist workers"""
+    if "unit" in report.keywords:
+        # Only browser tests go into the run history
+        return
+    result = TEST_RESULTS.setdefault(
+        report.nodeid, {"outcome": "passed", "duration": 0.0, "failed_time": 0.0, "attempts": 1}
+    )
+    add_report(result, report)
+    if report.when == "teardown":
+        for name, value in report.user_properties:
+            if name == "step_timing":
+                STEP_RECORDS.append(value)
+            elif name == "failure_artifacts":
+                FAILURE_ARTIFACTS.append(value)
+            elif name == "resources":
+                RESOURCE_STATS.append(value)
+            elif name == "locator_profile":
+                LOCATOR_PROFILES.append(value)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Summarize the run: selection, flaky tests, resources, locators, schedule, failures, budgets and steps"""
+    if getattr(config, "impact_summary", None):
+        terminalreporter.write_sep("=", config.impact_summary)
+    if getattr(config, "flaky_tests", None):
+        policy = config.getoption("--flake-policy")
+        terminalreporter.write_sep("=", f"{len(config.flaky_tests)} flaky tests ({policy})")
+        for test, score in sorted(config.flaky_tests.items(), key=lambda pair: pair[1], reverse=True):
+            terminalreporter.write_line(f"{score:.2f}  {test}")
+        terminalreporter.write_line("Full report: python -m utils.run_history")
+    if RESOURCE_STATS:
+        totals = {key: sum(stats[key] for stats in RESOURCE_STATS) for key in RESOURCE_STATS[0]}
+        terminalreporter.write_line(
+            f"Resources ({config.getoption('--resource-profile')}) over {len(RESOURCE_STATS)} tests: "
+            f"loaded {totals['loaded_requests']} requests, {totals['loaded_bytes'] / 1024:.0f} KB; "
+            f"blocked {totals['blocked_requests']} requests, ~{totals['blocked_bytes'] / 1024:.0f} KB "
+            f"({totals['blocked_unknown_size']} of unknown size)"
+        )
+        if config.getoption("--asset-cache"):
+            terminalreporter.write_line(
+                f"Asset cache: {totals['asset_hits']} hits, {totals['asset_misses']} misses, "
+                f"~{totals['asset_bytes_saved'] / 1024:.0f} KB saved, "
+                f"{totals['asset_bytes_loaded'] / 1024:.0f} KB downloaded"
+            )
+    if getattr(config, "locator_profile", None):
+        limit = config.getoption("--profile-locators")
+        terminalreporter.write_sep("=", f"{limit} most expensive locators")
+        terminalreporter.write_line(format_table(config.locator_profile, limit))
+        terminalreporter.write_line(f"Full profile: {Config.get_locator_profile_path()}")
+    schedule = getattr(config, "parallel_schedule", None)
+    if schedule and schedule.expected_loads:
+        test_time = sum(result["duration"] for result in TEST_RESULTS.values())
+        workers = len(schedule.expected_loads)
+        terminalreporter.write_line(
+            f"Longest-first schedule: wall {time.time() - config.started_at:.1f}s, "
+            f"test time {test_time:.1f}s over {workers} workers (ideal {test_time / workers:.1f}s)"
+        )
+    if getattr(config, "artifact_index", None):
+        terminalreporter.write_line(
+            f"Failure artifacts of {len(FAILURE_ARTIFACTS)} tests: {config.artifact_index}"
+        )
+    over_budget = [record for record in STEP_RECORDS if record["budget_overruns"]]
+    if over_budget:
+        terminalreporter.write_sep("=", f"{len(over_budget)} tests over their step budget")
+        for record in over_budget:
+            terminalreporter.write_line(f"{record['test']}: {'; '.join(record['budget_overruns'])}")
+    
+    limit = config.getoption("--slowest-steps")
+    if not STEP_RECORDS or limit <= 0:
+        return
+    steps = [
+        (step, record["test"]) for record in STEP_RECORDS for step in record["steps"]
+    ]
+    steps.sort(key=lambda pair: pair[0]["elapsed"], reverse=True)
+    terminalreporter.write_sep("=", f"slowest {limit} page-object steps")
+    for step, test in steps[:limit]:
+        terminalreporter.write_line(
+            f"{step['elapsed']:8.2f}s  {step['name']:<40} {step['commands']:>4} cmds  "
+            f"sleep {step['sleep']:.2f}s  wait {step['wait']:.2f}s  {test}"
+        )
+    totals = {
+        key: sum(record[key] for record in STEP_RECORDS)
+        for key in ("startup_time", "steps_time", "sleep_time", "wait_time", "commands")
+    }
+    terminalreporter.write_line(
+        f"Total over {len(STEP_RECORDS)} tests: browser startup {totals['startup_time']:.1f}s, "
+        f"page-object steps {totals['steps_time']:.1f}s "
+        f"(sleeps {totals['sleep_time']:.1f}s, waits {totals['wait_time']:.1f}s), "
+        f"{totals['commands']} WebDriver commands"
+    )
+    first_gets = [record["first_get_time"] for record in STEP_RECORDS if record.get("first_get_time")]
+    if first_gets:
+        terminalreporter.write_line(
+            f"Fixture start to first driver.get ({config.getoption('--launch-profile')} launch): "
+            f"mean {sum(first_gets) / len(first_gets):.2f}s, max {max(first_gets):.2f}s"
+        )
+
+
+def pytest_sessionfinish(session):
+    """Write the failure artifact index and run history, and the step baseline and impact map when asked to"""
+    config = session.config
+    # Only the controller sees the records of all xdist workers
+    if hasattr(config, "workerinput"):
+        return
+    if getattr(config, "asset_cache_temporary", False):
+        remove_shared_cache()
+    if LOCATOR_PROFILES:
+        config.locator_profile = merge_profiles(LOCATOR_PROFILES)
+        save_profile(config.locator_profile, Config.get_locator_profile_path())
+    if Config.RUN_HISTORY and TEST_RESULTS and not config.option.collectonly:
+        history = RunHistory()
+        history.record_run(TEST_RESULTS, config.started_at, code_version())
+        history.close()
+    config.artifact_index = write_index(Config.get_screenshot_path() / config.artifact_run, FAILURE_ARTIFACTS)
+    if config.getoption("--update-step-baseline"):
+        StepBudget().update(STEP_RECORDS)
+    if config.getoption("--record-impact"):
+        CoverageMap().update(STEP_RECORDS)
+
+
+def save_step_record(item, timer, startup_time, first_get_time=None, budget=None):
+    """
+    Write the step timing record of a test as JSON and attach it to the test report
+    """
+    rep_call = getattr(item, "rep_call", None)
+    record = timer.report(
+        test=item.nodeid,
+        passed=bool(rep_call and rep_call.passed),
+        startup_time=round(startup_time, 3),
+        first_get_time=round(first_get_time, 3) if first_get_time is not None else None
+    )
+    record["budget_overruns"] = budget.check(record) if budget else []
+    for overrun in record["budget_overruns"]:
+        logger.warning(f"Step budget: {overrun}")
+    clean_name = item.nodeid.replace("::", "_").replace("/", "_").replace("\\", "_")
+    path = Config.get_step_report_path() / f"{clean_name}.json"
+    path.write_text(json.dumps(record, indent=2))
+    item.user_properties.append(("step_timing", record))
+    return record
+
+
+def save_resource_stats(item, stats):
+    """Log a test's loaded and blocked requests and attach them to the test report"""
+    logger.info(
+        f"Resources: loaded {stats['loaded_requests']} requests ({stats['loaded_bytes']} bytes), "
+        f"blocked {stats['blocked_requests']} (~{stats['blocked_bytes']} bytes), "
+        f"assets {stats['asset_hits']} from cache, {stats['asset_misses']} downloaded"
+    )
+    item.user_properties.append(("resources", stats))
+
+
+def capture_failure(collector, driver, item):
     """
-    Take screenshot and save with test name
+    Capture screenshot, HTML, URL and console of a failed test
+    Only the browser reads block teardown, the files are written in the background.
     """
     try:
-        screenshot_dir = Config.get_screenshot_path()
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        # Clean test name for filename
-        clean_name = test_name.replace("::", "_").replace("/", "_").replace("\\", "_")
-        screenshot_path = screenshot_dir / f"{clean_name}_{timestamp}.png"
-        
-        driver.save_screenshot(str(screenshot_path))
-        print(f"\n📸 Screenshot saved: {screenshot_path}")
+        entry = collector.capture(driver, item.nodeid)
+        item.user_properties.append(("failure_artifacts", entry))
+        print(f"\n📸 Failure artifacts queued: {collector.run_dir / entry['folder']}")
     except Exception as e:
-        print(f"\n❌ Failed to take screenshot: {e}")
+        print(f"\n❌ Failed to capture failure artifacts: {e}")
 
 
 @pytest.fixture(scope="session")
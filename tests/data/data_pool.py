@@ -0,0 +1,126 @@
+"""
+Seeded test data pool
+Generates random test values in blocks from a seed so every draw is a
+list lookup and a failing test can be reproduced with the same seed
+"""
+import hashlib
+import logging
+import random
+import string
+
+logger = logging.getLogger(__name__)
+
+
+MENU_TYPES = ["Breakfast", "Lunch", "Dinner", "Desserts", "Beverages", "Special", "Weekend", "Seasonal"]
+
+
+def _generators(fake, rng):
+    """Field name -> function returning one new value"""
+    return {
+        "usernames": fake.user_name,
+        "emails": fake.email,
+        # Format accepted by the app: +216 98 XXX XXX
+        "phones": lambda: f"+216 98 {rng.randint(0, 999):03d} {rng.randint(0, 999):03d}",
+        "strong_passwords": lambda: fake.password(
+            length=12, special_chars=True, digits=True, upper_case=True, lower_case=True
+        ),
+        "weak_passwords": lambda: "".join(rng.choices(string.ascii_lowercase, k=4)),
+        "menu_names": lambda: f"{rng.choice(MENU_TYPES)} Menu {rng.randint(1, 100)}",
+        "menu_descriptions": lambda: fake.text(max_nb_chars=100),
+        "texts": lambda: fake.text(max_nb_chars=200),
+        "numbers": lambda: rng.randint(0, 10 ** 9),
+    }
+
+
+class DataPoolExhausted(Exception):
+    """Raised when a field cannot produce a value it has not given out yet"""
+
+
+class DataPool:
+    """
+    Seeded source of usernames, emails, phones, passwords, menu names and texts
+    Every test draws from its own stream, seeded from the run seed and the
+    test id, so a test gets the same values whichever worker runs it and
+    whatever ran before it. Faker is imported only when the first value is
+    drawn. With precompute a field is generated into a list in blocks of
+    `size` values, on its first draw in a test, and drawn in order; a field
+    that runs out gets another block instead of repeating values. Values
+    never repeat within a field, and a field whose generator stops finding
+    new values raises DataPoolExhausted. Without precompute each draw runs
+    Faker.
+    """
+    
+    def __init__(self, seed, size=16, precompute=True):
+        """
+        Args:
+            seed: Run seed, the same seed gives the same values for the same test
+            size: Number of values generated per field and block
+            precompute: Generate values in blocks up front instead of per draw
+        """
+        self.seed = seed
+        self.size = size
+        self.precompute = precompute
+        self.fake = None
+        self.rng = random.Random()
+        self.generators = None
+        self.start_test("session")
+    
+    def start_test(self, test_id):
+        """
+        Start the stream of one test, values drawn before are dropped
+        Args:
+            test_id: pytest node id of the test
+        Returns:
+            The test's data seed, derived from the run seed and test_id
+        """
+        digest = hashlib.sha256(f"{self.seed}:{test_id}".encode()).digest()
+        self.test_seed = int.from_bytes(digest[:8], "big")
+        self.values = {}
+        self.positions = {}
+        if self.generators is not None and not self.precompute:
+            self._reseed(self.test_seed)
+        return self.test_seed
+    
+    def _reseed(self, seed):
+        """Seed Faker and random"""
+        self.fake.seed_instance(seed)
+        self.rng.seed(seed)
+    
+    def _start(self):
+        """Import and seed Faker"""
+        from faker import Faker
+        self.fake = Faker()
+        self.generators = _generators(self.fake, self.rng)
+        self._reseed(self.test_seed)
+    
+    def _grow(self, field):
+        """Add a block of values to a field, seeded by its position so it does not depend on other fields"""
+        values = self.values.setdefault(field, [])
+        self._reseed(f"{self.test_seed}:{field}:{len(values) // self.size}")
+        generate = self.generators[field]
+        seen = set(values)
+        target = len(values) + self.size
+        for _ in range(self.size * 50):
+            value = generate()
+            if value not in seen:
+                seen.add(value)
+                values.append(value)
+                if len(values) == target:
+                    return
+    
+    def draw(self, field):
+        """Get the next value of a field"""
+        if self.generators is None:
+            self._start()
+        if not self.precompute:
+            return self.generators[field]()
+        position = self.positions.get(field, 0)
+        values = self.values.get(field, [])
+        if position == len(values):
+            self._grow(field)
+            values = self.values[field]
+            if position == len(values):
+                raise DataPoolExhausted(f"Test data pool field '{field}' has no new values left after {position}")
+            logger.debug(f"Test data pool field '{field}' grown to {len(values)} values")
+        self.positions[field] = position + 1
+        return values[position]
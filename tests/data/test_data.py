@@ -2,11 +2,55 @@
 Test data generators and constants
 Provides test data for various test scenarios
 """
-from faker import Faker
+import logging
 import random
-import string
+from config.config import Config
+from data.data_pool import DataPool
 
-fake = Faker()
+logger = logging.getLogger(__name__)
+
+_pool = None
+
+
+def configure_test_data(seed=None, mode=None, size=None):
+    """
+    Set up the data pool for this process
+    Args:
+        seed: Run seed, a new random seed when None
+        mode: "pool" (precomputed values) or "live" (Faker per call),
+            defaults to Config.TEST_DATA_MODE
+        size: Values per field in pool mode, defaults to Config.TEST_DATA_POOL_SIZE
+    Returns:
+        The run seed
+    """
+    global _pool
+    if seed is None:
+        seed = random.randrange(10 ** 9)
+    mode = mode or Config.TEST_DATA_MODE
+    # Every test draws its own values, so workers share the run seed
+    _pool = DataPool(seed, size or Config.TEST_DATA_POOL_SIZE, precompute=(mode == "pool"))
+    logger.info(f"Test data seed: {seed} ({mode} mode)")
+    return seed
+
+
+def start_test_data(test_id):
+    """
+    Seed the values drawn by one test from the run seed and its id
+    Args:
+        test_id: pytest node id of the test
+    Returns:
+        The test's data seed
+    """
+    test_seed = data_pool().start_test(test_id)
+    logger.info(f"Test data seed for {test_id}: {test_seed}")
+    return test_seed
+
+
+def data_pool():
+    """Get the data pool, configured with a random seed on first use"""
+    if _pool is None:
+        configure_test_data()
+    return _pool
 
 
 class TestData:
@@ -15,43 +59,51 @@ class TestData:
     @staticmethod
     def generate_random_email():
         """Generate random email address"""
-        return fake.email()
+        return data_pool().draw("emails")
     
     @staticmethod
     def generate_random_username():
         """Generate random username"""
-        return fake.user_name()
+        return data_pool().draw("usernames")
     
     @staticmethod
     def generate_random_phone():
-        """Generate random phone number"""
-        return fake.phone_number()
+        """Generate random phone number in the app's format"""
+        return data_pool().draw("phones")
     
     @staticmethod
     def generate_strong_password():
         """Generate strong password"""
-        return fake.password(length=12, special_chars=True, digits=True, upper_case=True, lower_case=True)
+        return data_pool().draw("strong_passwords")
     
     @staticmethod
     def generate_weak_password():
         """Generate weak password (too short)"""
-        return ''.join(random.choices(string.ascii_lowercase, k=4))
+        return data_pool().draw("weak_passwords")
     
     @staticmethod
     def generate_random_text(length=50):
-        """Generate random text"""
-        return fake.text(max_nb_chars=length)
+        """Generate random text of exactly length characters"""
+        text = data_pool().draw("texts")
+        while len(text) < length:
+            text += " " + data_pool().draw("texts")
+        # Never end on a space, inputs may trim it
+        return text[:length].rstrip().ljust(length, ".")
+    
+    @staticmethod
+    def generate_random_number(digits=4):
+        """Generate random number with up to the given number of digits"""
+        return data_pool().draw("numbers") % 10 ** digits
     
     @staticmethod
     def generate_menu_name():
         """Generate menu name"""
-        menu_types = ["Breakfast", "Lunch", "Dinner", "Desserts", "Beverages", "Special", "Weekend", "Seasonal"]
-        return f"{random.choice(menu_types)} Menu {random.randint(1, 100)}"
+        return data_pool().draw("menu_names")
     
     @staticmethod
     def generate_menu_description():
         """Generate menu description"""
-        return fake.text(max_nb_chars=100)
+        return data_pool().draw("menu_descriptions")
 
 
 # Valid test credentials
@@ -1,11 +1,16 @@
 from .base_page import BasePage
 from .login_page import LoginPage
 from .register_page import RegisterPage
-from .menu_page import MenuPage
+from .menu_page import MenuPage, MenuPageSnapshot, MenuCardState, ModalState
+from .menu_card import MenuCard
 
 __all__ = [
     'BasePage',
     'LoginPage',
     'RegisterPage',
-    'MenuPage'
+    'MenuPage',
+    'MenuCard',
+    'MenuPageSnapshot',
+    'MenuCardState',
+    'ModalState'
 ]
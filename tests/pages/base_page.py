@@ -2,27 +2,190 @@
 Base Page Object class with common WebDriver operations
 All page objects inherit from this class
 """
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    UnexpectedAlertPresentException,
+    NoSuchWindowException,
+    WebDriverException,
+)
 from config.config import Config
+from pages.wait_policy import WaitPolicy
+from pages.step_timer import instrument_class
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
+
+# Tracks Blazor activity in the page: DOM mutations (render batches),
+# pending fetch/XHR calls and circuit (WebSocket) traffic. A user event
+# marks the app as busy until the framework has answered it.
+READY_TRACKER_SCRIPT = """
+(function () {
+    if (window.__gfReady) { return; }
+    var t = {
+        lastActivity: Date.now(),
+        pending: 0,
+        awaitingSince: 0,
+        socketSeen: false,
+        early: document.readyState === 'loading'
+    };
+    var touch = function () { t.lastActivity = Date.now(); };
+    var answer = function () { t.awaitingSince = 0; touch(); };
+    window.__gfReady = t;
+    
+    var observe = function () {
+        new MutationObserver(answer).observe(document, {
+            subtree: true, childList: true, attributes: true, characterData: true
+        });
+    };
+    if (document.documentElement) { observe(); }
+    else { document.addEventListener('DOMContentLoaded', observe); }
+    
+    ['click', 'submit', 'change', 'input'].forEach(function (type) {
+        document.addEventListener(type, function (e) {
+            if (e.isTrusted) { t.awaitingSince = Date.now(); touch(); }
+        }, true);
+    });
+    
+    if (window.fetch) {
+        var fetch = window.fetch;
+        window.fetch = function () {
+            t.pending++; touch();
+            return fetch.apply(this, arguments).finally(function () { t.pending--; answer(); });
+        };
+    }
+    var xhrSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        t.pending++; touch();
+        this.addEventListener('loadend', function () { t.pending--; answer(); });
+        return xhrSend.apply(this, arguments);
+    };
+    if (window.WebSocket) {
+        var wsSend = WebSocket.prototype.send;
+        WebSocket.prototype.send = function () {
+            if (!this.__gfTracked) {
+                this.__gfTracked = true;
+                t.socketSeen = true;
+                this.addEventListener('message', answer);
+            }
+            touch();
+            return wsSend.apply(this, arguments);
+        };
+    }
+})();
+"""
+
+# Resolves a locator in the page and reads every match in one round trip
+BULK_READ_SCRIPT = """
+var by = arguments[0], value = arguments[1], attributes = arguments[2];
+var nodes = [];
+if (by === 'xpath') {
+    var snapshot = document.evaluate(value, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+} else {
+    nodes = Array.prototype.slice.call(document.querySelectorAll(value));
+}
+return nodes.map(function (el) {
+    var visible = !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    var attrs = {};
+    attributes.forEach(function (name) { attrs[name] = el.getAttribute(name); });
+    return {text: visible ? el.innerText.trim() : '', visible: visible, attributes: attrs};
+});
+"""
+
+# Error messages of a script torn down by a navigation (Chrome/Edge, Firefox)
+UNLOAD_ERRORS = ("document unloaded", "document was unloaded", "target frame detached", "navigated")
+
+APP_IDLE_SCRIPT = READY_TRACKER_SCRIPT + """
+var quietMs = arguments[0], responseMs = arguments[1], timeoutMs = arguments[2];
+var busySelector = arguments[3], done = arguments[arguments.length - 1];
+var t = window.__gfReady, start = Date.now();
+var needsCircuit = t.early && !!document.querySelector(
+    'script[src*="blazor.server"], script[src*="blazor.web"]');
+(function poll() {
+    var now = Date.now();
+    var booted = !document.querySelector('script[src*="blazor."]') || !!window.Blazor;
+    var awaiting = t.awaitingSince && responseMs && now - t.awaitingSince < responseMs;
+    var idle = document.readyState === 'complete' && booted && !awaiting
+        && (!needsCircuit || t.socketSeen)
+        && t.pending === 0
+        && !(busySelector && document.querySelector(busySelector))
+        && now - t.lastActivity >= quietMs;
+    if (idle || now - start >= timeoutMs) {
+        done({idle: idle, elapsed: now - start});
+    } else {
+        setTimeout(poll, Math.min(quietMs, 25));
+    }
+})();
+"""
+
 
 class BasePage:
-    """Base class for all Page Objects"""
+    """
+    Base class for all Page Objects
+    Public methods of this class and of every subclass are timed
+    automatically when the driver has a StepTimer attached.
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
     
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
+        self.waits = WaitPolicy.for_driver(driver)
         self.base_url = Config.BASE_URL
+        self._register_ready_tracker()
     
     # Navigation methods
     def navigate_to(self, path=""):
-        """Navigate to a specific path"""
+        """Navigate to a specific path and wait for the app to render"""
         url = f"{self.base_url}{path}"
+        self.invalidate_page_state()
         self.driver.get(url)
+        self.wait_for_app_idle(expect_response=False)
+    
+    @property
+    def page_state(self):
+        """
+        Cache for derived page state, shared by all page objects of a driver
+        Cleared by every method that can change the DOM
+        """
+        cache = getattr(self.driver, "_page_state", None)
+        if cache is None:
+            cache = {}
+            self.driver._page_state = cache
+        return cache
+    
+    def invalidate_page_state(self, elements=True):
+        """
+        Drop cached page state before the DOM changes
+        Args:
+            elements: Also drop cached elements; False for changes that keep
+                the elements in place, e.g. typing into a field
+        """
+        self.page_state.clear()
+        if elements:
+            self.element_cache.clear()
+    
+    @property
+    def element_cache(self):
+        """
+        Elements found by locator, shared by all page objects of a driver
+        Only filled when Config.ELEMENT_CACHE is on. Valid until the next
+        navigation, click or alert, which are the changes that replace elements.
+        """
+        cache = getattr(self.driver, "_element_cache", None)
+        if cache is None:
+            cache = {}
+            self.driver._element_cache = cache
+        return cache
     
     def get_current_url(self):
         """Get current page URL"""
@@ -36,26 +199,66 @@ class BasePage:
     def find_element(self, locator, timeout=None):
         """
         Find element with explicit wait
+        With the element cache on, an element resolved since the last
+        navigation or click is checked with one call instead of searching
+        the DOM again; a stale one is resolved again.
         Args:
             locator: Tuple (By.STRATEGY, "value")
             timeout: Optional custom timeout
         """
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        return wait.until(EC.presence_of_element_located(locator))
+        return self._with_element(locator, lambda element: element, "find", timeout, check_cached=True)
+    
+    def _with_element(self, locator, action, operation="find", timeout=None, check_cached=False):
+        """
+        Resolve a locator, through the element cache, and run an action on the element
+        An element that went stale, e.g. because Blazor re-rendered it, is
+        resolved again and the action retried up to Config.STALE_RETRIES times.
+        Args:
+            locator: Tuple (By.STRATEGY, "value")
+            action: Callable taking the element
+            operation: "find" waits for presence, "click" for clickability
+            timeout: Optional custom timeout
+            check_cached: Make sure a cached element is not stale before the
+                action, for actions that do not touch the element themselves
+        Returns:
+            Result of the action
+        """
+        condition = EC.element_to_be_clickable if operation == "click" else EC.presence_of_element_located
+        for attempt in range(Config.STALE_RETRIES + 1):
+            element = self.element_cache.get(locator) if Config.ELEMENT_CACHE else None
+            try:
+                if element is None:
+                    element = self.waits.until(condition(locator), operation, locator, timeout)
+                    if Config.ELEMENT_CACHE:
+                        self.element_cache[locator] = element
+                elif operation == "click":
+                    # Known element, only its state needs waiting for
+                    self.waits.until(condition(element), operation, locator, timeout)
+                elif check_cached:
+                    # Raises StaleElementReferenceException for a stale element
+                    element.is_enabled()
+                return action(element)
+            except StaleElementReferenceException:
+                self.element_cache.pop(locator, None)
+                if attempt == Config.STALE_RETRIES:
+                    raise
+                logger.debug(f"Stale element for {locator}, resolving it again")
     
     def find_elements(self, locator, timeout=None):
         """Find multiple elements"""
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.presence_of_element_located(locator))
-        return self.driver.find_elements(*locator)
+        self.waits.until(EC.presence_of_element_located(locator), "find", locator, timeout)
+        start = time.perf_counter()
+        elements = self.driver.find_elements(*locator)
+        self._profile_read(locator, start)
+        return elements
     
     def click(self, locator, timeout=None):
         """Click on element with wait for clickable"""
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        element = wait.until(EC.element_to_be_clickable(locator))
+        self._with_element(locator, self.click_element, "click", timeout)
+    
+    def click_element(self, element):
+        """Click an already located element"""
+        self.invalidate_page_state()
         element.click()
     
     def type(self, locator, text, timeout=None, clear_first=True):
@@ -67,102 +270,220 @@ class BasePage:
             timeout: Optional custom timeout
             clear_first: Clear field before typing
         """
-        element = self.find_element(locator, timeout)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def type_into(element):
+            # The field stays in place, so cached elements remain valid
+            self.invalidate_page_state(elements=False)
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        self._with_element(locator, type_into, "find", timeout)
     
     def get_text(self, locator, timeout=None):
         """Get text from element"""
-        element = self.find_element(locator, timeout)
-        return element.text
+        return self._with_element(locator, lambda element: element.text, "find", timeout)
     
     def get_attribute(self, locator, attribute, timeout=None):
         """Get attribute value from element"""
-        element = self.find_element(locator, timeout)
-        return element.get_attribute(attribute)
-    
-    def is_element_visible(self, locator, timeout=5):
-        """Check if element is visible"""
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.visibility_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+        return self._with_element(locator, lambda element: element.get_attribute(attribute), "find", timeout)
     
-    def is_element_present(self, locator, timeout=5):
+    def is_element_visible(self, locator, timeout=None):
+        """
+        Check if element is visible
+        Uses the short "state" budget unless a timeout is given, since the
+        page has already settled after wait_for_app_idle()
+        """
+        condition = EC.visibility_of_element_located(locator)
+        return bool(self.waits.check(condition, "state", locator, timeout))
+    
+    def is_element_present(self, locator, timeout=None):
         """Check if element is present in DOM"""
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.presence_of_element_located(locator))
-            return True
-        except TimeoutException:
-            return False
+        condition = EC.presence_of_element_located(locator)
+        return bool(self.waits.check(condition, "state", locator, timeout))
+    
+    def is_element_absent(self, locator, timeout=None):
+        """
+        Check that no element matching the locator is visible
+        Returns immediately when the element is already gone
+        """
+        condition = EC.invisibility_of_element_located(locator)
+        return bool(self.waits.check(condition, "state", locator, timeout))
+    
+    # Bulk read methods
+    def read_elements(self, locator, attributes=()):
+        """
+        Read every element matching a locator with a single script call
+        Does not wait; call after the page has settled.
+        Args:
+            locator: Tuple (By.STRATEGY, "value")
+            attributes: Attribute names to read from each element
+        Returns:
+            List of dicts with "text", "visible" and "attributes" keys
+        """
+        by, value = self._to_script_locator(locator)
+        start = time.perf_counter()
+        elements = self.driver.execute_script(BULK_READ_SCRIPT, by, value, list(attributes))
+        self._profile_read(locator, start)
+        return elements
+    
+    def _profile_read(self, locator, start):
+        """Report a lookup that did not wait to the locator profiler, if one is attached"""
+        profiler = getattr(self.driver, "_locator_profiler", None)
+        if profiler is not None:
+            profiler.record_read(locator, time.perf_counter() - start)
+    
+    def get_texts(self, locator, visible_only=True):
+        """Get the text of every element matching a locator"""
+        return [
+            element["text"] for element in self.read_elements(locator)
+            if element["visible"] or not visible_only
+        ]
+    
+    def get_attributes(self, locator, attribute):
+        """Get one attribute from every element matching a locator"""
+        return [element["attributes"][attribute] for element in self.read_elements(locator, [attribute])]
+    
+    def count_elements(self, locator):
+        """Count elements matching a locator"""
+        return len(self.read_elements(locator))
+    
+    @staticmethod
+    def _to_script_locator(locator):
+        """Convert a locator to an (xpath|css, value) pair the bulk script understands"""
+        by, value = locator
+        if by == By.XPATH:
+            return "xpath", value
+        if by == By.CSS_SELECTOR:
+            return "css", value
+        if by == By.ID:
+            return "css", f'[id="{value}"]'
+        if by == By.NAME:
+            return "css", f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return "css", f".{value}"
+        if by == By.TAG_NAME:
+            return "css", value
+        raise ValueError(f"Locator strategy not supported for bulk reads: {by}")
     
     def wait_for_element_to_disappear(self, locator, timeout=None):
         """Wait for element to disappear from DOM"""
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.invisibility_of_element_located(locator))
+        self.waits.until(EC.invisibility_of_element_located(locator), "disappear", locator, timeout)
     
     def wait_for_url_contains(self, url_part, timeout=None):
         """Wait for URL to contain specific string"""
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.url_contains(url_part))
+        self.waits.until(EC.url_contains(url_part), "url", None, timeout)
     
     def wait_for_url_to_be(self, url, timeout=None):
         """Wait for URL to be exact match"""
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.url_to_be(url))
+        self.waits.until(EC.url_to_be(url), "url", None, timeout)
     
     # Alert/Modal methods
-    def accept_alert(self, timeout=5):
+    def accept_alert(self, timeout=None):
         """Accept JavaScript alert"""
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            alert = wait.until(EC.alert_is_present())
-            alert.accept()
-            return True
-        except TimeoutException:
+        alert = self.waits.check(EC.alert_is_present(), "alert", None, timeout)
+        if not alert:
             return False
+        self.invalidate_page_state()
+        alert.accept()
+        return True
     
-    def dismiss_alert(self, timeout=5):
+    def dismiss_alert(self, timeout=None):
         """Dismiss JavaScript alert"""
-        try:
-            wait = WebDriverWait(self.driver, timeout)
-            alert = wait.until(EC.alert_is_present())
-            alert.dismiss()
-            return True
-        except TimeoutException:
+        alert = self.waits.check(EC.alert_is_present(), "alert", None, timeout)
+        if not alert:
             return False
+        self.invalidate_page_state()
+        alert.dismiss()
+        return True
     
-    def get_alert_text(self, timeout=5):
+    def get_alert_text(self, timeout=None):
         """Get alert text"""
-        wait = WebDriverWait(self.driver, timeout)
-        alert = wait.until(EC.alert_is_present())
+        alert = self.waits.until(EC.alert_is_present(), "alert", None, timeout)
         return alert.text
     
     # Wait helpers
-    def wait_for_loading_to_complete(self, timeout=10):
+    def wait_for_loading_to_complete(self, timeout=None):
         """Wait for loading spinner to disappear"""
         loading_spinner = (By.CSS_SELECTOR, ".loading-spinner")
-        try:
-            # Wait for spinner to appear first
-            WebDriverWait(self.driver, 2).until(
-                EC.presence_of_element_located(loading_spinner)
-            )
-            # Then wait for it to disappear
+        # Spinner might not appear for fast operations
+        if self.is_element_present(loading_spinner):
             self.wait_for_element_to_disappear(loading_spinner, timeout)
-        except TimeoutException:
-            # Spinner might not appear for fast operations
-            pass
     
     def wait(self, seconds):
         """Explicit wait for specified seconds"""
         time.sleep(seconds)
+        timer = getattr(self.driver, "_step_timer", None)
+        if timer is not None:
+            timer.add_sleep(seconds)
+    
+    def wait_for_app_idle(self, timeout=None, expect_response=True):
+        """
+        Wait until Blazor has finished processing the last interaction
+        The app is idle once it has answered the last user event, no HTTP
+        calls are pending, no loading spinner is shown and the DOM has been
+        quiet for Config.READY_QUIET_MS.
+        Args:
+            timeout: Optional custom timeout
+            expect_response: Wait up to Config.READY_RESPONSE_MS for the app
+                to react to the last click/input before checking for quiet
+        Returns:
+            True if the app became idle within the timeout
+        """
+        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
+        response_ms = Config.READY_RESPONSE_MS if expect_response else 0
+        start = time.perf_counter()
+        while True:
+            remaining = wait_time - (time.perf_counter() - start)
+            try:
+                state = self.driver.execute_async_script(
+                    APP_IDLE_SCRIPT,
+                    Config.READY_QUIET_MS,
+                    response_ms,
+                    max(remaining, 0) * 1000,
+                    Config.READY_BUSY_SELECTOR
+                )
+                break
+            except UnexpectedAlertPresentException:
+                # A JavaScript dialog is open, the app is waiting on the user
+                return True
+            except WebDriverException as e:
+                # JavascriptException or NoSuchWindowException when the interaction
+                # navigated (e.g. login, register) and unloaded the document
+                # running the script; poll the new document instead
+                if not self._is_unload_error(e):
+                    raise
+                if remaining <= Config.POLL_INTERVAL:
+                    state = {"idle": False, "elapsed": wait_time * 1000}
+                    break
+                # The navigation was the app's answer to the interaction
+                response_ms = 0
+                time.sleep(Config.POLL_INTERVAL)
+        state["elapsed"] = (time.perf_counter() - start) * 1000
+        self.waits.record("ready", None, wait_time, state["elapsed"] / 1000, state["idle"])
+        if not state["idle"]:
+            logger.warning(f"App still busy after {wait_time}s on {self.driver.current_url}")
+        return state["idle"]
+    
+    @staticmethod
+    def _is_unload_error(error):
+        """Check whether a script failed because its document went away"""
+        if isinstance(error, NoSuchWindowException):
+            return True
+        message = (error.msg or "").lower()
+        return any(text in message for text in UNLOAD_ERRORS)
+    
+    def _register_ready_tracker(self):
+        """
+        Install the activity tracker in every new document (Chromium only)
+        Other browsers get it lazily on the first wait_for_app_idle call.
+        """
+        if getattr(self.driver, "_ready_tracker_registered", False):
+            return
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": READY_TRACKER_SCRIPT}
+            )
+        self.driver._ready_tracker_registered = True
     
     # Screenshot method
     def take_screenshot(self, filename):
@@ -174,8 +495,9 @@ class BasePage:
     # Scroll methods
     def scroll_to_element(self, locator):
         """Scroll to element"""
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._with_element(
+            locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        )
     
     def scroll_to_bottom(self):
         """Scroll to bottom of page"""
@@ -184,3 +506,6 @@ class BasePage:
     def scroll_to_top(self):
         """Scroll to top of page"""
         self.driver.execute_script("window.scrollTo(0, 0);")
+
+
+instrument_class(BasePage)
@@ -0,0 +1,119 @@
+"""
+Locator profiling
+Times every resolution of a locator by the page objects: how often it is
+resolved, how many polls it takes to match and how long each poll runs
+"""
+import time
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+from pages.step_timer import LOCATOR_NAMES
+
+# Reports which alternatives of a CSS selector group match in the current page
+GROUP_PROBE_SCRIPT = """
+return arguments[0].map(function (selector) {
+    try { return document.querySelectorAll(selector).length; } catch (e) { return -1; }
+});
+"""
+
+
+def locator_key(locator):
+    """Stable text form of a locator, e.g. "xpath=//a[contains(., 'Edit')]" """
+    by, value = locator
+    return f"{by}={value}"
+
+
+class LocatorProfiler:
+    """
+    Resolution statistics per locator for one WebDriver session
+    Waits run through WaitPolicy report each poll of their condition here,
+    bulk reads report their single script call. The alternatives of a
+    CSS selector group are probed once, the first time the group matches.
+    """
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.reset()
+    
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the profiler of a driver, attaching one if needed"""
+        profiler = getattr(driver, "_locator_profiler", None)
+        if profiler is None:
+            profiler = cls(driver)
+            driver._locator_profiler = profiler
+        return profiler
+    
+    def reset(self):
+        """Clear the statistics, e.g. at the start of a test"""
+        self.stats = {}
+    
+    def _stats(self, locator):
+        key = locator_key(locator)
+        if key not in self.stats:
+            self.stats[key] = {
+                "by": locator[0],
+                "value": locator[1],
+                "names": sorted(LOCATOR_NAMES.get(tuple(locator), [])),
+                "resolutions": 0,
+                "polls": 0,
+                "poll_time": 0.0,
+                "wait_time": 0.0,
+                "timeouts": 0,
+                "group_matches": None,
+            }
+        return self.stats[key]
+    
+    def timed(self, locator, condition):
+        """
+        Wrap a wait condition so each poll counts against the locator
+        Returns:
+            Condition callable to pass to WebDriverWait
+        """
+        stats = self._stats(locator)
+        stats["resolutions"] += 1
+        
+        def poll(driver):
+            start = time.perf_counter()
+            try:
+                return condition(driver)
+            finally:
+                stats["polls"] += 1
+                stats["poll_time"] += time.perf_counter() - start
+        return poll
+    
+    def record_wait(self, locator, elapsed, satisfied):
+        """Add the outcome of a wait started with timed()"""
+        stats = self._stats(locator)
+        stats["wait_time"] += elapsed
+        stats["timeouts"] += not satisfied
+        if satisfied and stats["group_matches"] is None and self._is_group(locator):
+            self._probe_group(locator, stats)
+    
+    def record_read(self, locator, elapsed):
+        """Add a single resolution without waiting, e.g. a bulk read"""
+        stats = self._stats(locator)
+        stats["resolutions"] += 1
+        stats["polls"] += 1
+        stats["poll_time"] += elapsed
+        stats["wait_time"] += elapsed
+    
+    @staticmethod
+    def _is_group(locator):
+        return locator[0] == By.CSS_SELECTOR and "," in locator[1]
+    
+    def _probe_group(self, locator, stats):
+        """Count the matches of each alternative while the group is known to match"""
+        alternatives = [part.strip() for part in locator[1].split(",")]
+        try:
+            counts = self.driver.execute_script(GROUP_PROBE_SCRIPT, alternatives)
+        except WebDriverException:
+            # e.g. an alert opened by the action that followed
+            return
+        stats["group_matches"] = dict(zip(alternatives, counts))
+    
+    def report(self):
+        """Statistics of every locator resolved since the last reset"""
+        return [
+            dict(stats, poll_time=round(stats["poll_time"], 4), wait_time=round(stats["wait_time"], 4))
+            for stats in self.stats.values()
+        ]
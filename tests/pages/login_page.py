@@ -54,7 +54,7 @@ class LoginPage(BasePage):
         self.enter_password(password)
         self.click_login_button()
         # Wait for either success (redirect) or error message
-        self.wait(2)  # Small wait for Blazor to process
+        self.wait_for_app_idle()
         return self
     
     def click_register_link(self):
@@ -64,23 +64,23 @@ class LoginPage(BasePage):
     
     def get_error_message(self):
         """Get error message text"""
-        if self.is_element_visible(self.ERROR_MESSAGE, timeout=3):
+        if self.is_element_visible(self.ERROR_MESSAGE):
             return self.get_text(self.ERROR_MESSAGE)
         return None
     
     def get_success_message(self):
         """Get success message text"""
-        if self.is_element_visible(self.SUCCESS_MESSAGE, timeout=3):
+        if self.is_element_visible(self.SUCCESS_MESSAGE):
             return self.get_text(self.SUCCESS_MESSAGE)
         return None
     
     def is_error_displayed(self):
         """Check if error message is displayed"""
-        return self.is_element_visible(self.ERROR_MESSAGE, timeout=3)
+        return self.is_element_visible(self.ERROR_MESSAGE)
     
     def is_success_displayed(self):
         """Check if success message is displayed"""
-        return self.is_element_visible(self.SUCCESS_MESSAGE, timeout=3)
+        return self.is_element_visible(self.SUCCESS_MESSAGE)
     
     def wait_for_login_success(self, timeout=10):
         """Wait for successful login redirect to menu page"""
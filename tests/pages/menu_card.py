@@ -0,0 +1,120 @@
+"""
+Menu Card component
+One card of the menu list; its buttons and options are looked up inside
+the card element, so acting on a card never scans the whole page
+"""
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException
+from config.config import Config
+from pages.step_timer import instrument_class
+
+
+def element_in(root, locator):
+    """
+    Expected condition: a visible and enabled element inside root
+    Args:
+        root: WebElement to search under
+        locator: Tuple (By.STRATEGY, "value"), relative to root
+    """
+    def condition(driver):
+        element = root.find_element(*locator)
+        return element if element.is_displayed() and element.is_enabled() else False
+    return condition
+
+
+class MenuCard:
+    """
+    Component object for a single menu card
+    Created by MenuPage.card() / MenuPage.cards() from one script call that
+    indexes every card by title, so the card element is already known.
+    """
+    
+    # Locators, relative to the card element
+    VIEW_MENU_BUTTON = (By.XPATH, ".//a[contains(., 'View Menu')]")
+    OPTIONS_DROPDOWN = (By.CSS_SELECTOR, ".dropdown-end label")
+    EDIT_OPTION = (By.XPATH, ".//a[contains(text(), 'Edit')]")
+    DELETE_OPTION = (By.XPATH, ".//a[contains(text(), 'Delete')]")
+    
+    def __init__(self, page, element, title, description=""):
+        """
+        Args:
+            page: MenuPage the card belongs to
+            element: Card WebElement
+            title: Card title as read by the index script
+            description: Card description as read by the index script
+        """
+        self.page = page
+        self.driver = page.driver
+        self.element = element
+        self.title = title
+        self.description = description
+    
+    def __repr__(self):
+        return f"MenuCard({self.title!r})"
+    
+    def _click(self, locator):
+        """
+        Wait for an element of this card to be clickable and click it
+        If Blazor re-rendered the card in the meantime, the card is found
+        again by title and the click retried, up to Config.STALE_RETRIES times.
+        """
+        for attempt in range(Config.STALE_RETRIES + 1):
+            try:
+                element = self.page.waits.until(element_in(self.element, locator), "click", locator)
+                self.page.click_element(element)
+                return
+            except StaleElementReferenceException:
+                if attempt == Config.STALE_RETRIES:
+                    raise
+                self.page.cards(refresh=True)
+                self.element = self.page.card(self.title).element
+    
+    def view(self):
+        """Click View Menu on this card"""
+        self._click(self.VIEW_MENU_BUTTON)
+        self.page.wait_for_app_idle()
+        return self.page
+    
+    def open_options(self):
+        """Open the options dropdown of this card"""
+        self._click(self.OPTIONS_DROPDOWN)
+        # Dropdown is CSS-only, nothing to wait for from the app
+        self.page.wait_for_app_idle(expect_response=False)
+        return self
+    
+    def click_edit(self):
+        """Open the edit modal of this card"""
+        self.open_options()
+        self._click(self.EDIT_OPTION)
+        self.page.wait_for_modal_to_open()
+        return self.page
+    
+    def click_delete(self):
+        """Click Delete on this card; the app then asks for confirmation"""
+        self.open_options()
+        self._click(self.DELETE_OPTION)
+        return self.page
+    
+    def edit(self, name, description):
+        """
+        Complete flow to edit this menu
+        Args:
+            name: New menu name
+            description: New menu description
+        """
+        self.click_edit()
+        return self.page.edit_menu_details(name, description)
+    
+    def delete(self, confirm=True):
+        """
+        Complete flow to delete this menu
+        Args:
+            confirm: Accept the confirmation alert, or dismiss it
+        Returns:
+            True if the confirmation alert appeared and was handled
+        """
+        self.click_delete()
+        return self.page.confirm_delete_alert() if confirm else self.page.cancel_delete_alert()
+
+
+instrument_class(MenuCard)
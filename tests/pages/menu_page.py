@@ -2,8 +2,126 @@
 Menu Page Object
 Represents the menu listing page and its interactions
 """
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
 from pages.base_page import BasePage
+from pages.menu_card import MenuCard
+
+
+# Reads the whole menu page state in one round trip
+SNAPSHOT_SCRIPT = """
+var loc = arguments[0];
+function all(locator, root) {
+    root = root || document;
+    if (locator[0] === 'xpath') {
+        var result = document.evaluate(locator[1], root, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+        return nodes;
+    }
+    return Array.prototype.slice.call(root.querySelectorAll(locator[1]));
+}
+function visible(el) {
+    return !!(el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length));
+}
+function firstVisible(locator) {
+    return all(locator).filter(visible)[0] || null;
+}
+function text(el) {
+    return visible(el) ? el.innerText.trim() : null;
+}
+var modal = firstVisible(loc.modal);
+return {
+    url: window.location.href,
+    cards: all(loc.cards).map(function (card) {
+        return {
+            title: text(all(loc.title, card)[0]) || '',
+            description: text(all(loc.description, card)[0]) || ''
+        };
+    }),
+    noMenus: !!firstVisible(loc.noMenus),
+    addButton: !!firstVisible(loc.addButton),
+    modal: {
+        open: !!modal,
+        title: modal ? text(firstVisible(loc.modalTitle)) : null,
+        success: modal ? text(firstVisible(loc.modalSuccess)) : null,
+        error: modal ? text(firstVisible(loc.modalError)) : null
+    }
+};
+"""
+
+
+# Indexes every menu card with its title and description in one round trip
+CARD_INDEX_SCRIPT = """
+var loc = arguments[0];
+function first(locator, root) {
+    if (locator[0] === 'xpath') {
+        return document.evaluate(locator[1], root, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return root.querySelector(locator[1]);
+}
+function text(el) {
+    return el && (el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+        ? el.innerText.trim() : '';
+}
+var cards = [];
+if (loc.cards[0] === 'xpath') {
+    var result = document.evaluate(loc.cards[1], document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < result.snapshotLength; i++) { cards.push(result.snapshotItem(i)); }
+} else {
+    cards = Array.prototype.slice.call(document.querySelectorAll(loc.cards[1]));
+}
+return cards.map(function (card) {
+    return {
+        element: card,
+        title: text(first(loc.title, card)),
+        description: text(first(loc.description, card))
+    };
+});
+"""
+
+
+@dataclass(frozen=True)
+class MenuCardState:
+    """Title and description of one menu card"""
+    title: str
+    description: str
+
+
+@dataclass(frozen=True)
+class ModalState:
+    """State of the add/edit menu modal"""
+    is_open: bool
+    title: Optional[str] = None
+    success_message: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class MenuPageSnapshot:
+    """Everything the menu tests assert on, read in a single browser call"""
+    url: str
+    cards: Tuple[MenuCardState, ...]
+    no_menus_displayed: bool
+    add_button_visible: bool
+    modal: ModalState
+    
+    @property
+    def menu_count(self):
+        """Number of menu cards"""
+        return len(self.cards)
+    
+    @property
+    def titles(self):
+        """Menu titles in page order"""
+        return [card.title for card in self.cards]
 
 
 class MenuPage(BasePage):
@@ -29,20 +147,22 @@ class MenuPage(BasePage):
     # Menu card elements
     MENU_TITLE = (By.CSS_SELECTOR, ".card-title")
     MENU_DESCRIPTION = (By.CSS_SELECTOR, ".card-body p")
-    VIEW_MENU_BUTTON = (By.XPATH, "//a[contains(., 'View Menu')]")
-    MENU_OPTIONS_DROPDOWN = (By.CSS_SELECTOR, ".dropdown-end label")
-    EDIT_OPTION = (By.XPATH, "//a[contains(text(), 'Edit')]")
-    DELETE_OPTION = (By.XPATH, "//a[contains(text(), 'Delete')]")
+    # Card buttons and options are scoped to the card, see MenuCard
     
-    def __init__(self, driver):
+    def __init__(self, driver, namespace=None):
+        """
+        Args:
+            driver: WebDriver instance
+            namespace: Optional DataNamespace; counts, titles and menu_index
+                arguments then only consider menus owned by that namespace
+        """
         super().__init__(driver)
         self.page_path = "/menu"
+        self.namespace = namespace
     
     def navigate(self):
         """Navigate to menu page"""
         self.navigate_to(self.page_path)
-        # Wait for page to load
-        self.wait(2)
         return self
     
     def is_on_menu_page(self):
@@ -55,7 +175,7 @@ class MenuPage(BasePage):
     
     def is_add_menu_button_visible(self):
         """Check if Add Menu button is visible (admin/chef only)"""
-        return self.is_element_visible(self.ADD_MENU_BUTTON, timeout=3)
+        return self.is_element_visible(self.ADD_MENU_BUTTON)
     
     def click_add_menu_button(self):
         """Click Add New Menu button"""
@@ -63,58 +183,147 @@ class MenuPage(BasePage):
         self.wait_for_modal_to_open()
         return self
     
+    def wait_for_menu_list(self):
+        """Wait for the list to render either menu cards or the empty state"""
+        # One bounded wait for whichever state the list rendered in
+        return bool(self.waits.check(EC.any_of(
+            EC.presence_of_element_located(self.MENU_CARDS),
+            EC.visibility_of_element_located(self.NO_MENUS_MESSAGE)
+        ), "state", self.MENU_CARDS))
+    
     def get_menu_count(self):
         """Get number of menus displayed"""
-        if self.is_no_menus_message_displayed():
+        if not self.wait_for_menu_list():
             return 0
-        if self.is_element_present(self.MENU_CARDS, timeout=3):
-            return len(self.find_elements(self.MENU_CARDS))
-        return 0
+        if self.namespace is not None:
+            return len(self.get_menu_titles())
+        return self.count_elements(self.MENU_CARDS)
     
     def is_no_menus_message_displayed(self):
         """Check if 'no menus' message is displayed"""
-        return self.is_element_visible(self.NO_MENUS_MESSAGE, timeout=3)
+        return self.is_element_visible(self.NO_MENUS_MESSAGE)
+    
+    def snapshot(self, refresh=False):
+        """
+        Get the current page state as a MenuPageSnapshot
+        The snapshot is cached until a page-object method changes the page
+        (navigate, click, type, alert handling), so repeated assertions on
+        an unchanged page do not talk to the browser.
+        Args:
+            refresh: Ignore the cached snapshot and read the page again
+        """
+        if refresh or "menu_snapshot" not in self.page_state:
+            raw = self.driver.execute_script(SNAPSHOT_SCRIPT, {
+                "cards": self._to_script_locator(self.MENU_CARDS),
+                # Card children are looked up inside each card element
+                "title": self._to_script_locator(self.MENU_TITLE),
+                "description": self._to_script_locator(self.MENU_DESCRIPTION),
+                "noMenus": self._to_script_locator(self.NO_MENUS_MESSAGE),
+                "addButton": self._to_script_locator(self.ADD_MENU_BUTTON),
+                "modal": self._to_script_locator(self.MODAL),
+                "modalTitle": self._to_script_locator(self.MODAL_TITLE),
+                "modalSuccess": self._to_script_locator(self.MODAL_SUCCESS_MESSAGE),
+                "modalError": self._to_script_locator(self.MODAL_ERROR_MESSAGE),
+            })
+            modal = raw["modal"]
+            self.page_state["menu_snapshot"] = MenuPageSnapshot(
+                url=raw["url"],
+                cards=tuple(
+                    MenuCardState(card["title"], card["description"]) for card in raw["cards"]
+                    if self.namespace is None or self.namespace.owns(card["title"])
+                ),
+                no_menus_displayed=raw["noMenus"],
+                add_button_visible=raw["addButton"],
+                modal=ModalState(modal["open"], modal["title"], modal["success"], modal["error"])
+            )
+        return self.page_state["menu_snapshot"]
+    
+    def cards(self, refresh=False):
+        """
+        Get the menu cards in page order as MenuCard components
+        All cards are indexed with one script call; the index is cached
+        until a page-object method changes the page.
+        Args:
+            refresh: Ignore the cached index and read the page again
+        """
+        if refresh or "menu_cards" not in self.page_state:
+            raw = []
+            if self.wait_for_menu_list():
+                start = time.perf_counter()
+                raw = self.driver.execute_script(CARD_INDEX_SCRIPT, {
+                    "cards": self._to_script_locator(self.MENU_CARDS),
+                    # Card children are looked up inside each card element
+                    "title": self._to_script_locator(self.MENU_TITLE),
+                    "description": self._to_script_locator(self.MENU_DESCRIPTION),
+                })
+                self._profile_read(self.MENU_CARDS, start)
+            self.page_state["menu_cards"] = [
+                MenuCard(self, card["element"], card["title"], card["description"]) for card in raw
+            ]
+        cards = self.page_state["menu_cards"]
+        if self.namespace is None:
+            return list(cards)
+        return [card for card in cards if self.namespace.owns(card.title)]
+    
+    def card(self, name):
+        """
+        Get the menu card with a given title
+        Args:
+            name: Menu title, as displayed on the card
+        Raises:
+            NoSuchElementException: No card has that title
+        """
+        for card in self.cards():
+            if card.title == name:
+                return card
+        raise NoSuchElementException(f"No menu card titled '{name}'")
+    
+    def has_card(self, name):
+        """Check if a menu card with the given title is listed"""
+        return any(card.title == name for card in self.cards())
     
     def get_menu_titles(self):
         """Get list of all menu titles"""
-        if self.get_menu_count() == 0:
-            return []
-        titles = self.find_elements(self.MENU_TITLE)
-        return [title.text for title in titles]
+        # One entry per card so indexes line up with the card list
+        return [card.title for card in self.cards()]
+    
+    def _card_at(self, menu_index):
+        """Get the card at a menu_index argument, or None when there is no such menu"""
+        cards = self.cards()
+        return cards[menu_index] if menu_index < len(cards) else None
     
     def click_view_menu(self, menu_index=0):
         """Click View Menu button for specific menu"""
-        view_buttons = self.find_elements(self.VIEW_MENU_BUTTON)
-        if menu_index < len(view_buttons):
-            view_buttons[menu_index].click()
-            self.wait(2)
+        card = self._card_at(menu_index)
+        if card is not None:
+            card.view()
         return self
     
     def click_menu_options_dropdown(self, menu_index=0):
         """Click options dropdown for specific menu"""
-        dropdowns = self.find_elements(self.MENU_OPTIONS_DROPDOWN)
-        if menu_index < len(dropdowns):
-            dropdowns[menu_index].click()
-            self.wait(0.5)
+        card = self._card_at(menu_index)
+        if card is not None:
+            card.open_options()
         return self
     
     def click_edit_menu(self, menu_index=0):
         """Edit specific menu"""
-        self.click_menu_options_dropdown(menu_index)
-        self.click(self.EDIT_OPTION)
-        self.wait_for_modal_to_open()
+        card = self._card_at(menu_index)
+        if card is not None:
+            card.click_edit()
         return self
     
     def click_delete_menu(self, menu_index=0):
         """Delete specific menu"""
-        self.click_menu_options_dropdown(menu_index)
-        self.click(self.DELETE_OPTION)
+        card = self._card_at(menu_index)
+        if card is not None:
+            card.click_delete()
         return self
     
     # Modal methods
     def is_modal_open(self):
         """Check if modal is open"""
-        return self.is_element_visible(self.MODAL, timeout=3)
+        return self.is_element_visible(self.MODAL)
     
     def wait_for_modal_to_open(self, timeout=5):
         """Wait for modal to open"""
@@ -138,7 +347,7 @@ class MenuPage(BasePage):
     def click_modal_save(self):
         """Click Save button in modal"""
         self.click(self.MODAL_SAVE_BUTTON)
-        self.wait(2)  # Wait for save operation
+        self.wait_for_app_idle()  # Wait for save operation
         return self
     
     def click_modal_cancel(self):
@@ -168,13 +377,13 @@ class MenuPage(BasePage):
     
     def get_modal_success_message(self):
         """Get success message from modal"""
-        if self.is_element_visible(self.MODAL_SUCCESS_MESSAGE, timeout=3):
+        if self.is_element_visible(self.MODAL_SUCCESS_MESSAGE):
             return self.get_text(self.MODAL_SUCCESS_MESSAGE)
         return None
     
     def get_modal_error_message(self):
         """Get error message from modal"""
-        if self.is_element_visible(self.MODAL_ERROR_MESSAGE, timeout=3):
+        if self.is_element_visible(self.MODAL_ERROR_MESSAGE):
             return self.get_text(self.MODAL_ERROR_MESSAGE)
         return None
     
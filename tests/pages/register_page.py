@@ -81,7 +81,7 @@ class RegisterPage(BasePage):
         self.enter_confirm_password(confirm_password)
         self.click_register_button()
         # Wait for processing
-        self.wait(2)
+        self.wait_for_app_idle()
         return self
     
     def click_login_link(self):
@@ -91,30 +91,29 @@ class RegisterPage(BasePage):
     
     def get_error_message(self):
         """Get error message text"""
-        if self.is_element_visible(self.ERROR_MESSAGE, timeout=3):
+        if self.is_element_visible(self.ERROR_MESSAGE):
             return self.get_text(self.ERROR_MESSAGE)
         return None
     
     def get_success_message(self):
         """Get success message text"""
-        if self.is_element_visible(self.SUCCESS_MESSAGE, timeout=3):
+        if self.is_element_visible(self.SUCCESS_MESSAGE):
             return self.get_text(self.SUCCESS_MESSAGE)
         return None
     
     def get_validation_errors(self):
         """Get all validation error messages"""
-        if self.is_element_present(self.VALIDATION_ERROR, timeout=2):
-            errors = self.find_elements(self.VALIDATION_ERROR, timeout=2)
-            return [error.text for error in errors if error.text]
+        if self.is_element_present(self.VALIDATION_ERROR):
+            return [text for text in self.get_texts(self.VALIDATION_ERROR) if text]
         return []
     
     def is_error_displayed(self):
         """Check if error message is displayed"""
-        return self.is_element_visible(self.ERROR_MESSAGE, timeout=3)
+        return self.is_element_visible(self.ERROR_MESSAGE)
     
     def is_success_displayed(self):
         """Check if success message is displayed"""
-        return self.is_element_visible(self.SUCCESS_MESSAGE, timeout=3)
+        return self.is_element_visible(self.SUCCESS_MESSAGE)
     
     def wait_for_registration_success(self, timeout=10):
         """Wait for successful registration redirect"""
@@ -0,0 +1,161 @@
+"""
+Page-object step timing
+Every public page-object method is timed automatically (see BasePage),
+together with the WebDriver commands, sleeps and waits it caused
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+import functools
+import inspect
+import time
+from selenium.webdriver.common.by import By
+
+
+StepRecord = namedtuple("StepRecord", ["name", "depth", "elapsed", "commands", "sleep", "wait"])
+
+LOCATOR_STRATEGIES = {value for name, value in vars(By).items() if name.isupper()}
+
+# Locator value -> names of the class attributes holding it, e.g. "MenuPage.MENU_CARDS"
+LOCATOR_NAMES = {}
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and value[0] in LOCATOR_STRATEGIES
+
+
+def instrument_class(cls):
+    """
+    Wrap the public methods a class defines so each call is timed
+    Inherited methods are already wrapped by the class defining them, so
+    a step is labelled with that class, e.g. "BasePage.find_element".
+    """
+    for name, value in list(vars(cls).items()):
+        if name.isupper() and _is_locator(value):
+            LOCATOR_NAMES.setdefault(value, set()).add(f"{cls.__name__}.{name}")
+        if name.startswith("_") or not inspect.isfunction(value) or hasattr(value, "__step__"):
+            continue
+        setattr(cls, name, _timed(f"{cls.__name__}.{name}", value))
+    return cls
+
+
+def _timed(step_name, func):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        timer = getattr(self.driver, "_step_timer", None)
+        if timer is None:
+            return func(self, *args, **kwargs)
+        for arg in args:
+            if _is_locator(arg):
+                timer.locators.add(arg)
+        with timer.step(step_name):
+            return func(self, *args, **kwargs)
+    wrapper.__step__ = step_name
+    return wrapper
+
+
+class StepTimer:
+    """
+    Records page-object steps for one WebDriver session
+    Commands are read from the driver's CommandCounter and waits from its
+    WaitPolicy when they are attached, so the timer adds no round-trips.
+    """
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.reset()
+    
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the timer of a driver, attaching one if needed"""
+        timer = getattr(driver, "_step_timer", None)
+        if timer is None:
+            timer = cls(driver)
+            driver._step_timer = timer
+        return timer
+    
+    def reset(self):
+        """Clear recorded steps, e.g. at the start of a test"""
+        self.steps = []
+        self.locators = set()
+        self.sleep_time = 0.0
+        self.depth = 0
+    
+    def add_sleep(self, seconds):
+        """Account for a fixed sleep"""
+        self.sleep_time += seconds
+    
+    def _commands_sent(self):
+        counter = getattr(self.driver, "_command_counter", None)
+        return counter.sent if counter else 0
+    
+    def _wait_time(self):
+        policy = getattr(self.driver, "_wait_policy", None)
+        return policy.total_wait_time() if policy else 0.0
+    
+    @contextmanager
+    def step(self, name):
+        """Time one page-object call, nested calls are recorded with a higher depth"""
+        depth = self.depth
+        commands, sleep, wait = self._commands_sent(), self.sleep_time, self._wait_time()
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.depth = depth
+            self.steps.append(StepRecord(
+                name, depth, elapsed,
+                self._commands_sent() - commands,
+                self.sleep_time - sleep,
+                self._wait_time() - wait
+            ))
+    
+    def top_level_steps(self):
+        """Steps called directly by the test, in call order"""
+        return [step for step in self.steps if step.depth == 0]
+    
+    def by_method(self):
+        """Calls, time, commands, sleeps and waits per method (nested calls included)"""
+        methods = {}
+        for step in self.steps:
+            entry = methods.setdefault(step.name, {
+                "calls": 0, "elapsed": 0.0, "commands": 0, "sleep": 0.0, "wait": 0.0
+            })
+            entry["calls"] += 1
+            entry["elapsed"] += step.elapsed
+            entry["commands"] += step.commands
+            entry["sleep"] += step.sleep
+            entry["wait"] += step.wait
+        return methods
+    
+    def report(self, **extra):
+        """
+        JSON-ready summary of the recorded steps
+        Args:
+            extra: Additional fields, e.g. test id and browser startup time
+        """
+        top = self.top_level_steps()
+        return dict(extra, **{
+            "steps_time": round(sum(step.elapsed for step in top), 3),
+            "commands": sum(step.commands for step in top),
+            "sleep_time": round(self.sleep_time, 3),
+            "wait_time": round(sum(step.wait for step in top), 3),
+            "methods": {
+                name: {key: round(value, 3) for key, value in entry.items()}
+                for name, entry in sorted(self.by_method().items(), key=lambda i: -i[1]["elapsed"])
+            },
+            "locators": sorted(
+                name for locator in self.locators for name in LOCATOR_NAMES.get(locator, ())
+            ),
+            "steps": [
+                {
+                    "name": step.name,
+                    "elapsed": round(step.elapsed, 3),
+                    "commands": step.commands,
+                    "sleep": round(step.sleep, 3),
+                    "wait": round(step.wait, 3)
+                }
+                for step in top
+            ],
+        })
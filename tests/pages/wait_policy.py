@@ -0,0 +1,105 @@
+"""
+Wait policy for page objects
+Gives every wait an explicit time budget and records how long it took
+"""
+from collections import namedtuple
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from config.config import Config
+import time
+
+
+WaitRecord = namedtuple("WaitRecord", ["operation", "locator", "budget", "elapsed", "satisfied"])
+
+
+class WaitPolicy:
+    """
+    Central wait policy for one WebDriver session
+    Implicit waits are disabled so they never compound with explicit waits;
+    each operation instead gets its own budget in seconds.
+    """
+    
+    # Operation -> Config attribute holding its budget
+    BUDGETS = {
+        "find": "EXPLICIT_WAIT",
+        "click": "EXPLICIT_WAIT",
+        "url": "EXPLICIT_WAIT",
+        "disappear": "EXPLICIT_WAIT",
+        "state": "STATE_WAIT",
+        "alert": "ALERT_WAIT",
+    }
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.records = []
+        driver.implicitly_wait(0)
+    
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the policy shared by all page objects of a driver"""
+        policy = getattr(driver, "_wait_policy", None)
+        if policy is None:
+            policy = cls(driver)
+            driver._wait_policy = policy
+        return policy
+    
+    def budget(self, operation):
+        """Get the default budget for an operation"""
+        return getattr(Config, self.BUDGETS.get(operation, "EXPLICIT_WAIT"))
+    
+    def until(self, condition, operation, locator=None, timeout=None):
+        """
+        Wait for a condition within the operation's budget
+        Args:
+            condition: Expected condition callable
+            operation: Operation name used to pick the budget and label the record
+            locator: Optional locator being waited on, for reporting
+            timeout: Optional custom budget
+        Raises:
+            TimeoutException: Condition not met within the budget
+        """
+        budget = timeout if timeout is not None else self.budget(operation)
+        wait = WebDriverWait(self.driver, budget, poll_frequency=Config.POLL_INTERVAL)
+        profiler = getattr(self.driver, "_locator_profiler", None) if locator else None
+        if profiler is not None:
+            condition = profiler.timed(locator, condition)
+        start = time.perf_counter()
+        satisfied = False
+        try:
+            result = wait.until(condition)
+            satisfied = True
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            self.records.append(WaitRecord(operation, locator, budget, elapsed, satisfied))
+            if profiler is not None:
+                profiler.record_wait(locator, elapsed, satisfied)
+    
+    def record(self, operation, locator, budget, elapsed, satisfied):
+        """Record a wait that was not run through until()"""
+        self.records.append(WaitRecord(operation, locator, budget, elapsed, satisfied))
+    
+    def check(self, condition, operation, locator=None, timeout=None):
+        """Same as until() but returns False instead of raising on timeout"""
+        try:
+            return self.until(condition, operation, locator, timeout)
+        except TimeoutException:
+            return False
+    
+    def total_wait_time(self):
+        """Total seconds spent waiting since the last reset"""
+        return sum(record.elapsed for record in self.records)
+    
+    def summary(self, limit=5):
+        """Get a one-line report of the slowest waits"""
+        slowest = sorted(self.records, key=lambda r: r.elapsed, reverse=True)[:limit]
+        details = ", ".join(
+            f"{r.operation} {r.locator[1] if r.locator else ''} "
+            f"{r.elapsed:.2f}s/{r.budget}s{'' if r.satisfied else ' (timeout)'}"
+            for r in slowest
+        )
+        return f"{len(self.records)} waits, {self.total_wait_time():.2f}s total. Slowest: {details}"
+    
+    def reset(self):
+        """Clear recorded timings"""
+        self.records = []
@@ -0,0 +1,7 @@
+from .server import StandInServer
+from .state import AppState
+
+__all__ = [
+    'StandInServer',
+    'AppState'
+]
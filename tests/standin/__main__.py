@@ -0,0 +1,29 @@
+"""
+Run the stand-in app on its own
+Usage: python -m standin [--port 7000] [--latency-ms 0]
+"""
+import argparse
+import logging
+from standin.server import StandInServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in Golden Fork app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--latency-ms", type=int, default=None, help="Delay added to every response")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    server = StandInServer(args.host, args.port, args.latency_ms)
+    print(f"Stand-in app running on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
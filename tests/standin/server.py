@@ -0,0 +1,332 @@
+"""
+Stand-in Golden Fork server
+A small threaded HTTP server serving the login, register and menu pages
+plus the JSON API used by the seeding client, backed by in-memory state
+"""
+import json
+import logging
+import re
+import threading
+import time
+from http import cookies
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from config.config import Config
+from standin import templates
+from standin.state import AppState
+
+logger = logging.getLogger(__name__)
+
+
+SESSION_COOKIE = "gf_session"
+
+# Smallest valid GIF, served as favicon
+FAVICON = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00\x00\x00\x00"
+    b",\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes requests to page and API handlers"""
+    
+    protocol_version = "HTTP/1.1"
+    
+    # (method, path pattern, handler name)
+    ROUTES = [
+        ("GET", r"/", "redirect_home"),
+        ("GET", r"/favicon\.ico", "get_favicon"),
+        ("GET", r"/login", "get_login"),
+        ("GET", r"/register", "get_register"),
+        ("GET", r"/logout", "get_logout"),
+        ("GET", r"/menu", "get_menu"),
+        ("GET", r"/menu/(\d+)", "get_menu_details"),
+        ("POST", r"/api/auth/login", "api_login"),
+        ("POST", r"/api/auth/register", "api_register"),
+        ("POST", r"/api/auth/logout", "api_logout"),
+        ("GET", r"/api/menus", "api_list_menus"),
+        ("POST", r"/api/menus", "api_create_menu"),
+        ("GET", r"/api/menus/(\d+)", "api_get_menu"),
+        ("PUT", r"/api/menus/(\d+)", "api_update_menu"),
+        ("DELETE", r"/api/menus/(\d+)", "api_delete_menu"),
+        ("POST", r"/api/categories", "api_create_category"),
+        ("POST", r"/api/items", "api_create_item"),
+        ("GET", r"/api/users", "api_list_users"),
+        ("DELETE", r"/api/users/(\d+)", "api_delete_user"),
+    ]
+    
+    @property
+    def state(self):
+        return self.server.state
+    
+    def do_GET(self):
+        self.dispatch("GET")
+    
+    def do_POST(self):
+        self.dispatch("POST")
+    
+    def do_PUT(self):
+        self.dispatch("PUT")
+    
+    def do_DELETE(self):
+        self.dispatch("DELETE")
+    
+    def dispatch(self, method):
+        """Find the route for the request and call its handler"""
+        path = urlsplit(self.path).path.rstrip("/") or "/"
+        for route_method, pattern, handler in self.ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match and route_method == method:
+                if self.server.latency:
+                    time.sleep(self.server.latency)
+                getattr(self, handler)(*match.groups())
+                return
+        if path.startswith("/api/"):
+            self.send_json(404, {"error": "Not found"})
+        else:
+            self.send_html(templates.not_found_page(self.current_user()), status=404)
+    
+    # Response helpers
+    def send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_html(self, document, status=200, headers=None):
+        self.send_body(status, document.encode("utf-8"), "text/html; charset=utf-8", headers)
+    
+    def send_json(self, status, data, headers=None):
+        body = b"" if data is None else json.dumps(data).encode("utf-8")
+        self.send_body(status, body, "application/json", headers)
+    
+    def redirect(self, location, headers=None):
+        headers = dict(headers or {}, Location=location)
+        self.send_body(302, b"", "text/plain", headers)
+    
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+    
+    # Authentication helpers
+    def session_token(self):
+        """Session token from the cookie or the Authorization header"""
+        auth = self.headers.get("Authorization", "")
+        if auth.startswith("Bearer "):
+            return auth[len("Bearer "):]
+        jar = cookies.SimpleCookie(self.headers.get("Cookie", ""))
+        return jar[SESSION_COOKIE].value if SESSION_COOKIE in jar else None
+    
+    def current_user(self):
+        token = self.session_token()
+        return self.state.user_for(token) if token else None
+    
+    def require_user(self, admin=False):
+        """Return the logged in user or send 401/403 and return None"""
+        user = self.current_user()
+        if user is None:
+            self.send_json(401, {"error": "Authentication required"})
+            return None
+        if admin and user["role"] != "Admin":
+            self.send_json(403, {"error": "Admin role required"})
+            return None
+        return user
+    
+    # Pages
+    def redirect_home(self):
+        self.redirect("/menu" if self.current_user() else "/login")
+    
+    def get_favicon(self):
+        self.send_body(200, FAVICON, "image/gif")
+    
+    def get_login(self):
+        self.send_html(templates.login_page())
+    
+    def get_register(self):
+        self.send_html(templates.register_page())
+    
+    def get_logout(self):
+        token = self.session_token()
+        if token:
+            self.state.logout(token)
+        self.redirect("/login", {"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"})
+    
+    def get_menu(self):
+        user = self.current_user()
+        if user is None:
+            self.redirect("/login")
+            return
+        self.send_html(templates.menu_page(user))
+    
+    def get_menu_details(self, menu_id):
+        user = self.current_user()
+        if user is None:
+            self.redirect("/login")
+            return
+        menu = self.state.get_menu(int(menu_id))
+        if menu is None:
+            self.send_html(templates.not_found_page(user), status=404)
+            return
+        self.send_html(templates.menu_details_page(user, menu))
+    
+    # API
+    def api_login(self):
+        body = self.read_json()
+        token, user = self.state.login(body.get("email"), body.get("password"))
+        if token is None:
+            self.send_json(401, {"error": "Invalid email or password"})
+            return
+        cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax; Max-Age={self.state.session_ttl}"
+        self.send_json(200, {
+            "token": token,
+            "user": {"id": user["id"], "username": user["username"], "email": user["email"], "role": user["role"]}
+        }, {"Set-Cookie": cookie})
+    
+    def api_register(self):
+        body = self.read_json()
+        if body.get("confirmPassword", body.get("password")) != body.get("password"):
+            self.send_json(400, {"error": "Passwords do not match"})
+            return
+        user, error = self.state.register(
+            body.get("username"), body.get("email"), body.get("phone"), body.get("password")
+        )
+        if error:
+            self.send_json(409 if "already" in error else 400, {"error": error})
+            return
+        self.send_json(201, {"id": user["id"], "username": user["username"], "email": user["email"]})
+    
+    def api_logout(self):
+        token = self.session_token()
+        if token:
+            self.state.logout(token)
+        self.send_json(204, None)
+    
+    def api_list_menus(self):
+        if self.require_user():
+            self.send_json(200, self.state.list_menus())
+    
+    def api_get_menu(self, menu_id):
+        if not self.require_user():
+            return
+        menu = self.state.get_menu(int(menu_id))
+        if menu is None:
+            self.send_json(404, {"error": "Menu not found"})
+        else:
+            self.send_json(200, menu)
+    
+    def api_create_menu(self):
+        if not self.require_user(admin=True):
+            return
+        body = self.read_json()
+        menu, error = self.state.create_menu(body.get("name"), body.get("description"))
+        if error:
+            self.send_json(400, {"error": error})
+        else:
+            self.send_json(201, menu)
+    
+    def api_update_menu(self, menu_id):
+        if not self.require_user(admin=True):
+            return
+        body = self.read_json()
+        menu, error = self.state.update_menu(int(menu_id), body.get("name"), body.get("description"))
+        if error:
+            self.send_json(404 if error == "Menu not found" else 400, {"error": error})
+        else:
+            self.send_json(200, menu)
+    
+    def api_delete_menu(self, menu_id):
+        if not self.require_user(admin=True):
+            return
+        if self.state.delete_menu(int(menu_id)):
+            self.send_json(204, None)
+        else:
+            self.send_json(404, {"error": "Menu not found"})
+    
+    def api_create_category(self):
+        if not self.require_user(admin=True):
+            return
+        body = self.read_json()
+        category, error = self.state.create_category(body.get("menuId"), body.get("name"), body.get("description"))
+        if error:
+            self.send_json(400, {"error": error})
+        else:
+            self.send_json(201, category)
+    
+    def api_create_item(self):
+        if not self.require_user(admin=True):
+            return
+        body = self.read_json()
+        item, error = self.state.create_item(
+            body.get("categoryId"), body.get("name"), body.get("description"), body.get("price")
+        )
+        if error:
+            self.send_json(400, {"error": error})
+        else:
+            self.send_json(201, item)
+    
+    def api_list_users(self):
+        if self.require_user(admin=True):
+            self.send_json(200, self.state.list_users())
+    
+    def api_delete_user(self, user_id):
+        if not self.require_user(admin=True):
+            return
+        if self.state.delete_user(int(user_id)):
+            self.send_json(204, None)
+        else:
+            self.send_json(404, {"error": "User not found"})
+    
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Threaded stand-in app server
+    Usage:
+        server = StandInServer(latency_ms=50).start()
+        ... use server.url as BASE_URL ...
+        server.stop()
+    """
+    
+    daemon_threads = True
+    
+    def __init__(self, host="127.0.0.1", port=None, latency_ms=None):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+            latency_ms: Delay added to every response
+        """
+        port = Config.STANDIN_PORT if port is None else port
+        super().__init__((host, port), StandInHandler)
+        latency_ms = Config.STANDIN_LATENCY_MS if latency_ms is None else latency_ms
+        self.latency = latency_ms / 1000
+        self.state = AppState()
+        self.thread = None
+    
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """Serve requests in a background thread"""
+        self.thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self.thread.start()
+        logger.info(f"Stand-in app listening on {self.url}")
+        return self
+    
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,185 @@
+"""
+In-memory state of the stand-in Golden Fork app
+"""
+import secrets
+import threading
+import time
+from config.config import Config
+
+
+class AppState:
+    """Users, sessions, menus, categories and items held in memory"""
+    
+    def __init__(self, session_ttl=None):
+        self.session_ttl = session_ttl or Config.STANDIN_SESSION_TTL
+        self.lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Drop all data and recreate the configured accounts"""
+        with self.lock:
+            self.users = {}
+            self.sessions = {}
+            self.menus = {}
+            self.categories = {}
+            self.items = {}
+            self.next_id = 1
+        self.register(Config.TEST_USER_USERNAME, Config.TEST_USER_EMAIL, "+216 98 123 456",
+                      Config.TEST_USER_PASSWORD)
+        self.register(Config.ADMIN_USER_USERNAME, Config.ADMIN_USER_EMAIL, "+216 98 987 654",
+                      Config.ADMIN_USER_PASSWORD, role="Admin")
+    
+    def _new_id(self):
+        """Get the next entity id (caller holds the lock)"""
+        new_id = self.next_id
+        self.next_id += 1
+        return new_id
+    
+    # Users and sessions
+    def register(self, username, email, phone, password, role="Customer"):
+        """
+        Create a user account
+        Returns:
+            (user, error) - error is None on success
+        """
+        if not username or not email or not phone or not password:
+            return None, "All fields are required"
+        if len(password) < 6:
+            return None, "Password must be at least 6 characters"
+        with self.lock:
+            if email.lower() in self.users:
+                return None, "Email is already registered"
+            if any(user["username"] == username for user in self.users.values()):
+                return None, "Username is already taken"
+            user = {
+                "id": self._new_id(),
+                "username": username,
+                "email": email,
+                "phone": phone,
+                "password": password,
+                "role": role
+            }
+            self.users[email.lower()] = user
+        return user, None
+    
+    def list_users(self):
+        """All users without their passwords"""
+        return [
+            {key: value for key, value in user.items() if key != "password"}
+            for user in self.users.values()
+        ]
+    
+    def delete_user(self, user_id):
+        """Delete a user by id, returns False if it does not exist"""
+        with self.lock:
+            for email, user in list(self.users.items()):
+                if user["id"] == user_id:
+                    del self.users[email]
+                    return True
+        return False
+    
+    def login(self, email, password):
+        """Check credentials and open a session, returns (token, user) or (None, None)"""
+        user = self.users.get((email or "").lower())
+        if user is None or user["password"] != password:
+            return None, None
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[token] = (user["email"].lower(), time.time() + self.session_ttl)
+        return token, user
+    
+    def logout(self, token):
+        """Close a session"""
+        with self.lock:
+            self.sessions.pop(token, None)
+    
+    def user_for(self, token):
+        """Get the user of a live session, or None"""
+        session = self.sessions.get(token)
+        if session is None:
+            return None
+        email, expires_at = session
+        if expires_at < time.time():
+            self.logout(token)
+            return None
+        return self.users.get(email)
+    
+    # Menus
+    def list_menus(self):
+        """All menus in creation order"""
+        return [self._public_menu(menu) for menu in self.menus.values()]
+    
+    def get_menu(self, menu_id):
+        """Menu with its categories and items, or None"""
+        menu = self.menus.get(menu_id)
+        if menu is None:
+            return None
+        data = self._public_menu(menu)
+        data["categories"] = [
+            dict(category, items=[item for item in self.items.values() if item["categoryId"] == category["id"]])
+            for category in self.categories.values() if category["menuId"] == menu_id
+        ]
+        return data
+    
+    def create_menu(self, name, description):
+        """Create a menu, returns (menu, error)"""
+        if not (name or "").strip():
+            return None, "Menu name is required"
+        with self.lock:
+            menu = {"id": self._new_id(), "name": name.strip(), "description": description or ""}
+            self.menus[menu["id"]] = menu
+        return self._public_menu(menu), None
+    
+    def update_menu(self, menu_id, name, description):
+        """Update a menu, returns (menu, error)"""
+        if menu_id not in self.menus:
+            return None, "Menu not found"
+        if not (name or "").strip():
+            return None, "Menu name is required"
+        with self.lock:
+            menu = self.menus[menu_id]
+            menu["name"] = name.strip()
+            menu["description"] = description or ""
+        return self._public_menu(menu), None
+    
+    def delete_menu(self, menu_id):
+        """Delete a menu with its categories and items"""
+        with self.lock:
+            if self.menus.pop(menu_id, None) is None:
+                return False
+            category_ids = [c["id"] for c in self.categories.values() if c["menuId"] == menu_id]
+            for category_id in category_ids:
+                del self.categories[category_id]
+            for item_id in [i["id"] for i in self.items.values() if i["categoryId"] in category_ids]:
+                del self.items[item_id]
+        return True
+    
+    # Categories and items
+    def create_category(self, menu_id, name, description):
+        """Create a category, returns (category, error)"""
+        if menu_id not in self.menus:
+            return None, "Menu not found"
+        with self.lock:
+            category = {"id": self._new_id(), "menuId": menu_id, "name": name, "description": description or ""}
+            self.categories[category["id"]] = category
+        return category, None
+    
+    def create_item(self, category_id, name, description, price):
+        """Create an item, returns (item, error)"""
+        if category_id not in self.categories:
+            return None, "Category not found"
+        with self.lock:
+            item = {
+                "id": self._new_id(),
+                "categoryId": category_id,
+                "name": name,
+                "description": description or "",
+                "price": price
+            }
+            self.items[item["id"]] = item
+        return item, None
+    
+    @staticmethod
+    def _public_menu(menu):
+        """Menu fields exposed by the API"""
+        return {"id": menu["id"], "name": menu["name"], "description": menu["description"]}
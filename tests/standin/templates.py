@@ -0,0 +1,349 @@
+"""
+HTML for the stand-in Golden Fork app
+The markup follows the DOM contracts located by LoginPage, RegisterPage
+and MenuPage (classes, placeholders, button texts and dialogs)
+"""
+import html
+import json
+
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; background: #faf7f0; }
+.container { max-width: 960px; margin: 0 auto; padding: 24px; }
+.navbar { display: flex; justify-content: space-between; padding: 12px 24px; background: #222; }
+.navbar a { color: #f5c542; margin-left: 12px; }
+input, textarea { display: block; width: 100%; margin: 4px 0 12px; padding: 8px; box-sizing: border-box; }
+.btn { padding: 8px 16px; cursor: pointer; }
+.alert { padding: 12px; margin: 12px 0; border-radius: 4px; }
+.alert-error { background: #fdd; color: #900; }
+.alert-success { background: #dfd; color: #060; }
+.text-red-500 { color: #e33; font-size: 0.9em; margin: -8px 0 8px; }
+.grid { display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px; }
+.card { position: relative; background: #fff; border-radius: 8px; box-shadow: 0 1px 4px #0002; }
+.card-body { padding: 16px; }
+.card-title { margin: 0 0 8px; }
+.dropdown { position: absolute; top: 8px; right: 8px; }
+.dropdown label { cursor: pointer; padding: 4px 8px; }
+.dropdown-content { display: none; position: absolute; right: 0; background: #fff; list-style: none;
+    padding: 8px; margin: 0; box-shadow: 0 1px 4px #0003; z-index: 5; }
+.dropdown:focus-within .dropdown-content { display: block; }
+.dropdown-content a { display: block; padding: 4px 12px; cursor: pointer; }
+.modal { position: fixed; inset: 0; background: #0006; display: flex; align-items: center; justify-content: center; }
+.modal-box { background: #fff; padding: 24px; border-radius: 8px; width: 480px; }
+.loading-spinner { width: 24px; height: 24px; border: 3px solid #ccc; border-top-color: #333;
+    border-radius: 50%; animation: spin 1s linear infinite; }
+@keyframes spin { to { transform: rotate(360deg); } }
+"""
+
+COMMON_SCRIPT = """
+function esc(value) {
+    return String(value == null ? '' : value).replace(/[&<>"']/g, function (c) {
+        return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+    });
+}
+function api(method, url, body) {
+    var options = {method: method, credentials: 'same-origin', headers: {}};
+    if (body !== undefined) {
+        options.headers['Content-Type'] = 'application/json';
+        options.body = JSON.stringify(body);
+    }
+    return fetch(url, options).then(function (response) {
+        return response.text().then(function (text) {
+            return {ok: response.ok, status: response.status, data: text ? JSON.parse(text) : null};
+        });
+    });
+}
+function alertBox(kind, message) {
+    return '<div class="alert alert-' + kind + '"><span>' + esc(message) + '</span></div>';
+}
+"""
+
+LOGIN_BODY = """
+<div class="container">
+    <h1>Welcome Back</h1>
+    <div id="alerts"></div>
+    <form id="login-form" novalidate>
+        <label>Email</label>
+        <input type="text" id="email" placeholder="you@example.com">
+        <label>Password</label>
+        <input type="password" id="password" placeholder="••••••••">
+        <button type="submit" class="btn">Login</button>
+    </form>
+    <p>Don't have an account? <a href="/register">Register</a></p>
+</div>
+"""
+
+LOGIN_SCRIPT = """
+var alerts = document.getElementById('alerts');
+if (location.search.indexOf('registered=1') !== -1) {
+    alerts.innerHTML = alertBox('success', 'Registration successful, please log in');
+}
+document.getElementById('login-form').addEventListener('submit', function (e) {
+    e.preventDefault();
+    var email = document.getElementById('email').value.trim();
+    var password = document.getElementById('password').value;
+    if (!email || !password) {
+        alerts.innerHTML = alertBox('error', 'Email and password are required');
+        return;
+    }
+    api('POST', '/api/auth/login', {email: email, password: password}).then(function (r) {
+        if (r.ok) {
+            localStorage.setItem('gf_token', r.data.token);
+            location.href = '/menu';
+        } else {
+            alerts.innerHTML = alertBox('error', 'Invalid email or password');
+        }
+    });
+});
+"""
+
+REGISTER_BODY = """
+<div class="container">
+    <h1>Create Account</h1>
+    <div id="alerts"></div>
+    <form id="register-form" novalidate>
+        <div>
+            <label>Username</label>
+            <input type="text" id="username" placeholder="johndoe">
+            <div data-error-for="username"></div>
+        </div>
+        <div>
+            <label>Email</label>
+            <input type="text" id="email" placeholder="john@example.com">
+            <div data-error-for="email"></div>
+        </div>
+        <div>
+            <label>Phone</label>
+            <input type="text" id="phone" placeholder="+216 XX XXX XXX">
+            <div data-error-for="phone"></div>
+        </div>
+        <div>
+            <label>Password</label>
+            <input type="password" id="password" placeholder="••••••••">
+            <div data-error-for="password"></div>
+            <label>Confirm Password</label>
+            <input type="password" id="confirm" placeholder="••••••••">
+            <div data-error-for="confirm"></div>
+        </div>
+        <button type="submit" class="btn">Register</button>
+    </form>
+    <p>Already have an account? <a href="/login">Login</a></p>
+</div>
+"""
+
+REGISTER_SCRIPT = """
+function value(id) { return document.getElementById(id).value; }
+function validate(form) {
+    var errors = {};
+    if (form.username.length < 3 || form.username.length > 50) {
+        errors.username = 'Username must be between 3 and 50 characters';
+    }
+    if (!/^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$/.test(form.email)) { errors.email = 'Enter a valid email address'; }
+    if (!form.phone.trim()) { errors.phone = 'Phone number is required'; }
+    if (form.password.length < 6) { errors.password = 'Password must be at least 6 characters'; }
+    if (form.password !== form.confirmPassword) { errors.confirm = 'Passwords do not match'; }
+    return errors;
+}
+document.getElementById('register-form').addEventListener('submit', function (e) {
+    e.preventDefault();
+    var form = {
+        username: value('username'), email: value('email'), phone: value('phone'),
+        password: value('password'), confirmPassword: value('confirm')
+    };
+    var errors = validate(form);
+    document.querySelectorAll('[data-error-for]').forEach(function (slot) {
+        var message = errors[slot.getAttribute('data-error-for')];
+        slot.innerHTML = message ? '<p class="text-red-500">' + esc(message) + '</p>' : '';
+    });
+    var alerts = document.getElementById('alerts');
+    alerts.innerHTML = '';
+    if (Object.keys(errors).length) { return; }
+    api('POST', '/api/auth/register', form).then(function (r) {
+        if (r.ok) {
+            location.href = '/login?registered=1';
+        } else {
+            alerts.innerHTML = alertBox('error', (r.data && r.data.error) || 'Registration failed');
+        }
+    });
+});
+"""
+
+MENU_BODY = """
+<div class="container">
+    <h1>Our Menus</h1>
+    <div id="toolbar"></div>
+    <div id="menus"></div>
+    <div id="modal-root"></div>
+</div>
+"""
+
+MENU_SCRIPT = """
+var isAdmin = window.GF_USER && window.GF_USER.role === 'Admin';
+var menus = [];
+var editing = null;
+
+if (isAdmin) {
+    document.getElementById('toolbar').innerHTML =
+        '<button class="btn btn-primary" id="add-menu">+ Add New Menu</button>';
+    document.getElementById('add-menu').addEventListener('click', function () { openModal(null); });
+}
+
+function card(menu, index) {
+    var options = isAdmin
+        ? '<div class="dropdown dropdown-end"><label tabindex="0">&#8942;</label>'
+          + '<ul tabindex="0" class="dropdown-content">'
+          + '<li><a data-action="edit" data-index="' + index + '">Edit</a></li>'
+          + '<li><a data-action="delete" data-index="' + index + '">Delete</a></li></ul></div>'
+        : '';
+    return '<div class="card"><div class="card-body">'
+        + '<h2 class="card-title">' + esc(menu.name) + '</h2>'
+        + '<p>' + esc(menu.description) + '</p>'
+        + '<div class="card-actions"><a class="btn" href="/menu/' + menu.id + '">View Menu</a></div>'
+        + '</div>' + options + '</div>';
+}
+
+function renderList() {
+    var root = document.getElementById('menus');
+    if (!menus.length) {
+        root.innerHTML = '<p class="empty">No menus available at the moment.</p>';
+        return;
+    }
+    root.innerHTML = '<div class="grid">' + menus.map(card).join('') + '</div>';
+}
+
+function loadMenus() {
+    document.getElementById('menus').innerHTML = '<div class="loading-spinner"></div>';
+    return api('GET', '/api/menus').then(function (r) {
+        if (r.status === 401) { location.href = '/login'; return; }
+        menus = r.data || [];
+        renderList();
+    });
+}
+
+function openModal(menu) {
+    editing = menu;
+    document.getElementById('modal-root').innerHTML =
+        '<div class="modal modal-open"><div class="modal-box">'
+        + '<h3>' + (menu ? 'Edit Menu' : 'Add New Menu') + '</h3>'
+        + '<div id="modal-alert"></div>'
+        + '<label>Name</label><input type="text" id="menu-name" value="' + esc(menu ? menu.name : '') + '">'
+        + '<label>Description</label><textarea id="menu-description">' + esc(menu ? menu.description : '') + '</textarea>'
+        + '<div class="modal-action"><button class="btn" id="modal-cancel">Cancel</button>'
+        + '<button class="btn btn-primary" id="modal-save">Save</button></div>'
+        + '</div></div>';
+    document.getElementById('modal-cancel').addEventListener('click', closeModal);
+    document.getElementById('modal-save').addEventListener('click', saveMenu);
+}
+
+function closeModal() {
+    editing = null;
+    document.getElementById('modal-root').innerHTML = '';
+}
+
+function saveMenu() {
+    var body = {
+        name: document.getElementById('menu-name').value,
+        description: document.getElementById('menu-description').value
+    };
+    var alertSlot = document.getElementById('modal-alert');
+    if (!body.name.trim()) {
+        alertSlot.innerHTML = alertBox('error', 'Menu name is required');
+        return;
+    }
+    var request = editing ? api('PUT', '/api/menus/' + editing.id, body) : api('POST', '/api/menus', body);
+    request.then(function (r) {
+        if (!r.ok) {
+            alertSlot.innerHTML = alertBox('error', (r.data && r.data.error) || 'Failed to save menu');
+            return;
+        }
+        closeModal();
+        return loadMenus();
+    });
+}
+
+document.getElementById('menus').addEventListener('click', function (e) {
+    var action = e.target.getAttribute('data-action');
+    if (!action) { return; }
+    var menu = menus[Number(e.target.getAttribute('data-index'))];
+    document.activeElement.blur();
+    if (action === 'edit') {
+        openModal(menu);
+    } else if (confirm('Are you sure you want to delete "' + menu.name + '"?')) {
+        api('DELETE', '/api/menus/' + menu.id).then(function (r) {
+            alert(r.ok ? 'Menu deleted successfully' : 'Failed to delete menu');
+            return loadMenus();
+        });
+    }
+});
+
+loadMenus();
+"""
+
+
+def page(title, body, script="", user=None):
+    """Render a full HTML document"""
+    navbar = ""
+    if user is not None:
+        navbar = (
+            '<div class="navbar"><span style="color:#fff">The Golden Fork</span>'
+            f'<span><a href="/menu">Menus</a><a href="/logout">Logout ({html.escape(user["username"])})</a></span></div>'
+        )
+    public_user = None if user is None else {"username": user["username"], "role": user["role"]}
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)} - The Golden Fork</title>
+<link rel="icon" href="/favicon.ico">
+<style>{STYLE}</style>
+</head>
+<body>
+{navbar}
+{body}
+<script>
+window.GF_USER = {json.dumps(public_user)};
+{COMMON_SCRIPT}
+{script}
+</script>
+</body>
+</html>"""
+
+
+def login_page():
+    """Login page"""
+    return page("Login", LOGIN_BODY, LOGIN_SCRIPT)
+
+
+def register_page():
+    """Registration page"""
+    return page("Register", REGISTER_BODY, REGISTER_SCRIPT)
+
+
+def menu_page(user):
+    """Menu listing page"""
+    return page("Menus", MENU_BODY, MENU_SCRIPT, user)
+
+
+def menu_details_page(user, menu):
+    """Menu details page with categories and items"""
+    categories = "".join(
+        f'<div class="card"><div class="card-body"><h2 class="card-title">{html.escape(category["name"])}</h2>'
+        f'<p>{html.escape(category["description"])}</p><ul>'
+        + "".join(
+            f'<li>{html.escape(item["name"])} - {item["price"]}</li>' for item in category["items"]
+        )
+        + "</ul></div></div>"
+        for category in menu["categories"]
+    ) or "<p>No categories in this menu yet.</p>"
+    body = (
+        f'<div class="container"><h1>{html.escape(menu["name"])}</h1>'
+        f'<p>{html.escape(menu["description"])}</p>'
+        f'<div class="grid">{categories}</div>'
+        '<p><a href="/menu">Back to menus</a></p></div>'
+    )
+    return page(menu["name"], body, user=user)
+
+
+def not_found_page(user=None):
+    """404 page"""
+    return page("Not Found", '<div class="container"><h1>Page not found</h1></div>', user=user)
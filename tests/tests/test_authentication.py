@@ -14,7 +14,7 @@ import pytest
 from pages.login_page import LoginPage
 from pages.register_page import RegisterPage
 from pages.menu_page import MenuPage
-from data.test_data import TestData, INVALID_EMAILS, INVALID_PASSWORDS, BOUNDARY_VALUES
+from data.test_data import INVALID_EMAILS, INVALID_PASSWORDS, BOUNDARY_VALUES
 
 
 @pytest.mark.authentication
@@ -23,7 +23,7 @@ from data.test_data import TestData, INVALID_EMAILS, INVALID_PASSWORDS, BOUNDARY
 class TestAuthentication:
     """Authentication workflow test cases"""
     
-    def test_TC001_valid_login(self, browser, base_url, test_user_credentials):
+    def test_TC001_valid_login(self, browser, base_url, worker_user_credentials):
         """
         TC001: Login with valid credentials
         
@@ -37,8 +37,8 @@ class TestAuthentication:
         # Act
         login_page.navigate()
         login_page.login(
-            test_user_credentials['email'],
-            test_user_credentials['password']
+            worker_user_credentials['email'],
+            worker_user_credentials['password']
         )
         
         # Assert
@@ -113,7 +113,7 @@ class TestAuthentication:
         assert login_page.is_on_login_page(), "Should remain on login page"
     
     @pytest.mark.regression
-    def test_TC005_valid_registration(self, browser, base_url):
+    def test_TC005_valid_registration(self, browser, base_url, unique_user):
         """
         TC005: Register new user with valid data
         
@@ -123,12 +123,7 @@ class TestAuthentication:
         """
         # Arrange
         register_page = RegisterPage(browser)
-        test_user = {
-            "username": TestData.generate_random_username(),
-            "email": TestData.generate_random_email(),
-            "phone": "+216 98 " + str(TestData.fake.random_number(digits=6, fix_len=True)),
-            "password": "TestPass123!"
-        }
+        test_user = unique_user(password="TestPass123!")
         
         # Act
         register_page.navigate()
@@ -147,7 +142,7 @@ class TestAuthentication:
         assert is_redirected or has_success, \
             "Should show success message or redirect to login page"
     
-    def test_TC006_password_mismatch_registration(self, browser, base_url):
+    def test_TC006_password_mismatch_registration(self, browser, base_url, unique_user):
         """
         TC006: Register with non-matching passwords
         
@@ -157,13 +152,14 @@ class TestAuthentication:
         """
         # Arrange
         register_page = RegisterPage(browser)
+        test_user = unique_user()
         
         # Act
         register_page.navigate()
         register_page.register(
-            username=TestData.generate_random_username(),
-            email=TestData.generate_random_email(),
-            phone="+216 98 123 456",
+            username=test_user['username'],
+            email=test_user['email'],
+            phone=test_user['phone'],
             password="TestPass123!",
             confirm_password="DifferentPass123!"
         )
@@ -174,7 +170,7 @@ class TestAuthentication:
         assert len(validation_errors) > 0 or register_page.is_error_displayed(), \
             "Should show validation error for password mismatch"
     
-    def test_TC007_registration_short_password(self, browser, base_url):
+    def test_TC007_registration_short_password(self, browser, base_url, unique_user):
         """
         TC007: Register with password below minimum length
         
@@ -185,13 +181,14 @@ class TestAuthentication:
         # Arrange
         register_page = RegisterPage(browser)
         short_password = BOUNDARY_VALUES['password_below_min']
+        test_user = unique_user()
         
         # Act
         register_page.navigate()
         register_page.register(
-            username=TestData.generate_random_username(),
-            email=TestData.generate_random_email(),
-            phone="+216 98 123 456",
+            username=test_user['username'],
+            email=test_user['email'],
+            phone=test_user['phone'],
             password=short_password
         )
         
@@ -237,7 +234,7 @@ class TestAuthentication:
         assert "/login" in browser.current_url, "Should navigate to login page"
     
     @pytest.mark.e2e
-    def test_TC010_complete_registration_and_login_flow(self, browser, base_url):
+    def test_TC010_complete_registration_and_login_flow(self, browser, base_url, unique_user):
         """
         TC010: End-to-end registration and login workflow
         
@@ -248,12 +245,7 @@ class TestAuthentication:
         # Arrange
         register_page = RegisterPage(browser)
         login_page = LoginPage(browser)
-        test_user = {
-            "username": TestData.generate_random_username(),
-            "email": TestData.generate_random_email(),
-            "phone": "+216 98 " + str(TestData.fake.random_number(digits=6, fix_len=True)),
-            "password": "CompleteFlow123!"
-        }
+        test_user = unique_user(password="CompleteFlow123!")
         
         # Act - Register
         register_page.navigate()
@@ -265,7 +257,7 @@ class TestAuthentication:
         )
         
         # Wait for redirect or success
-        browser.implicitly_wait(3)
+        register_page.wait_for_app_idle()
         
         # Act - Login with new credentials
         login_page.navigate()
@@ -21,7 +21,7 @@ class TestEndToEnd:
     """End-to-end scenario test cases"""
     
     @pytest.mark.slow
-    def test_TC019_complete_customer_registration_and_menu_browsing(self, browser, base_url):
+    def test_TC019_complete_customer_registration_and_menu_browsing(self, browser, base_url, unique_user):
         """
         TC019: Complete customer journey - Register, Login, Browse Menus
         
@@ -38,12 +38,7 @@ class TestEndToEnd:
         login_page = LoginPage(browser)
         menu_page = MenuPage(browser)
         
-        test_user = {
-            "username": TestData.generate_random_username(),
-            "email": TestData.generate_random_email(),
-            "phone": "+216 98 " + str(TestData.fake.random_number(digits=6, fix_len=True)),
-            "password": "E2ETest123!"
-        }
+        test_user = unique_user(password="E2ETest123!")
         
         # Step 1: Register new account
         register_page.navigate()
@@ -57,7 +52,7 @@ class TestEndToEnd:
         )
         
         # Wait for registration to complete
-        browser.implicitly_wait(3)
+        register_page.wait_for_app_idle()
         
         # Step 2: Login with new credentials
         login_page.navigate()
@@ -73,14 +68,16 @@ class TestEndToEnd:
         assert "Menu" in page_heading, "Menu page should display proper heading"
         
         # Check menus are displayed or no menus message
-        has_menus = menu_page.get_menu_count() > 0
-        no_menus = menu_page.is_no_menus_message_displayed()
-        assert has_menus or no_menus, "Should display menus or 'no menus' message"
+        menu_page.wait_for_menu_list()
+        snapshot = menu_page.snapshot()
+        assert snapshot.menu_count > 0 or snapshot.no_menus_displayed, \
+            "Should display menus or 'no menus' message"
         
         print(f"✓ E2E Flow Complete: Registered user '{test_user['username']}', logged in, and browsed menus")
     
     @pytest.mark.slow
-    def test_TC020_admin_complete_menu_management_workflow(self, browser, admin_user_credentials):
+    def test_TC020_admin_complete_menu_management_workflow(self, browser, login_as, data_namespace,
+                                                           cleanup_registry):
         """
         TC020: Complete admin workflow - Login, Create Menu, Edit Menu
         
@@ -93,11 +90,10 @@ class TestEndToEnd:
         and edit it to update information
         """
         # Arrange
-        login_page = LoginPage(browser)
-        menu_page = MenuPage(browser)
+        menu_page = MenuPage(browser, namespace=data_namespace)
         
         new_menu = {
-            "name": "E2E Test Menu " + str(TestData.fake.random_number(digits=4)),
+            "name": data_namespace.name("E2E Test Menu " + str(TestData.generate_random_number(digits=4))),
             "description": "Created during E2E testing"
         }
         
@@ -107,12 +103,7 @@ class TestEndToEnd:
         }
         
         # Step 1: Login as admin
-        login_page.navigate()
-        login_page.login(
-            admin_user_credentials['email'],
-            admin_user_credentials['password']
-        )
-        login_page.wait_for_login_success()
+        login_as("admin")
         
         # Step 2: Navigate to menus
         menu_page.navigate()
@@ -126,23 +117,21 @@ class TestEndToEnd:
         assert menu_page.is_modal_open(), "Create menu modal should open"
         
         menu_page.create_menu(new_menu['name'], new_menu['description'])
-        menu_page.wait(3)
+        cleanup_registry.track_menu(name=new_menu['name'])
+        menu_page.wait_for_app_idle()
         
         # Verify creation
         menu_page.navigate()
         assert menu_page.get_menu_count() > initial_count, "New menu should be created"
-        assert new_menu['name'] in menu_page.get_menu_titles(), "New menu should appear in list"
+        assert menu_page.has_card(new_menu['name']), "New menu should appear in list"
         
         # Step 4: Edit the created menu
-        # Find the index of our newly created menu
-        menu_titles = menu_page.get_menu_titles()
-        menu_index = menu_titles.index(new_menu['name']) if new_menu['name'] in menu_titles else 0
-        
-        menu_page.click_edit_menu(menu_index)
+        menu_page.card(new_menu['name']).click_edit()
         assert menu_page.is_modal_open(), "Edit menu modal should open"
         
         menu_page.edit_menu_details(updated_menu['name'], updated_menu['description'])
-        menu_page.wait(3)
+        cleanup_registry.track_menu(name=updated_menu['name'])
+        menu_page.wait_for_app_idle()
         
         # Verify update
         menu_page.navigate()
@@ -150,7 +139,7 @@ class TestEndToEnd:
         
         print(f"✓ E2E Admin Flow Complete: Created and updated menu '{updated_menu['name']}'")
     
-    def test_TC021_login_to_menu_navigation_workflow(self, browser, test_user_credentials):
+    def test_TC021_login_to_menu_navigation_workflow(self, browser, worker_user_credentials):
         """
         TC021: Login and navigate through menu structure
         
@@ -165,8 +154,8 @@ class TestEndToEnd:
         # Step 1: Login
         login_page.navigate()
         login_page.login(
-            test_user_credentials['email'],
-            test_user_credentials['password']
+            worker_user_credentials['email'],
+            worker_user_credentials['password']
         )
         login_page.wait_for_login_success()
         
@@ -176,7 +165,7 @@ class TestEndToEnd:
         # Step 3: If menus exist, navigate to one
         if menu_page.get_menu_count() > 0:
             menu_page.click_view_menu(0)
-            menu_page.wait(2)
+            menu_page.wait_for_app_idle()
             
             # Verify navigation
             current_url = menu_page.get_current_url()
@@ -10,7 +10,6 @@ Techniques Used:
 - Decision Table Testing (CRUD operations)
 """
 import pytest
-from pages.login_page import LoginPage
 from pages.menu_page import MenuPage
 from data.test_data import TestData, TEST_MENUS
 
@@ -21,15 +20,17 @@ class TestMenuWorkflow:
     """Menu management workflow test cases"""
     
     @pytest.fixture(autouse=True)
-    def setup(self, browser, admin_user_credentials):
+    def setup(self, login_as):
         """Login as admin before each test"""
-        login_page = LoginPage(browser)
-        login_page.navigate()
-        login_page.login(
-            admin_user_credentials['email'],
-            admin_user_credentials['password']
-        )
-        login_page.wait_for_login_success(timeout=10)
+        login_as("admin")
+    
+    @pytest.fixture
+    def own_menu(self, seed_client, data_namespace, cleanup_registry):
+        """Seed a menu owned by this worker through the API, return its name"""
+        name = data_namespace.name(TestData.generate_menu_name())
+        menu = seed_client.create_menu(name, TestData.generate_menu_description())
+        cleanup_registry.track_menu(name=name, menu_id=(menu or {}).get("id"))
+        return name
     
     @pytest.mark.smoke
     def test_TC011_view_menu_list_as_authenticated_user(self, browser):
@@ -51,12 +52,13 @@ class TestMenuWorkflow:
         assert menu_page.get_page_heading() == "Our Menus", "Page heading should be 'Our Menus'"
         
         # Either menus are displayed or "no menus" message
-        has_menus = menu_page.get_menu_count() > 0
-        no_menus_msg = menu_page.is_no_menus_message_displayed()
-        assert has_menus or no_menus_msg, "Should display menus or 'no menus' message"
+        menu_page.wait_for_menu_list()
+        snapshot = menu_page.snapshot()
+        assert snapshot.menu_count > 0 or snapshot.no_menus_displayed, \
+            "Should display menus or 'no menus' message"
     
     @pytest.mark.regression
-    def test_TC012_admin_add_new_menu(self, browser):
+    def test_TC012_admin_add_new_menu(self, browser, data_namespace, cleanup_registry):
         """
         TC012: Admin creates new menu
         
@@ -65,9 +67,9 @@ class TestMenuWorkflow:
         Expected Result: New menu created successfully
         """
         # Arrange
-        menu_page = MenuPage(browser)
+        menu_page = MenuPage(browser, namespace=data_namespace)
         new_menu = {
-            "name": TestData.generate_menu_name(),
+            "name": data_namespace.name(TestData.generate_menu_name()),
             "description": TestData.generate_menu_description()
         }
         
@@ -83,9 +85,10 @@ class TestMenuWorkflow:
         assert "Add New Menu" in menu_page.get_modal_title(), "Modal title should indicate adding"
         
         menu_page.create_menu(new_menu['name'], new_menu['description'])
+        cleanup_registry.track_menu(name=new_menu['name'])
         
         # Wait for modal to close and page to refresh
-        menu_page.wait(3)
+        menu_page.wait_for_app_idle()
         
         # Assert
         menu_page.navigate()  # Refresh to see new menu
@@ -96,7 +99,7 @@ class TestMenuWorkflow:
         assert new_menu['name'] in menu_titles, f"New menu '{new_menu['name']}' should appear in list"
     
     @pytest.mark.regression
-    def test_TC013_admin_edit_existing_menu(self, browser):
+    def test_TC013_admin_edit_existing_menu(self, browser, data_namespace, own_menu):
         """
         TC013: Admin edits existing menu
         
@@ -105,18 +108,15 @@ class TestMenuWorkflow:
         Expected Result: Menu updated successfully
         """
         # Arrange
-        menu_page = MenuPage(browser)
+        menu_page = MenuPage(browser, namespace=data_namespace)
         updated_data = {
-            "name": "Updated Menu " + str(TestData.fake.random_number(digits=4)),
+            "name": data_namespace.name("Updated Menu " + str(TestData.generate_random_number(digits=4))),
             "description": "Updated description - " + TestData.generate_random_text(50)
         }
         
         # Act
         menu_page.navigate()
-        
-        # Skip if no menus
-        if menu_page.get_menu_count() == 0:
-            pytest.skip("No menus available to edit")
+        assert menu_page.get_menu_count() > 0, "Worker should own a menu to edit"
         
         menu_page.click_edit_menu(menu_index=0)
         assert menu_page.is_modal_open(), "Edit modal should open"
@@ -125,14 +125,14 @@ class TestMenuWorkflow:
         menu_page.edit_menu_details(updated_data['name'], updated_data['description'])
         
         # Wait for save
-        menu_page.wait(3)
+        menu_page.wait_for_app_idle()
         
         # Assert
         menu_page.navigate()  # Refresh
         menu_titles = menu_page.get_menu_titles()
         assert updated_data['name'] in menu_titles, "Updated menu name should appear in list"
     
-    def test_TC014_admin_delete_menu_with_confirmation(self, browser):
+    def test_TC014_admin_delete_menu_with_confirmation(self, browser, data_namespace, own_menu):
         """
         TC014: Admin deletes menu with confirmation
         
@@ -141,21 +141,19 @@ class TestMenuWorkflow:
         Expected Result: Menu deleted after confirmation
         """
         # Arrange
-        menu_page = MenuPage(browser)
+        menu_page = MenuPage(browser, namespace=data_namespace)
         
         # Act
         menu_page.navigate()
         
-        # Skip if no menus
         initial_count = menu_page.get_menu_count()
-        if initial_count == 0:
-            pytest.skip("No menus available to delete")
+        assert initial_count > 0, "Worker should own a menu to delete"
         
         menu_page.click_delete_menu(menu_index=0)
         
         # Confirm deletion in alert
         menu_page.confirm_delete_alert()
-        menu_page.wait(2)
+        menu_page.wait_for_app_idle()
         
         # Accept success alert if present
         try:
@@ -169,7 +167,7 @@ class TestMenuWorkflow:
         # Count should decrease or remain same if deletion failed
         assert final_count <= initial_count, "Menu should be deleted"
     
-    def test_TC015_admin_cancel_menu_deletion(self, browser):
+    def test_TC015_admin_cancel_menu_deletion(self, browser, data_namespace, own_menu):
         """
         TC015: Admin cancels menu deletion
         
@@ -178,26 +176,25 @@ class TestMenuWorkflow:
         Expected Result: Menu not deleted when cancelling
         """
         # Arrange
-        menu_page = MenuPage(browser)
+        menu_page = MenuPage(browser, namespace=data_namespace)
         
         # Act
         menu_page.navigate()
         
         initial_count = menu_page.get_menu_count()
-        if initial_count == 0:
-            pytest.skip("No menus available")
+        assert initial_count > 0, "Worker should own a menu"
         
         menu_page.click_delete_menu(menu_index=0)
         
         # Cancel deletion
         menu_page.cancel_delete_alert()
-        menu_page.wait(1)
+        menu_page.wait_for_app_idle()
         
         # Assert
         final_count = menu_page.get_menu_count()
         assert final_count == initial_count, "Menu count should remain same after cancelling"
     
-    def test_TC016_navigate_to_menu_details(self, browser):
+    def test_TC016_navigate_to_menu_details(self, browser, data_namespace, own_menu):
         """
         TC016: Navigate to menu details page
         
@@ -206,13 +203,11 @@ class TestMenuWorkflow:
         Expected Result: Successfully navigate to menu details
         """
         # Arrange
-        menu_page = MenuPage(browser)
+        menu_page = MenuPage(browser, namespace=data_namespace)
         
         # Act
         menu_page.navigate()
-        
-        if menu_page.get_menu_count() == 0:
-            pytest.skip("No menus available")
+        assert menu_page.get_menu_count() > 0, "Worker should own a menu"
         
         menu_page.click_view_menu(menu_index=0)
         
@@ -0,0 +1 @@
+# Unit tests of the test infrastructure, no browser needed
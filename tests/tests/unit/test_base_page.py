@@ -0,0 +1,141 @@
+"""
+Base Page Unit Tests
+Tests: Readiness waits across navigations, element cache
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from config.config import Config
+from pages.base_page import BasePage
+from utils.driver_pool import DriverPool
+
+
+NAME_INPUT = (By.CSS_SELECTOR, "input[name='name']")
+
+
+class ScriptedDriver:
+    """Driver whose async scripts answer with the given results or exceptions"""
+    
+    _ready_tracker_registered = True
+    current_url = "https://localhost:7001/menu"
+    
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+    
+    def implicitly_wait(self, seconds):
+        pass
+    
+    def execute_async_script(self, script, *args):
+        self.calls.append(args)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.mark.unit
+class TestWaitForAppIdle:
+    """wait_for_app_idle() test cases"""
+    
+    @pytest.fixture(autouse=True)
+    def fast_polling(self, monkeypatch):
+        monkeypatch.setattr(Config, "POLL_INTERVAL", 0.01)
+    
+    @pytest.mark.parametrize("error", [
+        JavascriptException("javascript error: document unloaded while waiting for result"),
+        JavascriptException("Document was unloaded"),
+        NoSuchWindowException("no such window: target window already closed"),
+    ])
+    def test_navigation_polls_the_new_document(self, error):
+        """A click that navigates tears the script down, the wait goes on in the new page"""
+        driver = ScriptedDriver(error, {"idle": True, "elapsed": 30})
+        assert BasePage(driver).wait_for_app_idle(timeout=2)
+        assert len(driver.calls) == 2
+        # The navigation answered the interaction, the new page is only checked for quiet
+        assert driver.calls[1][1] == 0
+        assert driver.calls[1][2] <= 2000
+    
+    def test_other_script_errors_are_raised(self):
+        """Errors unrelated to an unload are not retried"""
+        driver = ScriptedDriver(JavascriptException("javascript error: t is undefined"))
+        with pytest.raises(JavascriptException):
+            BasePage(driver).wait_for_app_idle(timeout=2)
+    
+    def test_unload_after_the_budget_reports_busy(self):
+        """Repeated unloads stop at the budget instead of raising"""
+        unloaded = WebDriverException("document unloaded while waiting for result")
+        driver = ScriptedDriver(*[unloaded] * 100)
+        assert not BasePage(driver).wait_for_app_idle(timeout=0.05)
+
+
+class FakeElement:
+    """Element that raises once the page re-rendered it"""
+    
+    def __init__(self):
+        self.stale = False
+    
+    def is_enabled(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale element reference")
+        return True
+
+
+class LookupDriver:
+    """Driver counting element lookups"""
+    
+    _ready_tracker_registered = True
+    
+    def __init__(self):
+        self.found = []
+    
+    def implicitly_wait(self, seconds):
+        pass
+    
+    def find_element(self, by, value):
+        self.found.append(FakeElement())
+        return self.found[-1]
+
+
+@pytest.mark.unit
+class TestElementCache:
+    """Element cache test cases"""
+    
+    @pytest.fixture(autouse=True)
+    def element_cache(self, monkeypatch):
+        monkeypatch.setattr(Config, "ELEMENT_CACHE", True)
+    
+    def test_find_element_reuses_live_element(self):
+        """A cached element that is still attached is returned without a search"""
+        driver = LookupDriver()
+        page = BasePage(driver)
+        assert page.find_element(NAME_INPUT) is page.find_element(NAME_INPUT)
+        assert len(driver.found) == 1
+    
+    def test_find_element_never_returns_stale_element(self):
+        """A re-rendered element is resolved again before it is returned"""
+        driver = LookupDriver()
+        page = BasePage(driver)
+        first = page.find_element(NAME_INPUT)
+        first.stale = True
+        second = page.find_element(NAME_INPUT)
+        assert second is not first
+        assert not second.stale
+    
+    def test_pool_reset_drops_page_caches(self):
+        """The next test on a pooled browser starts without cached elements or state"""
+        driver = LookupDriver()
+        page = BasePage(driver)
+        page.find_element(NAME_INPUT)
+        page.page_state["menu_snapshot"] = object()
+        DriverPool._clear_page_caches(driver)
+        assert page.element_cache == {}
+        assert page.page_state == {}
@@ -0,0 +1,59 @@
+"""
+Test Data Pool Unit Tests
+Tests: Seeded per-test draws, pool growth and exhaustion
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import pytest
+from data.data_pool import DataPool, DataPoolExhausted
+
+
+@pytest.mark.unit
+class TestDataPool:
+    """Data pool test cases"""
+    
+    def test_same_seed_same_values(self):
+        """Two pools with the same seed draw the same values"""
+        first, second = DataPool(741107090, size=8), DataPool(741107090, size=8)
+        assert [first.draw("emails") for _ in range(20)] == [second.draw("emails") for _ in range(20)]
+    
+    @pytest.mark.parametrize("precompute", [True, False])
+    def test_test_values_independent_of_earlier_draws(self, precompute):
+        """A test draws the same values whatever ran before it on the worker"""
+        alone = DataPool(741107090, size=8, precompute=precompute)
+        alone.start_test("tests/test_menu_workflow.py::TestMenuWorkflow::test_edit_menu")
+        expected = [alone.draw("menu_names"), alone.draw("emails")]
+        
+        after_others = DataPool(741107090, size=8, precompute=precompute)
+        after_others.start_test("tests/test_menu_workflow.py::TestMenuWorkflow::test_create_menu")
+        for _ in range(11):
+            after_others.draw("menu_names")
+            after_others.draw("texts")
+        after_others.start_test("tests/test_menu_workflow.py::TestMenuWorkflow::test_edit_menu")
+        assert [after_others.draw("menu_names"), after_others.draw("emails")] == expected
+    
+    def test_tests_get_different_values(self):
+        """Different test ids get different streams and seeds"""
+        pool = DataPool(741107090)
+        first_seed = pool.start_test("test_a")
+        first = [pool.draw("emails") for _ in range(3)]
+        second_seed = pool.start_test("test_b")
+        assert second_seed != first_seed
+        assert [pool.draw("emails") for _ in range(3)] != first
+    
+    def test_pool_grows_instead_of_repeating(self):
+        """Drawing past the pool size adds values instead of starting over"""
+        pool = DataPool(741107090, size=8)
+        names = [pool.draw("usernames") for _ in range(30)]
+        assert len(set(names)) == 30
+        assert len(pool.values["usernames"]) == 32
+    
+    def test_exhausted_field_raises(self):
+        """A field out of new values fails instead of repeating one"""
+        pool = DataPool(741107090, size=256)
+        # 8 menu types x 100 numbers
+        names = [pool.draw("menu_names") for _ in range(800)]
+        assert len(set(names)) == 800
+        with pytest.raises(DataPoolExhausted):
+            pool.draw("menu_names")
@@ -0,0 +1,87 @@
+"""
+Driver Pool Unit Tests
+Tests: Resetting a pooled browser between tests
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import pytest
+from config.config import Config
+from utils.driver_pool import CLEAR_STORAGE_SCRIPT, DriverPool
+
+
+class RecordingDriver:
+    """Chromium-like driver recording the commands a reset sends"""
+    
+    window_handles = ["main"]
+    
+    def __init__(self, url):
+        self.current_url = url
+        self.commands = []
+        self.switch_to = self
+    
+    @property
+    def alert(self):
+        return self
+    
+    def dismiss(self):
+        pass
+    
+    def window(self, handle):
+        pass
+    
+    def get(self, url):
+        self.commands.append(("get", url))
+        self.current_url = url
+    
+    def execute_script(self, script, *args):
+        self.commands.append(("script", self.current_url, script))
+    
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(("cdp", command, params))
+    
+    def delete_all_cookies(self):
+        pass
+    
+    def implicitly_wait(self, seconds):
+        pass
+
+
+@pytest.mark.unit
+class TestDriverPoolReset:
+    """DriverPool.reset() test cases"""
+    
+    @pytest.fixture(autouse=True)
+    def app_url(self, monkeypatch):
+        monkeypatch.setattr(Config, "BASE_URL", "https://localhost:7001")
+    
+    def storage_cleared_on(self, driver):
+        """URLs the storage script ran on"""
+        return [
+            command[1] for command in driver.commands
+            if command[0] == "script" and command[2] == CLEAR_STORAGE_SCRIPT
+        ]
+    
+    def test_storage_cleared_on_the_app(self):
+        """A test that ended on the app has both storages cleared in place"""
+        driver = RecordingDriver("https://localhost:7001/menu")
+        assert DriverPool(lambda: driver).reset(driver)
+        assert self.storage_cleared_on(driver) == ["https://localhost:7001/menu"]
+    
+    def test_storage_cleared_after_leaving_the_app(self):
+        """sessionStorage survives navigating away, so reset goes back to the app to clear it"""
+        driver = RecordingDriver("about:blank")
+        assert DriverPool(lambda: driver).reset(driver)
+        bootstrap_url = f"{Config.BASE_URL}{Config.SESSION_BOOTSTRAP_PATH}"
+        assert self.storage_cleared_on(driver) == [bootstrap_url]
+        assert driver.current_url == "about:blank"
+    
+    def test_devtools_gets_valid_storage_types_only(self):
+        """session_storage is not a DevTools storage type"""
+        driver = RecordingDriver("https://localhost:7001/menu")
+        DriverPool(lambda: driver).reset(driver)
+        params = next(
+            command[2] for command in driver.commands
+            if command[0] == "cdp" and command[1] == "Storage.clearDataForOrigin"
+        )
+        assert "session_storage" not in params["storageTypes"].split(",")
@@ -0,0 +1,96 @@
+"""
+Unique Identity Unit Tests
+Tests: Phone numbers of generated users and worker accounts
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import re
+import uuid
+import pytest
+from utils.identity import IdentityGenerator, PHONE_SPACE
+from utils.namespace import DataNamespace
+
+
+PHONE_FORMAT = re.compile(r"^\+216 [259]\d \d{3} \d{3}$")
+
+
+@pytest.mark.unit
+class TestIdentityPhones:
+    """Phone generation test cases"""
+    
+    def test_phones_match_app_format(self):
+        """Generated and worker account phones use "+216 XX XXX XXX" """
+        namespace = DataNamespace("gw3", "3f9a1c")
+        phones = [IdentityGenerator(namespace).next()["phone"] for _ in range(50)]
+        phones.append(namespace.user_credentials()["phone"])
+        assert all(PHONE_FORMAT.match(phone) for phone in phones), phones
+    
+    def test_phones_unique_within_run(self):
+        """Workers and the worker accounts never share a phone within a run"""
+        phones = []
+        for worker in range(8):
+            namespace = DataNamespace(f"gw{worker}", "3f9a1c")
+            generator = IdentityGenerator(namespace)
+            phones += [generator.next()["phone"] for _ in range(100)]
+            phones.append(namespace.user_credentials()["phone"])
+        assert len(phones) == len(set(phones))
+    
+    def test_worker_account_phone_not_reused(self):
+        """Identity 1000 does not wrap around to the worker's own account"""
+        generator = IdentityGenerator(DataNamespace("gw2", "3f9a1c"))
+        phones = {generator.phone(number) for number in (0, 1, 1000, 1001)}
+        assert len(phones) == 4
+    
+    def test_worker_out_of_phones_raises(self):
+        """A worker that used its whole block fails instead of repeating phones"""
+        generator = IdentityGenerator(DataNamespace("gw2", "3f9a1c"))
+        generator.phone(IdentityGenerator.PHONES_PER_WORKER - 1)
+        with pytest.raises(ValueError):
+            generator.phone(IdentityGenerator.PHONES_PER_WORKER)
+    
+    def test_worker_blocks_fit_phone_space(self):
+        """The last worker's block does not wrap onto the first one"""
+        assert IdentityGenerator.MAX_WORKERS * IdentityGenerator.PHONES_PER_WORKER <= PHONE_SPACE
+        last = IdentityGenerator(DataNamespace(f"gw{IdentityGenerator.MAX_WORKERS - 1}", "3f9a1c"))
+        first = IdentityGenerator(DataNamespace("gw0", "3f9a1c"))
+        assert last.phone(IdentityGenerator.PHONES_PER_WORKER - 1) != first.phone(0)
+        with pytest.raises(ValueError):
+            IdentityGenerator(DataNamespace(f"gw{IdentityGenerator.MAX_WORKERS}", "3f9a1c")).phone(1)
+    
+    def test_run_offsets_cover_whole_phone_space(self):
+        """Runs are spread over all numbers, not a few hundred fixed blocks"""
+        bases = [IdentityGenerator(DataNamespace("gw0", uuid.uuid4().hex)).phone_base for _ in range(2000)]
+        assert len(set(bases)) > 1990
+        assert max(bases) > PHONE_SPACE * 0.9
+    
+    def test_runs_rarely_share_phones(self):
+        """Small runs with different run ids get disjoint phones"""
+        runs = [
+            {IdentityGenerator(DataNamespace("gw0", run_id)).phone(n) for n in range(1, 21)}
+            for run_id in (f"{i:06x}" for i in range(200))
+        ]
+        shared = sum(len(a & b) > 0 for i, a in enumerate(runs) for b in runs[i + 1:])
+        assert shared == 0
+
+
+@pytest.mark.unit
+class TestIdentityNames:
+    """Username and email test cases"""
+    
+    def test_usernames_use_full_run_id(self):
+        """Runs whose ids share the short display id still get different accounts"""
+        first = DataNamespace("gw0", "3f9a1c7d20b84e5f9c61a0d2e47b8f13")
+        second = DataNamespace("gw0", "3f9a1c0000000000000000000000beef")
+        assert first.prefix == second.prefix == "T-3f9a1c-gw0 "
+        assert IdentityGenerator(first).next()["username"] != IdentityGenerator(second).next()["username"]
+        assert first.user_credentials()["email"] != second.user_credentials()["email"]
+    
+    def test_usernames_fit_app_limit(self):
+        """Usernames with a full xdist run id stay within the app's 50 characters"""
+        namespace = DataNamespace("gw63", uuid.uuid4().hex)
+        generator = IdentityGenerator(namespace)
+        for _ in range(999):
+            generator.next()
+        assert len(generator.next()["username"]) <= 50
+        assert len(namespace.user_credentials()["username"]) <= 50
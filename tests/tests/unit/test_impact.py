@@ -0,0 +1,116 @@
+"""
+Change-Impact Selection Unit Tests
+Tests: Mapping changed paths and symbols to the tests that must run
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import pytest
+from utils import impact
+from utils.impact import EVERYTHING, CoverageMap, analyze_changes, methods_referencing
+
+
+MENU_TEST = "tests/test_menu_workflow.py::TestMenuWorkflow::test_TC013_admin_edit_existing_menu"
+LOGIN_TEST = "tests/test_authentication.py::TestAuthentication::test_TC001_valid_login"
+
+
+def line_of(path, text):
+    """Line number of the first line of a file containing text"""
+    lines = (impact.TESTS_ROOT / path).read_text().splitlines()
+    return next(number for number, line in enumerate(lines, 1) if text in line)
+
+
+@pytest.mark.unit
+class TestImpactSelection:
+    """Change-impact selection test cases"""
+    
+    @pytest.fixture
+    def coverage(self, tmp_path):
+        """Coverage map of a menu test using MenuCard and a login test"""
+        coverage = CoverageMap(tmp_path / "impact_map.json")
+        coverage.tests = {
+            MENU_TEST: {
+                "methods": ["BasePage.navigate_to", "MenuCard.click_edit", "MenuPage.navigate"],
+                "locators": ["MenuPage.MENU_CARDS"],
+            },
+            LOGIN_TEST: {
+                "methods": ["BasePage.type", "BasePage.wait_for_app_idle", "LoginPage.login"],
+                "locators": ["LoginPage.EMAIL_INPUT"],
+            },
+        }
+        return coverage
+    
+    def changes_for(self, monkeypatch, coverage, lines):
+        """Analyze a diff made of the given {path: line numbers}"""
+        monkeypatch.setattr(impact, "changed_lines", lambda ref: lines)
+        return analyze_changes("main", coverage)
+    
+    def selected(self, coverage, changes):
+        return {nodeid for nodeid in coverage.tests if coverage.is_affected(nodeid, changes)}
+    
+    @pytest.mark.parametrize("path", [
+        "conftest.py",
+        "utils/driver_factory.py",
+        "utils/session_cache.py",
+        "standin/app.py",
+        "requirements.txt",
+        "../.github/workflows/tests.yml",
+    ])
+    def test_unmapped_path_runs_everything(self, monkeypatch, coverage, path):
+        """Changes outside pages/, data/ and test modules cannot be narrowed down"""
+        changes = self.changes_for(monkeypatch, coverage, {path: {1}})
+        assert EVERYTHING in changes
+        assert self.selected(coverage, changes) == set(coverage.tests)
+    
+    def test_documentation_change_runs_nothing(self, monkeypatch, coverage):
+        """Markdown files cannot affect a test outcome"""
+        changes = self.changes_for(monkeypatch, coverage, {"README.md": {3}, "../README.md": {1}})
+        assert EVERYTHING not in changes
+        assert self.selected(coverage, changes) == set()
+    
+    def test_module_constant_reaches_recorded_method_transitively(self, monkeypatch, coverage):
+        """READY_TRACKER_SCRIPT is only used by APP_IDLE_SCRIPT and a private helper"""
+        line = line_of("pages/base_page.py", "READY_TRACKER_SCRIPT = ")
+        changes = self.changes_for(monkeypatch, coverage, {"pages/base_page.py": {line}})
+        assert EVERYTHING not in changes
+        assert "BasePage.wait_for_app_idle" in changes["methods"]
+        assert LOGIN_TEST in self.selected(coverage, changes)
+    
+    def test_private_helper_reaches_recorded_method_transitively(self, monkeypatch, coverage):
+        """element_in is only used by the private MenuCard._click"""
+        line = line_of("pages/menu_card.py", "element = root.find_element")
+        changes = self.changes_for(monkeypatch, coverage, {"pages/menu_card.py": {line}})
+        assert EVERYTHING not in changes
+        assert "MenuCard.click_edit" in changes["methods"]
+        assert self.selected(coverage, changes) == {MENU_TEST}
+    
+    def test_symbol_reaching_no_recorded_method_runs_everything(self, monkeypatch, coverage):
+        """No recorded test covers the register page, so its coverage is unknown"""
+        line = line_of("pages/register_page.py", "def get_validation_errors")
+        changes = self.changes_for(monkeypatch, coverage, {"pages/register_page.py": {line}})
+        assert EVERYTHING in changes
+    
+    def test_changed_test_module_selects_its_tests(self, monkeypatch, coverage):
+        """A changed test module runs, other mapped tests do not"""
+        changes = self.changes_for(monkeypatch, coverage, {"tests/test_authentication.py": {40}})
+        assert EVERYTHING not in changes
+        assert self.selected(coverage, changes) == {LOGIN_TEST}
+    
+    def test_methods_referencing_stops_at_recorded_methods(self):
+        """Users of a recorded method are covered by its own record"""
+        methods, classes = methods_referencing({"element_in"}, {"MenuCard._click"})
+        assert methods == {"MenuCard._click"}
+        assert classes == set()
+
+
+@pytest.mark.unit
+class TestCoverageMap:
+    """Impact map recording test cases"""
+    
+    def test_run_without_step_records_keeps_map(self, tmp_path):
+        """A run that recorded no steps does not overwrite the map with nothing"""
+        path = tmp_path / "impact_map.json"
+        CoverageMap(path).update([{"test": MENU_TEST, "methods": {"MenuPage.navigate"}, "locators": []}])
+        saved = path.read_text()
+        CoverageMap(path).update([])
+        assert path.read_text() == saved
@@ -0,0 +1,65 @@
+"""
+Launch Profile Unit Tests
+Tests: Prepared profile templates follow the fast-start flags and preferences
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import json
+from pathlib import Path
+import pytest
+from config.config import Config
+from utils import launch_profile
+from utils.launch_profile import launch_profile_dir, template_dir
+
+
+@pytest.mark.unit
+class TestProfileTemplates:
+    """Profile template test cases"""
+    
+    @pytest.fixture(autouse=True)
+    def profile_root(self, monkeypatch, tmp_path):
+        """Prepare templates in a temporary folder"""
+        monkeypatch.setattr(Config, "FAST_START_PROFILE_ROOT", str(tmp_path))
+        return tmp_path
+    
+    def test_template_reused_while_settings_unchanged(self):
+        """Launches copy the same template as long as flags and prefs stay"""
+        launch_profile_dir("chrome")
+        first = template_dir("chrome")
+        launch_profile_dir("chrome")
+        assert template_dir("chrome") == first and first.exists()
+    
+    def test_changed_prefs_rebuild_template(self, monkeypatch):
+        """New Chromium preferences land in a new template, the old one is removed"""
+        launch_profile_dir("chrome")
+        old = template_dir("chrome")
+        prefs = {**launch_profile.CHROMIUM_PREFERENCES, "intl": {"accept_languages": "en-US"}}
+        monkeypatch.setattr(launch_profile, "CHROMIUM_PREFERENCES", prefs)
+        copy = launch_profile_dir("chrome")
+        assert template_dir("chrome") != old and not old.exists()
+        assert json.loads((Path(copy) / "Default" / "Preferences").read_text()) == prefs
+    
+    def test_changed_flags_rebuild_template(self, monkeypatch):
+        """Chromium flags are part of the template name too"""
+        old = template_dir("chrome")
+        args = launch_profile.CHROMIUM_FAST_START_ARGS + ["--disable-gpu"]
+        monkeypatch.setattr(launch_profile, "CHROMIUM_FAST_START_ARGS", args)
+        assert template_dir("chrome") != old
+    
+    def test_changed_firefox_prefs_rebuild_template(self, monkeypatch):
+        """Firefox preferences written to user.js name the template"""
+        launch_profile_dir("firefox")
+        old = template_dir("firefox")
+        prefs = {**launch_profile.FIREFOX_FAST_START_PREFS, "media.autoplay.default": 5}
+        monkeypatch.setattr(launch_profile, "FIREFOX_FAST_START_PREFS", prefs)
+        copy = launch_profile_dir("firefox")
+        assert not old.exists()
+        assert '"media.autoplay.default", 5' in (template_dir("firefox") / "user.js").read_text()
+        assert (template_dir("firefox") / "user.js").read_text() == (Path(copy) / "user.js").read_text()
+    
+    def test_other_browsers_templates_kept(self):
+        """Rebuilding one browser's template leaves the others alone"""
+        launch_profile_dir("firefox")
+        launch_profile_dir("chrome")
+        assert template_dir("firefox").exists() and template_dir("chrome").exists()
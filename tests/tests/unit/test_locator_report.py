@@ -0,0 +1,85 @@
+"""
+Locator Report Unit Tests
+Tests: XPath to CSS conversion and selector suggestions
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from utils.locator_report import suggest, xpath_to_css
+
+
+@pytest.mark.unit
+class TestXpathToCss:
+    """xpath_to_css() test cases"""
+    
+    @pytest.mark.parametrize("xpath, expected", [
+        ("//input[@id='email']", ("input#email", None)),
+        ("//div[@class='modal-box']//button", ("div.modal-box button", None)),
+        ("//div[@class='card compact']", ("div.card.compact", None)),
+        ("//div[contains(@class, 'card')]", ('div[class*="card"]', None)),
+        ("//input[@type='text']", ('input[type="text"]', None)),
+        ("/html/body/div[2]", ("html > body > div:nth-of-type(2)", None)),
+        ("//*[@id='app']", ("#app", None)),
+    ])
+    def test_structural_xpath(self, xpath, expected):
+        """Ids, classes, attributes and positions have CSS equivalents"""
+        assert xpath_to_css(xpath) == expected
+    
+    @pytest.mark.parametrize("xpath, expected", [
+        ("//a[contains(., 'View Menu')]", ("a", "View Menu")),
+        ("//a[contains(text(), 'Edit')]", ("a", "Edit")),
+        ("//button[normalize-space()='Save']", ("button", "Save")),
+        ("//div[@class='modal-box']//button[contains(text(), 'Save')]", ("div.modal-box button", "Save")),
+    ])
+    def test_text_predicate_on_last_step(self, xpath, expected):
+        """A text match on the last element is returned next to the CSS"""
+        assert xpath_to_css(xpath) == expected
+    
+    @pytest.mark.parametrize("xpath, expected", [
+        (".//a[contains(., 'View Menu')]", ("a", "View Menu")),
+        (".//div[@class='card-body']//p", ("div.card-body p", None)),
+        ("./span", (":scope > span", None)),
+    ])
+    def test_relative_xpath(self, xpath, expected):
+        """Relative XPaths become CSS relative to the element searched from"""
+        assert xpath_to_css(xpath) == expected
+    
+    @pytest.mark.parametrize("xpath", [
+        "//a[contains(text(), 'Edit')]/span",
+        "//a/following-sibling::b",
+        "//div[last()]",
+        "(//a)[1]",
+        "//a[@href and @title]",
+        "",
+    ])
+    def test_unconvertible_xpath(self, xpath):
+        """Axes, functions and text matches on inner steps have no CSS equivalent"""
+        assert xpath_to_css(xpath) is None
+
+
+@pytest.mark.unit
+class TestSuggest:
+    """suggest() test cases"""
+    
+    def test_css_needs_no_suggestion(self):
+        assert suggest(By.CSS_SELECTOR, ".card-title") is None
+    
+    def test_structural_xpath_suggests_css(self):
+        assert suggest(By.XPATH, "//input[@id='email']") == 'CSS "input#email"'
+    
+    def test_unconvertible_document_xpath_suggests_test_id(self):
+        assert "data-testid" in suggest(By.XPATH, "//a/following-sibling::b")
+    
+    def test_scoped_text_xpath_needs_no_change(self):
+        """A component-relative text match only searches inside the component"""
+        assert suggest(By.XPATH, ".//a[contains(., 'View Menu')]") is None
+        assert suggest(By.XPATH, ".//a/following-sibling::b") is None
+    
+    def test_scoped_structural_xpath_suggests_relative_css(self):
+        assert suggest(By.XPATH, "./span") == 'CSS ":scope > span" relative to the component'
+    
+    def test_selector_group_keeps_matching_alternative(self):
+        suggestion = suggest(By.CSS_SELECTOR, ".alert-error, .error", {".alert-error": 1, ".error": 0})
+        assert suggestion == 'CSS ".alert-error" (the only alternative that matched)'
@@ -0,0 +1,82 @@
+"""
+Resource Policy Unit Tests
+Tests: Blocked URL patterns and when requests are counted
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import logging
+import pytest
+from config.config import Config
+from utils import resource_policy
+from utils.resource_policy import (
+    RESOURCE_PROFILES,
+    blocked_url_patterns,
+    resource_accounting_enabled,
+    url_matches,
+)
+
+
+@pytest.mark.unit
+class TestResourcePolicy:
+    """Resource policy test cases"""
+    
+    @pytest.fixture(autouse=True)
+    def settings(self, monkeypatch):
+        """Default blocking and session settings"""
+        monkeypatch.setattr(Config, "BASE_URL", "https://localhost:7001")
+        monkeypatch.setattr(Config, "SESSION_BOOTSTRAP_PATH", "/favicon.ico?session")
+        monkeypatch.setattr(resource_policy, "_warned_patterns", set())
+        monkeypatch.setattr(Config, "RESOURCE_BLOCK_PATTERNS", "")
+        monkeypatch.setattr(Config, "ASSET_CACHE", False)
+        monkeypatch.setattr(Config, "RESOURCE_STATS", False)
+    
+    @pytest.mark.parametrize("url, pattern, expected", [
+        ("https://localhost:7001/img/logo.png", "*.png", True),
+        ("https://www.google-analytics.com/analytics.js", "*google-analytics.com*", True),
+        ("https://localhost:7001/menu", "*.png", False),
+        ("https://localhost:7001/a.b", "*.?", False),
+    ])
+    def test_url_matches_wildcards_only(self, url, pattern, expected):
+        """Only * is a wildcard, like in Network.setBlockedURLs"""
+        assert url_matches(url, pattern) is expected
+    
+    @pytest.mark.parametrize("profile", list(RESOURCE_PROFILES))
+    @pytest.mark.parametrize("extra", ["", "*favicon*", "*localhost:7001*"])
+    def test_session_bootstrap_url_is_never_blocked(self, monkeypatch, profile, extra):
+        """Cached logins restore on the bootstrap URL, so every profile must load it"""
+        monkeypatch.setattr(Config, "RESOURCE_BLOCK_PATTERNS", extra)
+        bootstrap_url = f"{Config.BASE_URL}{Config.SESSION_BOOTSTRAP_PATH}"
+        assert not any(url_matches(bootstrap_url, pattern) for pattern in blocked_url_patterns(profile))
+    
+    @pytest.mark.parametrize("url", [
+        "https://localhost:7001/favicon.ico",
+        "https://localhost:7001/img/icon.ico",
+        "https://localhost:7001/img/logo.png",
+        "https://localhost:7001/fonts/app.woff2",
+    ])
+    def test_other_icons_stay_blocked(self, url):
+        """Only the bootstrap URL is exempt, icons without its query stay blocked"""
+        patterns = blocked_url_patterns("functional-minimal")
+        assert "*.ico" in patterns
+        assert any(url_matches(url, pattern) for pattern in patterns)
+    
+    def test_dropped_pattern_is_reported(self, monkeypatch, caplog):
+        """A pattern matching the bootstrap URL is left out with a warning, once"""
+        monkeypatch.setattr(Config, "RESOURCE_BLOCK_PATTERNS", "*localhost:7001*,*.map")
+        with caplog.at_level(logging.WARNING, logger="utils.resource_policy"):
+            patterns = blocked_url_patterns("full-fidelity")
+            blocked_url_patterns("full-fidelity")
+        assert patterns == ["*.map"]
+        warnings = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1 and "*localhost:7001*" in warnings[0]
+    
+    def test_full_fidelity_does_not_count_requests(self):
+        """Nothing is blocked, so the performance log stays off"""
+        assert not resource_accounting_enabled("full-fidelity")
+    
+    def test_counting_follows_blocking_and_asset_cache(self, monkeypatch):
+        """A blocking profile or the asset cache needs the request counts"""
+        assert resource_accounting_enabled("functional-minimal")
+        monkeypatch.setattr(Config, "ASSET_CACHE", True)
+        assert resource_accounting_enabled("full-fidelity")
@@ -0,0 +1,22 @@
+"""
+Test Data Generator Unit Tests
+Tests: Lengths of generated texts
+
+Test Level: Unit Testing
+Test Type: Functional
+"""
+import pytest
+from data.test_data import TestData
+
+
+@pytest.mark.unit
+class TestGeneratedText:
+    """Random text test cases"""
+    
+    @pytest.mark.parametrize("length", [1, 5, 50, 199, 200, 201, 1000])
+    def test_text_has_requested_length(self, length):
+        """Texts are as long as asked, also past the length of one pool text"""
+        for _ in range(20):
+            text = TestData.generate_random_text(length)
+            assert len(text) == length
+            assert not text.endswith(" ")
@@ -0,0 +1,20 @@
+from .driver_factory import create_driver
+from .driver_pool import DriverPool
+from .session_cache import SessionCache
+from .namespace import DataNamespace
+from .identity import IdentityGenerator
+from .seeding import SeedClient, SeedingError
+from .command_counter import CommandCounter
+from .cleanup import CleanupRegistry
+
+__all__ = [
+    'create_driver',
+    'DriverPool',
+    'SessionCache',
+    'DataNamespace',
+    'IdentityGenerator',
+    'SeedClient',
+    'SeedingError',
+    'CommandCounter',
+    'CleanupRegistry'
+]
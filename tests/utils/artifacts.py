@@ -0,0 +1,126 @@
+"""
+Failure artifact capture
+Grabs screenshot, page HTML, URL and browser console of a failed test
+while the browser is still open, and leaves decoding, compression and
+disk writes to background threads so teardown is not held up
+"""
+import base64
+import gzip
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+# One round-trip for everything the page itself can tell
+PAGE_STATE_SCRIPT = """
+return {
+    url: window.location.href,
+    title: document.title,
+    html: document.documentElement ? document.documentElement.outerHTML : ""
+};
+"""
+
+INDEX_FILE = "index.json"
+
+
+def clean_test_name(nodeid):
+    """Turn a test node id into a file name"""
+    return nodeid.replace("::", "_").replace("/", "_").replace("\\", "_")
+
+
+class ArtifactCollector:
+    """
+    Failure artifacts of one worker, written below a shared run folder
+    Each failed test gets its own folder with screenshot.png,
+    page.html.gz, console.json and meta.json.
+    """
+    
+    def __init__(self, run_dir, max_workers=2):
+        """
+        Args:
+            run_dir: Folder of this run, shared by all xdist workers
+            max_workers: Background threads writing artifacts
+        """
+        self.run_dir = run_dir
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifacts")
+        self.pending = []
+    
+    def capture(self, driver, nodeid):
+        """
+        Read the failure state from the browser and queue it for writing
+        Only the WebDriver calls happen here, each one may fail on its own
+        (e.g. the screenshot while an alert is open) without losing the rest.
+        Returns:
+            Index entry of the test (paths relative to the run folder)
+        """
+        captured_at = datetime.now()
+        screenshot, page, console, errors = None, {}, None, []
+        try:
+            screenshot = driver.get_screenshot_as_base64()
+        except WebDriverException as e:
+            errors.append(f"screenshot: {e.msg}")
+        try:
+            page = driver.execute_script(PAGE_STATE_SCRIPT) or {}
+        except WebDriverException as e:
+            errors.append(f"page: {e.msg}")
+        if driver.capabilities.get("browserName") != "firefox":
+            # geckodriver has no log endpoint
+            try:
+                console = driver.get_log("browser")
+            except WebDriverException as e:
+                errors.append(f"console: {e.msg}")
+        
+        entry = {
+            "test": nodeid,
+            "folder": f"{clean_test_name(nodeid)}_{captured_at.strftime('%H%M%S_%f')}",
+            "captured_at": captured_at.isoformat(timespec="seconds"),
+            "url": page.get("url"),
+            "title": page.get("title"),
+            "console_entries": len(console) if console is not None else None,
+            "errors": errors,
+        }
+        self.pending.append(self.executor.submit(self._write, entry, screenshot, page.get("html"), console))
+        return entry
+    
+    def _write(self, entry, screenshot, html, console):
+        """Decode, compress and save one test's artifacts (background thread)"""
+        folder = self.run_dir / entry["folder"]
+        folder.mkdir(parents=True, exist_ok=True)
+        if screenshot:
+            (folder / "screenshot.png").write_bytes(base64.b64decode(screenshot))
+        if html:
+            (folder / "page.html.gz").write_bytes(gzip.compress(html.encode("utf-8"), compresslevel=6))
+        if console is not None:
+            (folder / "console.json").write_text(json.dumps(console, indent=2))
+        (folder / "meta.json").write_text(json.dumps(entry, indent=2))
+        return folder
+    
+    def close(self):
+        """Wait for queued writes, log any that failed"""
+        self.executor.shutdown(wait=True)
+        for future in self.pending:
+            if future.exception():
+                logger.error(f"Failed to write failure artifacts: {future.exception()}")
+        written = sum(1 for future in self.pending if not future.exception())
+        if written:
+            logger.info(f"Failure artifacts of {written} tests written to {self.run_dir}")
+        self.pending = []
+
+
+def write_index(run_dir, entries):
+    """
+    Write the run's index of failed tests and their artifacts
+    Args:
+        run_dir: Folder of the run
+        entries: Entries returned by ArtifactCollector.capture(), from all workers
+    """
+    if not entries:
+        return None
+    run_dir.mkdir(parents=True, exist_ok=True)
+    path = run_dir / INDEX_FILE
+    path.write_text(json.dumps(sorted(entries, key=lambda entry: entry["test"]), indent=2))
+    return path
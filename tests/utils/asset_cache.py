@@ -0,0 +1,95 @@
+"""
+Shared asset cache for Chromium browsers
+The first browser that downloads the app bundle (_framework files,
+blazor.boot.json, CSS and JS) publishes its disk cache, and every later
+browser of the run starts from a private copy of it
+"""
+import atexit
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from config.config import Config
+from utils.launch_profile import profile_root
+
+
+# Files of the app bundle, counted as cache hits or misses
+ASSET_URL = re.compile(r"/_framework/|/_content/|blazor\.boot\.json|\.(css|js|wasm|dll|dat)(\?|$)")
+
+# An empty Chromium cache is a few index files, a cache holding the app bundle is megabytes
+MIN_PUBLISH_BYTES = 256 * 1024
+
+_cache_dirs = []
+
+
+def is_asset(url):
+    """Check whether a URL belongs to the app bundle"""
+    return bool(ASSET_URL.search(url))
+
+
+def configure_asset_cache(run_name):
+    """
+    Point Config.ASSET_CACHE_DIR at the shared cache of the run
+    A configured ASSET_CACHE_DIR keeps one cache across runs, otherwise
+    the run gets its own folder next to the launch profiles.
+    Returns:
+        True if the folder belongs to this run and is removed afterwards
+    """
+    if Config.ASSET_CACHE_DIR:
+        return False
+    Config.ASSET_CACHE_DIR = str(profile_root() / f"goldenfork-assets-{run_name}")
+    return True
+
+
+def launch_cache_dir(browser_name):
+    """
+    Get a private disk cache for one browser launch, a copy of the shared one if published
+    Copies are removed when the process exits.
+    """
+    shared = Path(Config.ASSET_CACHE_DIR) / browser_name
+    cache_dir = Path(tempfile.mkdtemp(prefix=f"goldenfork-cache-{browser_name}-", dir=profile_root()))
+    if shared.exists():
+        shutil.copytree(shared, cache_dir, dirs_exist_ok=True)
+    _cache_dirs.append(cache_dir)
+    return str(cache_dir)
+
+
+def publish_cache(driver):
+    """
+    Make a closed browser's disk cache the shared one, unless there already is one
+    Only called after quit(), when the browser has written its cache to disk.
+    """
+    browser_name, cache_dir = getattr(driver, "_asset_cache", (None, None))
+    if not cache_dir or not Path(cache_dir).exists():
+        return False
+    shared = Path(Config.ASSET_CACHE_DIR) / browser_name
+    size = sum(path.stat().st_size for path in Path(cache_dir).rglob("*") if path.is_file())
+    if shared.exists() or size < MIN_PUBLISH_BYTES:
+        return False
+    shared.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f"{shared.name}-", dir=shared.parent))
+    shutil.copytree(cache_dir, staging, dirs_exist_ok=True)
+    try:
+        # Another worker may have published in the meantime
+        staging.rename(shared)
+        return True
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+        return False
+
+
+def quit_driver(driver):
+    """Quit a browser and publish its asset cache"""
+    driver.quit()
+    publish_cache(driver)
+
+
+def remove_shared_cache():
+    """Delete the shared cache folder"""
+    shutil.rmtree(Config.ASSET_CACHE_DIR, ignore_errors=True)
+
+
+@atexit.register
+def _remove_cache_dirs():
+    for cache_dir in _cache_dirs:
+        shutil.rmtree(cache_dir, ignore_errors=True)
@@ -0,0 +1,104 @@
+"""
+Test data cleanup registry
+Records the entities tests create and deletes them in one concurrent
+batch at the end of the worker's session
+"""
+import logging
+import time
+import requests
+from utils.seeding import SeedingError
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupRegistry:
+    """
+    Entities created by the tests of one worker
+    Menus and users can be tracked by id or, when a test created them
+    through the UI, by name or email; those are resolved with a single
+    list call each at cleanup time. Menus owned by the worker's data
+    namespace are swept as well, even if no test tracked them.
+    """
+    
+    def __init__(self, namespace=None, enabled=True):
+        """
+        Args:
+            namespace: DataNamespace whose menus are swept at cleanup
+            enabled: When False, run() does nothing (Config.CLEANUP_TEST_DATA)
+        """
+        self.namespace = namespace
+        self.enabled = enabled
+        self.menu_ids = set()
+        self.menu_names = set()
+        self.user_ids = set()
+        self.user_emails = set()
+    
+    def track_menu(self, name=None, menu_id=None):
+        """Record a menu to delete, by name or id"""
+        if menu_id is not None:
+            self.menu_ids.add(menu_id)
+        if name:
+            self.menu_names.add(name)
+    
+    def track_user(self, email=None, user_id=None):
+        """Record a user to delete, by email or id"""
+        if user_id is not None:
+            self.user_ids.add(user_id)
+        if email:
+            self.user_emails.add(email.lower())
+    
+    def _resolve_menus(self, client):
+        ids = set(self.menu_ids)
+        if self.menu_names or self.namespace is not None:
+            for menu in client.list_menus():
+                owned = self.namespace is not None and self.namespace.owns(menu["name"])
+                if owned or menu["name"] in self.menu_names:
+                    ids.add(menu["id"])
+        return ids
+    
+    def _resolve_users(self, client):
+        ids = set(self.user_ids)
+        if self.user_emails:
+            try:
+                users = client.list_users()
+            except SeedingError as e:
+                logger.warning(f"Cleanup: cannot look up users by email: {e}")
+                users = []
+            for user in users:
+                if user["email"].lower() in self.user_emails:
+                    ids.add(user["id"])
+        return ids
+    
+    def run(self, client):
+        """
+        Delete everything tracked, concurrently over the client's connection pool
+        Args:
+            client: SeedClient logged in as admin
+        Returns:
+            (deleted, failed) counts
+        """
+        if not self.enabled:
+            return 0, 0
+        start = time.perf_counter()
+        deletions = (
+            [(client.delete_menu, menu_id) for menu_id in self._resolve_menus(client)]
+            + [(client.delete_user, user_id) for user_id in self._resolve_users(client)]
+        )
+        results = client.bulk(self._delete, deletions)
+        deleted = sum(results)
+        failed = len(results) - deleted
+        logger.info(
+            f"Cleanup deleted {deleted} entities ({failed} failed) in {time.perf_counter() - start:.2f}s"
+        )
+        return deleted, failed
+    
+    @staticmethod
+    def _delete(deletion):
+        delete, entity_id = deletion
+        try:
+            delete(entity_id)
+            return True
+        except (SeedingError, requests.RequestException) as e:
+            # Already gone, or the test left it in a state the API refuses
+            logger.warning(f"Cleanup: {e}")
+            return False
@@ -0,0 +1,53 @@
+"""
+WebDriver command counter
+Counts the commands a driver sends to the browser, one per round-trip
+"""
+from collections import Counter
+import time
+
+
+class CommandCounter:
+    """
+    Counts WebDriver commands by name for one driver
+    Wraps driver.execute, which every WebDriver call goes through,
+    so find, click, script and navigation calls are all counted.
+    """
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.commands = Counter()
+        # Commands sent over the driver's lifetime, never reset
+        self.sent = 0
+        # Command name -> perf_counter() when it was first sent since the last reset
+        self.first_sent = {}
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+    
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the counter attached to a driver, attaching one if needed"""
+        counter = getattr(driver, "_command_counter", None)
+        if counter is None:
+            counter = cls(driver)
+            driver._command_counter = counter
+        return counter
+    
+    def _counting_execute(self, driver_command, params=None):
+        self.commands[driver_command] += 1
+        self.sent += 1
+        self.first_sent.setdefault(driver_command, time.perf_counter())
+        return self._execute(driver_command, params)
+    
+    @property
+    def total(self):
+        """Number of commands sent since the last reset"""
+        return sum(self.commands.values())
+    
+    def snapshot(self):
+        """Copy of the per-command counts"""
+        return Counter(self.commands)
+    
+    def reset(self):
+        """Clear the counts"""
+        self.commands = Counter()
+        self.first_sent = {}
@@ -0,0 +1,115 @@
+"""
+WebDriver factory
+Builds configured browser instances for the fixtures and the driver pool
+"""
+from selenium import webdriver
+from config.config import Config
+from utils.launch_profile import apply_fast_start
+from utils.resource_policy import apply_resource_policy, resource_accounting_enabled
+from utils.asset_cache import launch_cache_dir
+
+
+# Console for failure artifacts, network events for resource counting
+CHROMIUM_LOGGING_PREFS = {"browser": "ALL"}
+CHROMIUM_ACCOUNTING_LOGGING_PREFS = dict(CHROMIUM_LOGGING_PREFS, performance="ALL")
+CHROMIUM_PERF_LOGGING_PREFS = {"enableNetwork": True, "enablePage": False}
+
+
+def set_logging_prefs(options, capability, accounting):
+    """Enable console logging, plus network events when requests are counted"""
+    if accounting:
+        options.set_capability(capability, CHROMIUM_ACCOUNTING_LOGGING_PREFS)
+        options.add_experimental_option("perfLoggingPrefs", CHROMIUM_PERF_LOGGING_PREFS)
+    else:
+        options.set_capability(capability, CHROMIUM_LOGGING_PREFS)
+
+
+def create_driver(browser_name, headless=False, profile=None, resources=None):
+    """
+    Create and configure a new WebDriver instance
+    Args:
+        browser_name: chrome, firefox, or edge
+        headless: Run browser in headless mode
+        profile: Launch profile, "standard" or "fast-start"
+            (defaults to Config.LAUNCH_PROFILE)
+        resources: Resource profile for Chrome and Edge, "full-fidelity" or
+            "functional-minimal" (defaults to Config.RESOURCE_PROFILE)
+    """
+    browser_name = browser_name.lower()
+    fast_start = (profile or Config.LAUNCH_PROFILE) == "fast-start"
+    resources = resources or Config.RESOURCE_PROFILE
+    accounting = resource_accounting_enabled(resources)
+    # Private copy of the shared asset cache, Chromium only
+    cache_dir = launch_cache_dir(browser_name) if Config.ASSET_CACHE and browser_name != "firefox" else None
+    
+    # Chrome browser
+    if browser_name == "chrome":
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        # Accept insecure certificates for localhost
+        options.add_argument("--ignore-certificate-errors")
+        options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        set_logging_prefs(options, "goog:loggingPrefs", accounting)
+        # Leave dialogs open for the page objects to handle
+        options.unhandled_prompt_behavior = "ignore"
+        
+        if fast_start:
+            apply_fast_start("chrome", options, headless)
+        if cache_dir:
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+        
+        # Selenium 4.6+ automatically manages drivers
+        driver = webdriver.Chrome(options=options)
+    
+    # Firefox browser
+    elif browser_name == "firefox":
+        options = webdriver.FirefoxOptions()
+        if headless:
+            options.add_argument("--headless")
+        options.accept_insecure_certs = True
+        options.unhandled_prompt_behavior = "ignore"
+        
+        if fast_start:
+            apply_fast_start("firefox", options, headless)
+        
+        # Selenium 4.6+ automatically manages drivers
+        driver = webdriver.Firefox(options=options)
+    
+    # Edge browser
+    elif browser_name == "edge":
+        options = webdriver.EdgeOptions()
+        if headless:
+            options.add_argument("--headless")
+        options.add_argument("--ignore-certificate-errors")
+        set_logging_prefs(options, "ms:loggingPrefs", accounting)
+        options.unhandled_prompt_behavior = "ignore"
+        
+        if fast_start:
+            apply_fast_start("edge", options, headless)
+        if cache_dir:
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+        
+        # Selenium 4.6+ automatically manages drivers
+        driver = webdriver.Edge(options=options)
+    
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+    
+    apply_resource_policy(driver, resources)
+    if cache_dir:
+        # Published as the shared cache by quit_driver()
+        driver._asset_cache = (browser_name, cache_dir)
+    
+    # Implicit waits compound with explicit ones, page objects use WaitPolicy
+    driver.implicitly_wait(0)
+    # Readiness waits run in the page, allow them their full timeout
+    driver.set_script_timeout(Config.EXPLICIT_WAIT + 5)
+    if not fast_start:
+        # Fast-start sets the window size at launch instead
+        driver.maximize_window()
+    return driver
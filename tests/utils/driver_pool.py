@@ -0,0 +1,139 @@
+"""
+Worker-scoped WebDriver pool
+Keeps one warm browser per worker and resets its state between tests
+"""
+import logging
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.asset_cache import quit_driver
+
+logger = logging.getLogger(__name__)
+
+
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class DriverPool:
+    """
+    Hands out a single reusable browser per worker
+    The browser is recycled after a number of tests or when it crashes
+    """
+    
+    def __init__(self, factory, recycle_after=None):
+        """
+        Args:
+            factory: Callable returning a new configured WebDriver
+            recycle_after: Number of tests served before the browser is replaced
+        """
+        self.factory = factory
+        self.recycle_after = recycle_after or Config.DRIVER_RECYCLE_AFTER
+        self.driver = None
+        self.uses = 0
+        self.base_origin = self._origin(Config.BASE_URL)
+    
+    def acquire(self):
+        """Return the warm browser, starting a new one if needed"""
+        if self.driver is not None and not self._is_alive(self.driver):
+            logger.info("Pooled browser is not responding, replacing it")
+            self.discard()
+        if self.driver is None:
+            self.driver = self.factory()
+            self.uses = 0
+        return self.driver
+    
+    def release(self, driver):
+        """Give the browser back after a test and prepare it for the next one"""
+        if driver is not self.driver:
+            return
+        self.uses += 1
+        if self.uses >= self.recycle_after:
+            logger.info(f"Recycling pooled browser after {self.uses} tests")
+            self.discard()
+        elif not self.reset(driver):
+            self.discard()
+    
+    def reset(self, driver):
+        """
+        Clear cookies, storage, extra tabs and the page objects' caches
+        Returns False if the browser could not be reset and must be replaced
+        """
+        try:
+            self._dismiss_alert(driver)
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            
+            # sessionStorage belongs to the tab and the origin and DevTools cannot
+            # clear it, so clear both storages from a page of the app
+            if self._origin(driver.current_url) != self.base_origin:
+                driver.get(f"{Config.BASE_URL}{Config.SESSION_BOOTSTRAP_PATH}")
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+            self._clear_browser_data(driver)
+            
+            driver.implicitly_wait(0)
+            driver.get("about:blank")
+            self._clear_page_caches(driver)
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Failed to reset pooled browser: {e}")
+            return False
+    
+    def discard(self):
+        """Quit the current browser"""
+        if self.driver is not None:
+            try:
+                quit_driver(self.driver)
+            except WebDriverException:
+                pass
+        self.driver = None
+        self.uses = 0
+    
+    def close(self):
+        """Shut down the pool"""
+        self.discard()
+    
+    @staticmethod
+    def _clear_page_caches(driver):
+        """Drop the page objects' cached page state and elements of the previous test"""
+        for cache in ("_page_state", "_element_cache"):
+            getattr(driver, cache, {}).clear()
+    
+    def _clear_browser_data(self, driver):
+        """Clear cookies of all origins and the app's other storage on Chromium browsers"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+            "origin": self.base_origin,
+            "storageTypes": "local_storage,indexeddb,cache_storage,service_workers"
+        })
+    
+    @staticmethod
+    def _dismiss_alert(driver):
+        """Dismiss an alert left open by a failed test"""
+        try:
+            driver.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
+    
+    @staticmethod
+    def _is_alive(driver):
+        """Check whether the browser still answers commands"""
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+    
+    @staticmethod
+    def _origin(url):
+        """Get scheme://host:port part of a URL"""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
@@ -0,0 +1,70 @@
+"""
+Unique identity generator
+Builds usernames, emails and phones that no other worker, run or test
+has used, for registrations against long-lived databases
+"""
+import hashlib
+import itertools
+from utils.namespace import DataNamespace
+
+
+# Tunisian mobile prefixes accepted by the app's "+216 XX XXX XXX" format
+MOBILE_PREFIXES = [str(p) for p in list(range(20, 30)) + list(range(50, 60)) + list(range(90, 100))]
+PHONE_SPACE = len(MOBILE_PREFIXES) * 10 ** 6
+
+
+class IdentityGenerator:
+    """
+    Identities made of run id, worker index and a per-process sequence
+    Each xdist worker is its own process with its own counter, and
+    next() on itertools.count is atomic, so no lock is shared or taken.
+    Usernames and emails contain the full run id (32 hex characters under
+    xdist), not the short one of the display prefix, so they never repeat.
+    Phones only have 8 digits: each worker owns a block of
+    PHONES_PER_WORKER numbers (number 0 being the worker's own account) and
+    the blocks of MAX_WORKERS workers fit in the phone space, so phones
+    never repeat within a run. A run starts at an offset hashed from its
+    run id over all 30 million numbers, so two runs only share phones when
+    their worker blocks start a few hundred numbers apart.
+    """
+    
+    PHONES_PER_WORKER = 100_000
+    MAX_WORKERS = PHONE_SPACE // PHONES_PER_WORKER
+    
+    def __init__(self, namespace=None):
+        """
+        Args:
+            namespace: DataNamespace giving the run id and worker, a new one by default
+        """
+        self.namespace = namespace or DataNamespace()
+        self.sequence = itertools.count(1)
+        digest = hashlib.sha256(self.namespace.run_id.encode()).digest()
+        self.phone_base = int.from_bytes(digest[:8], "big") % PHONE_SPACE
+    
+    def phone(self, number):
+        """Phone for the n-th identity of this worker, 0 for the worker's own account"""
+        if not 0 <= number < self.PHONES_PER_WORKER:
+            raise ValueError(f"Worker {self.namespace.worker_id} has no phone left for identity {number} "
+                             f"(at most {self.PHONES_PER_WORKER - 1} per worker and run)")
+        worker = self.namespace.worker_index
+        if worker >= self.MAX_WORKERS:
+            raise ValueError(f"Phones are only unique for up to {self.MAX_WORKERS} workers, got {self.namespace.worker_id}")
+        offset = self.phone_base + worker * self.PHONES_PER_WORKER + number
+        prefix, digits = divmod(offset % PHONE_SPACE, 10 ** 6)
+        digits = f"{digits:06d}"
+        return f"+216 {MOBILE_PREFIXES[prefix]} {digits[:3]} {digits[3:]}"
+    
+    def next(self, password="TestPass123!"):
+        """
+        Get a new identity
+        Returns:
+            Dict with username, email, phone and password
+        """
+        number = next(self.sequence)
+        username = f"u{self.namespace.run_id}w{self.namespace.worker_index}n{number}"
+        return {
+            "username": username,
+            "email": f"{username}@goldenfork.test",
+            "phone": self.phone(number),
+            "password": password
+        }
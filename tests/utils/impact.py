@@ -0,0 +1,280 @@
+"""
+Change-impact test selection
+Maps each test to the page-object methods and locators it used in an
+earlier run, and picks the tests touched by a git diff
+"""
+import ast
+import json
+import logging
+import os
+import re
+import subprocess
+from pathlib import Path
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+TESTS_ROOT = Path(__file__).parent.parent
+
+# Changes that cannot affect a test outcome; any other path that is not
+# mapped to single tests below runs every test
+NO_IMPACT = re.compile(r"\.md$|^documentation/")
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# Marks a change that cannot be narrowed down, every test is affected
+EVERYTHING = "*"
+
+
+class CoverageMap:
+    """Test id -> page-object methods and locator names it used"""
+    
+    def __init__(self, path=None):
+        """
+        Args:
+            path: JSON file, defaults to Config.IMPACT_MAP_FILE
+        """
+        self.path = Path(path) if path else TESTS_ROOT / Config.IMPACT_MAP_FILE
+        self.tests = json.loads(self.path.read_text()) if self.path.exists() else {}
+    
+    def update(self, records):
+        """Store the methods and locators of step timing records"""
+        if not records:
+            logger.warning(f"No step timing records in this run, impact map {self.path} left unchanged")
+            return
+        for record in records:
+            self.tests[record["test"]] = {
+                "methods": sorted(record["methods"]),
+                "locators": record["locators"],
+            }
+        self.path.write_text(json.dumps(dict(sorted(self.tests.items())), indent=2) + "\n")
+        logger.info(f"Impact map written to {self.path} ({len(self.tests)} tests)")
+    
+    def recorded_methods(self):
+        """Every page-object method some test used"""
+        return {method for entry in self.tests.values() for method in entry["methods"]}
+    
+    def recorded_locators(self):
+        """Every locator name some test used"""
+        return {locator for entry in self.tests.values() for locator in entry["locators"]}
+    
+    def is_affected(self, nodeid, changes):
+        """
+        Check whether a test must run for a set of changes
+        Tests missing from the map have unknown coverage and always run.
+        """
+        if EVERYTHING in changes or nodeid not in self.tests:
+            return True
+        if nodeid.split("::")[0] in changes["files"]:
+            return True
+        entry = self.tests[nodeid]
+        return bool(
+            changes["methods"].intersection(entry["methods"])
+            or changes["locators"].intersection(entry["locators"])
+            or any(method.split(".")[0] in changes["classes"] for method in entry["methods"])
+        )
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=TESTS_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def changed_lines(ref):
+    """
+    Lines changed since a git ref in the whole repository, untracked files included
+    Returns:
+        Dict path relative to the tests folder (files outside it start
+        with "../") -> set of line numbers in the working tree version;
+        a deletion marks the line after it, line 0 the whole file
+    """
+    root = Path(_git("rev-parse", "--show-toplevel").strip())
+    
+    def relative(path):
+        return Path(os.path.relpath(root / path, TESTS_ROOT)).as_posix()
+    
+    lines, old, current = {}, None, None
+    for line in _git("diff", "-U0", "--no-relative", ref).splitlines():
+        if line.startswith("--- "):
+            old = relative(line[len("--- a/"):]) if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            current = None if line == "+++ /dev/null" else relative(line[len("+++ b/"):])
+            if current:
+                lines.setdefault(current, set())
+            elif old:
+                # Deleted file, line 0 marks it as changed as a whole
+                lines.setdefault(old, set()).add(0)
+        match = HUNK_HEADER.match(line)
+        if match and current:
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            lines[current].update(range(start, start + max(count, 1)))
+    for path in _git("ls-files", "--others", "--exclude-standard", "--full-name", root).splitlines():
+        lines.setdefault(relative(path), set()).add(0)
+    return lines
+
+
+def _symbols(tree):
+    """Yield (name, first line, last line, node) for classes, methods and assignments"""
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            for item in node.body:
+                for name in _defined_names(item):
+                    yield f"{node.name}.{name}", item.lineno, item.end_lineno, item
+        for name in _defined_names(node):
+            yield name, node.lineno, node.end_lineno, node
+
+
+def _defined_names(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, (ast.Assign, ast.AnnAssign)):
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        return [target.id for target in targets if isinstance(target, ast.Name)]
+    return []
+
+
+def changed_symbols(path, line_numbers):
+    """
+    Names defined on the changed lines of a Python file
+    Returns:
+        Set of names like "MenuPage.MENU_CARDS", "MenuPage.snapshot" or
+        "SNAPSHOT_SCRIPT", or None when a change is outside any definition
+    """
+    file_path = TESTS_ROOT / path
+    if not file_path.exists() or 0 in line_numbers:
+        return None
+    tree = ast.parse(file_path.read_text())
+    spans = list(_symbols(tree))
+    symbols = set()
+    for line in line_numbers:
+        # Innermost definition containing the line
+        matches = [name for name, first, last, _ in spans if first <= line <= last]
+        if not matches:
+            # Imports, module docstring, blank lines between definitions
+            return None
+        symbols.add(max(matches, key=lambda name: name.count(".")))
+    return symbols
+
+
+def reference_graph():
+    """
+    Names used by every definition in pages/
+    Returns:
+        Dict symbol ("Class.method", "Class.LOCATOR", "function", "CONSTANT")
+        -> set of the attribute and variable names its definition uses
+    """
+    graph = {}
+    for file_path in sorted((TESTS_ROOT / "pages").glob("*.py")):
+        tree = ast.parse(file_path.read_text())
+        for name, _, _, node in _symbols(tree):
+            if isinstance(node, ast.ClassDef) and "." not in name:
+                # Members are definitions of their own
+                continue
+            graph[name] = {
+                n.attr if isinstance(n, ast.Attribute) else n.id
+                for n in ast.walk(node) if isinstance(n, (ast.Attribute, ast.Name))
+            }
+    return graph
+
+
+def methods_referencing(names, recorded, graph=None):
+    """
+    Recorded page-object methods that use any of the given names
+    Private helpers, constants and other unrecorded definitions using a
+    name are followed to their own users, until recorded methods or
+    constructors are reached.
+    Args:
+        names: Changed symbols, e.g. {"READY_TRACKER_SCRIPT"}
+        recorded: Methods test runs recorded, see CoverageMap.recorded_methods()
+        graph: reference_graph(), built when not given
+    Returns:
+        (methods, classes): recorded methods reached and classes whose
+        constructor was reached
+    """
+    graph = graph if graph is not None else reference_graph()
+    methods, classes, seen = set(), set(), set(names)
+    frontier = {name.split(".")[-1] for name in names}
+    while frontier:
+        users = {symbol for symbol, used in graph.items() if symbol not in seen and used & frontier}
+        seen |= users
+        methods |= users & recorded
+        classes |= {symbol.split(".")[0] for symbol in users if symbol.endswith(".__init__")}
+        frontier = {symbol.split(".")[-1] for symbol in users - recorded}
+    return methods, classes
+
+
+def analyze_changes(ref, coverage=None):
+    """
+    Turn a git diff into the methods, locators and test files it affects
+    Args:
+        ref: Git ref to diff against
+        coverage: CoverageMap, tells which methods and locators tests recorded
+    Returns:
+        Dict with "files", "methods", "locators" and "classes" sets, plus EVERYTHING
+        as a key when the change cannot be mapped to single tests
+    """
+    coverage = coverage if coverage is not None else CoverageMap()
+    recorded, recorded_locators = coverage.recorded_methods(), coverage.recorded_locators()
+    recorded_classes = {method.split(".")[0] for method in recorded}
+    changes = {"files": set(), "methods": set(), "locators": set(), "classes": set(), "summary": []}
+    test_sources = {
+        path.relative_to(TESTS_ROOT).as_posix(): path.read_text()
+        for path in (TESTS_ROOT / "tests").glob("test_*.py")
+    }
+    graph = None
+    
+    def everything(reason):
+        changes[EVERYTHING] = True
+        changes["summary"].append(f"{reason} (runs everything)")
+    
+    for path, line_numbers in sorted(changed_lines(ref).items()):
+        top = path.split("/")[0]
+        if NO_IMPACT.search(path) or path == Config.IMPACT_MAP_FILE:
+            continue
+        if top == "tests" and path.endswith(".py") and "/" in path:
+            changes["files"].add(path)
+            changes["summary"].append(path)
+            continue
+        if top not in ("pages", "data") or not path.endswith(".py"):
+            # conftest.py, config/, utils/, standin/, requirements.txt, files outside the tests folder
+            everything(path)
+            continue
+        symbols = changed_symbols(path, line_numbers)
+        if symbols is None:
+            everything(f"{path} module level")
+            continue
+        changes["summary"].extend(sorted(symbols))
+        if top == "pages":
+            graph = graph if graph is not None else reference_graph()
+            classes = changes["classes"]
+            for symbol in symbols:
+                leaf = symbol.split(".")[-1]
+                if "." in symbol and leaf.isupper():
+                    changes["locators"].add(symbol)
+                elif symbol in recorded_classes or leaf == "__init__":
+                    # Class body or constructor: every test using the class
+                    classes.add(symbol.split(".")[0])
+                elif "." in symbol:
+                    changes["methods"].add(symbol)
+                methods, users = methods_referencing({symbol}, recorded, graph)
+                changes["methods"].update(methods)
+                classes |= users
+                reached = (
+                    symbol in recorded or symbol in recorded_locators or methods
+                    or ({symbol.split(".")[0]} | users) & classes & recorded_classes
+                )
+                if not reached:
+                    everything(f"{symbol} reaches no recorded method")
+        elif not any(Path(path).stem in source for source in test_sources.values()):
+            # Helper module behind the test data API, used indirectly
+            everything(f"{path} used indirectly")
+        else:
+            # Test data: tests whose module uses a changed name
+            leaves = {symbol.split(".")[-1] for symbol in symbols}
+            changes["files"].update(
+                test_file for test_file, source in test_sources.items()
+                if any(re.search(rf"\b{re.escape(leaf)}\b", source) for leaf in leaves)
+            )
+    return changes
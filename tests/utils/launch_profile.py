@@ -0,0 +1,175 @@
+"""
+Fast-start browser launch profile
+Startup-lean flags per browser plus a prepared profile directory on tmpfs,
+copied for every launch so browsers never share state
+"""
+import atexit
+import hashlib
+import json
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from config.config import Config
+
+
+LAUNCH_PROFILES = ("standard", "fast-start")
+
+# Chromium flags that skip work done at startup or in the background
+CHROMIUM_FAST_START_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--blink-settings=imagesEnabled=false",
+    "--mute-audio",
+]
+
+# Firefox preferences with the same intent, written to the profile's user.js
+FIREFOX_FAST_START_PREFS = {
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "browser.aboutwelcome.enabled": False,
+    "app.update.auto": False,
+    "app.update.enabled": False,
+    "extensions.update.enabled": False,
+    "extensions.getAddons.cache.enabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "network.prefetch-next": False,
+    "network.dns.disablePrefetch": True,
+    "permissions.default.image": 2,
+}
+
+# Chromium profile preferences seeded into the template
+CHROMIUM_PREFERENCES = {
+    "browser": {"check_default_browser": False},
+    "profile": {"default_content_setting_values": {"images": 2}},
+}
+
+_launch_dirs = []
+
+
+def profile_root():
+    """Directory holding the profiles, tmpfs when the system has one"""
+    if Config.FAST_START_PROFILE_ROOT:
+        root = Path(Config.FAST_START_PROFILE_ROOT)
+    elif Path("/dev/shm").is_dir():
+        root = Path("/dev/shm")
+    else:
+        root = Path(tempfile.gettempdir())
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def template_settings(browser_name):
+    """Flags and preferences a browser's prepared profile is built for"""
+    if browser_name == "firefox":
+        return {"prefs": FIREFOX_FAST_START_PREFS}
+    return {"args": CHROMIUM_FAST_START_ARGS, "prefs": CHROMIUM_PREFERENCES}
+
+
+def template_dir(browser_name):
+    """
+    Directory of a browser's prepared profile
+    Named after a hash of its flags and preferences, so changing them
+    prepares a new template instead of reusing the old one.
+    """
+    settings = json.dumps(template_settings(browser_name), sort_keys=True)
+    digest = hashlib.sha256(settings.encode()).hexdigest()[:12]
+    return profile_root() / f"goldenfork-{browser_name}-template-{digest}"
+
+
+def _remove_stale_templates(browser_name, current):
+    """Remove templates prepared for earlier flags and preferences"""
+    stale = re.compile(rf"goldenfork-{re.escape(browser_name)}-template(-[0-9a-f]{{12}})?")
+    for path in profile_root().iterdir():
+        if path != current and stale.fullmatch(path.name):
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def _prepare_template(browser_name):
+    """Create the prepared profile once, later launches only copy it"""
+    template = template_dir(browser_name)
+    if template.exists():
+        return template
+    staging = Path(tempfile.mkdtemp(prefix=f"{template.name}-", dir=profile_root()))
+    if browser_name == "firefox":
+        (staging / "user.js").write_text("".join(
+            f"user_pref({json.dumps(name)}, {json.dumps(value)});\n"
+            for name, value in FIREFOX_FAST_START_PREFS.items()
+        ))
+    else:
+        # Marker that tells Chromium the first-run tasks are done
+        (staging / "First Run").touch()
+        (staging / "Default").mkdir()
+        (staging / "Default" / "Preferences").write_text(json.dumps(CHROMIUM_PREFERENCES))
+    try:
+        # Another worker may have prepared it in the meantime
+        staging.rename(template)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+    else:
+        _remove_stale_templates(browser_name, template)
+    return template
+
+
+def launch_profile_dir(browser_name):
+    """
+    Get a fresh copy of the prepared profile for one browser launch
+    Copies are removed when the process exits.
+    """
+    template = _prepare_template(browser_name)
+    launch_dir = Path(tempfile.mkdtemp(prefix=f"goldenfork-{browser_name}-", dir=profile_root()))
+    shutil.copytree(template, launch_dir, dirs_exist_ok=True)
+    _launch_dirs.append(launch_dir)
+    return str(launch_dir)
+
+
+@atexit.register
+def _remove_launch_dirs():
+    for launch_dir in _launch_dirs:
+        shutil.rmtree(launch_dir, ignore_errors=True)
+
+
+def apply_fast_start(browser_name, options, headless):
+    """
+    Add the fast-start flags and profile to browser options
+    Args:
+        browser_name: chrome, firefox, or edge
+        options: Browser options to modify
+        headless: Whether the browser runs headless
+    """
+    if browser_name == "firefox":
+        options.add_argument("-profile")
+        options.add_argument(launch_profile_dir(browser_name))
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+        return options
+    
+    for argument in CHROMIUM_FAST_START_ARGS:
+        options.add_argument(argument)
+    if not any(arg.startswith("--window-size") for arg in options.arguments):
+        options.add_argument("--window-size=1920,1080")
+    options.add_argument(f"--user-data-dir={launch_profile_dir(browser_name)}")
+    if headless and browser_name == "chrome" and Config.CHROME_HEADLESS_SHELL:
+        # Standalone chrome-headless-shell binary
+        options.binary_location = Config.CHROME_HEADLESS_SHELL
+    elif headless:
+        # The headless shell (--headless=old) was removed from regular
+        # Chrome 132+ and Edge binaries, keep the new headless mode there
+        options.arguments[:] = [
+            arg for arg in options.arguments if not arg.startswith("--headless")
+        ]
+        options.add_argument("--headless=new")
+    return options
@@ -0,0 +1,162 @@
+"""
+Locator profile report
+Merges the locator statistics of all tests, ranks locators by the time
+spent resolving them and suggests cheaper CSS or scoped selectors
+"""
+import json
+import re
+from selenium.webdriver.common.by import By
+
+
+# One location step of a simple XPath: axis, element name, predicates
+XPATH_STEP = re.compile(r"(//|/)([\w*-]+)((?:\[[^\]]*\])*)")
+XPATH_PREDICATE = re.compile(r"\[([^\]]*)\]")
+QUOTED = r"""['"]([^'"]*)['"]"""
+
+# Predicates with a CSS equivalent, in the order they are tried
+PREDICATE_TO_CSS = [
+    (re.compile(rf"@class\s*=\s*{QUOTED}"), lambda v: "".join(f".{c}" for c in v.split())),
+    (re.compile(rf"@id\s*=\s*{QUOTED}"), lambda v: f"#{v}"),
+    (re.compile(rf"contains\(\s*@([\w-]+)\s*,\s*{QUOTED}\s*\)"), lambda a, v: f'[{a}*="{v}"]'),
+    (re.compile(rf"@([\w-]+)\s*=\s*{QUOTED}"), lambda a, v: f'[{a}="{v}"]'),
+    (re.compile(r"(\d+)"), lambda n: f":nth-of-type({n})"),
+]
+
+# Predicates matching on text, which CSS cannot express
+TEXT_PREDICATE = re.compile(
+    rf"(?:contains\(\s*(?:text\(\)|\.|normalize-space\(\))\s*,\s*{QUOTED}\s*\)"
+    rf"|(?:text\(\)|\.|normalize-space\(\))\s*=\s*{QUOTED})"
+)
+
+
+def xpath_to_css(xpath):
+    """
+    Convert a simple XPath to CSS
+    A relative XPath (".//a", "./span") becomes CSS relative to the element
+    it is searched from, using :scope for direct children.
+    Returns:
+        (css, text) where text is the text the last element must contain,
+        or None when the XPath uses axes or functions CSS has no match for
+    """
+    relative = xpath.startswith(".")
+    if relative:
+        xpath = xpath[1:]
+    position, parts, text = 0, [], None
+    steps = list(XPATH_STEP.finditer(xpath))
+    for number, step in enumerate(steps):
+        if step.start() != position:
+            return None
+        position = step.end()
+        axis, tag, predicates = step.groups()
+        selector = "" if tag == "*" else tag
+        for predicate in XPATH_PREDICATE.findall(predicates):
+            predicate = predicate.strip()
+            text_match = TEXT_PREDICATE.fullmatch(predicate)
+            if text_match:
+                if number != len(steps) - 1:
+                    return None
+                text = next(group for group in text_match.groups() if group is not None)
+                continue
+            for pattern, convert in PREDICATE_TO_CSS:
+                match = pattern.fullmatch(predicate)
+                if match:
+                    selector += convert(*match.groups())
+                    break
+            else:
+                return None
+        parts.append(("" if axis == "//" else "> ") + (selector or "*"))
+    if not steps or position != len(xpath):
+        return None
+    css = " ".join(parts)
+    if relative:
+        return (f":scope {css}" if css.startswith(">") else css), text
+    return css.lstrip("> "), text
+
+
+def locator_flags(by, value):
+    """Known slow or brittle patterns in a locator"""
+    flags = []
+    if by == By.XPATH:
+        if value.startswith("//") and TEXT_PREDICATE.search(value):
+            flags.append("full-document text scan")
+        if value.startswith("//*"):
+            flags.append("any-element scan")
+        if "@class=" in value.replace(" ", ""):
+            flags.append("exact class match")
+    if by == By.CSS_SELECTOR and "," in value:
+        flags.append(f"selector group of {len(value.split(','))}")
+    return flags
+
+
+def suggest(by, value, group_matches=None):
+    """Cheaper equivalent of a locator, or None when it is fine as it is"""
+    if by == By.CSS_SELECTOR and "," in value:
+        matching = [selector for selector, count in (group_matches or {}).items() if count > 0]
+        if len(matching) == 1:
+            return f'CSS "{matching[0]}" (the only alternative that matched)'
+        if matching:
+            return f'CSS "{matching[0]}" ({len(matching)} alternatives matched, keep one)'
+        return "keep the one alternative the app renders"
+    if by != By.XPATH:
+        return None
+    converted = xpath_to_css(value)
+    if value.startswith("."):
+        # Scoped to a component element (e.g. MenuCard), only searched inside it
+        if converted is None or converted[1] is not None:
+            return None
+        return f'CSS "{converted[0]}" relative to the component'
+    if converted is None:
+        return "add a data-testid attribute and locate by it"
+    css, text = converted
+    if text is None:
+        return f'CSS "{css}"'
+    scope, _, leaf = css.rpartition(" ")
+    scoped = f'XPath ".//{leaf}[contains(., \'{text}\')]" inside "{scope}"' if scope else None
+    plain = f'CSS "{css}" filtered by text "{text}" in one read'
+    return f"{scoped}, or {plain}" if scoped else plain
+
+
+def merge_profiles(profiles):
+    """
+    Add up the locator statistics of several tests
+    Args:
+        profiles: Lists returned by LocatorProfiler.report(), one per test
+    Returns:
+        List of per-locator dicts, most expensive first
+    """
+    merged = {}
+    for profile in profiles:
+        for stats in profile:
+            key = f"{stats['by']}={stats['value']}"
+            total = merged.setdefault(key, dict(stats, tests=0, resolutions=0, polls=0,
+                                                poll_time=0.0, wait_time=0.0, timeouts=0))
+            total["tests"] += 1
+            for field in ("resolutions", "polls", "poll_time", "wait_time", "timeouts"):
+                total[field] += stats[field]
+            total["group_matches"] = total["group_matches"] or stats["group_matches"]
+    ranked = sorted(merged.values(), key=lambda stats: stats["poll_time"], reverse=True)
+    for stats in ranked:
+        stats["flags"] = locator_flags(stats["by"], stats["value"])
+        stats["suggestion"] = suggest(stats["by"], stats["value"], stats["group_matches"])
+    return ranked
+
+
+def format_table(ranked, limit=15):
+    """Text table of the most expensive locators with their suggestions"""
+    lines = [f"{'poll time':>9} {'resolved':>8} {'polls':>6} {'ms/poll':>7}  locator"]
+    for stats in ranked[:limit]:
+        name = ", ".join(stats["names"]) or f"{stats['by']}={stats['value']}"
+        mean = stats["poll_time"] / stats["polls"] * 1000 if stats["polls"] else 0
+        flags = f"  [{'; '.join(stats['flags'])}]" if stats["flags"] else ""
+        lines.append(
+            f"{stats['poll_time']:>8.2f}s {stats['resolutions']:>8} {stats['polls']:>6} {mean:>7.1f}  {name}{flags}"
+        )
+        if stats["suggestion"]:
+            lines.append(f"{'':>35}-> {stats['suggestion']}")
+    return "\n".join(lines)
+
+
+def save_profile(ranked, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(ranked, indent=2))
+    return path
@@ -0,0 +1,57 @@
+"""
+Per-worker test data namespaces
+Keeps data created by parallel workers apart so tests only see their own
+"""
+import os
+import uuid
+
+
+class DataNamespace:
+    """
+    Prefix for everything a worker creates in the app
+    Example prefix: "T-3f9a1c-gw0 ", made from the first 6 characters of the
+    run id. Accounts registered against the database use the full run id.
+    """
+    
+    def __init__(self, worker_id=None, run_id=None):
+        """
+        Args:
+            worker_id: pytest-xdist worker id ("gw0", ...) or "main" for serial runs
+            run_id: Id shared by all workers of one run
+        """
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "main")
+        self.run_id = run_id or os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+        self.short_id = self.run_id[:6]
+        self.prefix = f"T-{self.short_id}-{self.worker_id} "
+        self.user_registered = False
+    
+    @property
+    def is_parallel(self):
+        """True when running inside a pytest-xdist worker"""
+        return self.worker_id != "main"
+    
+    @property
+    def worker_index(self):
+        """Numeric worker index, 0 for serial runs"""
+        digits = "".join(ch for ch in self.worker_id if ch.isdigit())
+        return int(digits) if digits else 0
+    
+    def name(self, base):
+        """Namespace a display name, e.g. a menu name"""
+        return f"{self.prefix}{base}"
+    
+    def owns(self, name):
+        """Check whether a display name belongs to this namespace"""
+        return bool(name) and name.startswith(self.prefix)
+    
+    def user_credentials(self, password="WorkerPass123!"):
+        """Credentials of the user owned by this worker"""
+        # Imported here, identity builds on this module
+        from utils.identity import IdentityGenerator
+        tag = f"{self.run_id}{self.worker_id}".replace("-", "")
+        return {
+            "email": f"worker.{tag}@goldenfork.test",
+            "password": password,
+            "username": f"worker{tag}",
+            "phone": IdentityGenerator(self).phone(0)
+        }
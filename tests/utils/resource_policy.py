@@ -0,0 +1,256 @@
+"""
+Resource policies for Chromium browsers
+Blocks requests no assertion depends on (images, fonts, media, analytics)
+through the DevTools protocol, and counts what each test loaded, blocked
+and took from the browser cache
+"""
+import json
+import logging
+import os
+import re
+import tempfile
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.asset_cache import is_asset
+
+logger = logging.getLogger(__name__)
+
+
+# URL patterns per DevTools resource type, Network.setBlockedURLs only matches URLs
+RESOURCE_TYPE_PATTERNS = {
+    "Image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico"],
+    "Font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "Media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav"],
+}
+
+ANALYTICS_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+]
+
+# Stands in for blocked analytics scripts, so page code calling them keeps working
+ANALYTICS_STUB_SCRIPT = """
+window.dataLayer = window.dataLayer || [];
+window.gtag = window.gtag || function () { window.dataLayer.push(arguments); };
+window.ga = window.ga || function () {};
+"""
+
+RESOURCE_PROFILES = {
+    # Everything the app requests is loaded
+    "full-fidelity": {"types": [], "patterns": [], "stub_analytics": False},
+    # Only documents, scripts, styles and API calls
+    "functional-minimal": {
+        "types": ["Image", "Font", "Media"],
+        "patterns": ANALYTICS_PATTERNS,
+        "stub_analytics": True,
+    },
+}
+
+
+# Dropped patterns already warned about, blocked_url_patterns() runs once per browser
+_warned_patterns = set()
+
+
+def url_matches(url, pattern):
+    """Check a URL against a Network.setBlockedURLs pattern, where * matches any text"""
+    return re.fullmatch(".*".join(re.escape(part) for part in pattern.split("*")), url) is not None
+
+
+def blocked_url_patterns(profile):
+    """
+    URL patterns blocked by a profile, plus Config.RESOURCE_BLOCK_PATTERNS
+    The default session bootstrap path, /favicon.ico?session, matches none
+    of the built-in patterns. A pattern that does match the bootstrap URL
+    is left out with a warning: cached logins are restored there, and a
+    blocked URL lands on an error page outside the app origin.
+    """
+    settings = RESOURCE_PROFILES[profile]
+    patterns = [pattern for kind in settings["types"] for pattern in RESOURCE_TYPE_PATTERNS[kind]]
+    patterns += settings["patterns"]
+    patterns += [p.strip() for p in Config.RESOURCE_BLOCK_PATTERNS.split(",") if p.strip()]
+    bootstrap_url = f"{Config.BASE_URL}{Config.SESSION_BOOTSTRAP_PATH}"
+    kept = []
+    for pattern in patterns:
+        if not url_matches(bootstrap_url, pattern):
+            kept.append(pattern)
+        elif pattern not in _warned_patterns:
+            _warned_patterns.add(pattern)
+            logger.warning(f"Resource block pattern '{pattern}' matches the session bootstrap URL "
+                           f"{bootstrap_url}, not blocking it (change SESSION_BOOTSTRAP_PATH to block it)")
+    return kept
+
+
+def resource_accounting_enabled(profile):
+    """
+    Check whether requests are counted for a profile
+    Counting reads the performance log, which is only switched on when
+    something is blocked, the asset cache needs hit and miss counts or
+    Config.RESOURCE_STATS asks for it.
+    """
+    return bool(blocked_url_patterns(profile)) or Config.ASSET_CACHE or Config.RESOURCE_STATS
+
+
+def apply_resource_policy(driver, profile):
+    """
+    Block the requests of a resource profile in a Chromium browser
+    The blocked URLs stay in effect for the lifetime of the browser.
+    Returns:
+        True if the policy was applied, False on browsers without DevTools
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        if profile != "full-fidelity":
+            logger.warning(f"Resource profile '{profile}' needs Chrome or Edge, loading everything")
+        return False
+    patterns = blocked_url_patterns(profile)
+    if patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    if RESOURCE_PROFILES[profile]["stub_analytics"]:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": ANALYTICS_STUB_SCRIPT})
+    return True
+
+
+class ResourceSizes:
+    """
+    Transfer size of every resource URL seen loading, kept across runs
+    Blocked requests never transfer anything, so their bytes are
+    estimated from the size the same URL had when it was loaded.
+    """
+    
+    def __init__(self, path=None):
+        self.path = path or Config.get_resource_sizes_path()
+        self.sizes = json.loads(self.path.read_text()) if self.path.exists() else {}
+        self.changed = False
+    
+    @staticmethod
+    def key(url):
+        parts = urlsplit(url)
+        return f"{parts.netloc}{parts.path}"
+    
+    def get(self, url):
+        return self.sizes.get(self.key(url))
+    
+    def add(self, url, size):
+        if size and self.sizes.get(self.key(url)) != size:
+            self.sizes[self.key(url)] = size
+            self.changed = True
+    
+    def save(self):
+        """Merge with the file, other workers may have written it meanwhile"""
+        if not self.changed:
+            return
+        stored = json.loads(self.path.read_text()) if self.path.exists() else {}
+        stored.update(self.sizes)
+        handle, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(handle, "w") as file:
+            json.dump(dict(sorted(stored.items())), file, indent=2)
+        os.replace(temp_path, self.path)
+        self.changed = False
+
+
+class ResourceCounter:
+    """
+    Requests loaded, blocked and served from cache by one Chromium browser,
+    from its performance log
+    Needs the "performance" log type, enabled by create_driver() when
+    resource_accounting_enabled() is true.
+    """
+    
+    def __init__(self, driver, sizes=None):
+        self.driver = driver
+        self.sizes = sizes
+        self.reset()
+    
+    @classmethod
+    def for_driver(cls, driver, sizes=None):
+        """Get the counter attached to a driver, attaching one if needed"""
+        counter = getattr(driver, "_resource_counter", None)
+        if counter is None:
+            counter = cls(driver, sizes)
+            driver._resource_counter = counter
+        return counter
+    
+    def _entries(self):
+        try:
+            return self.driver.get_log("performance")
+        except WebDriverException:
+            # Firefox, or a Chromium browser started without performance logging
+            return []
+    
+    def reset(self):
+        """Drop events of earlier tests and clear the counts"""
+        self._entries()
+        self.urls = {}
+        self.cached = set()
+        self.loaded_requests = 0
+        self.loaded_bytes = 0
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.unknown_sizes = 0
+        self.asset_hits = 0
+        self.asset_misses = 0
+        self.asset_bytes_saved = 0
+        self.asset_bytes_loaded = 0
+    
+    def collect(self):
+        """
+        Count the network events logged since the last call
+        Returns:
+            summary() of the counts since the last reset
+        """
+        for entry in self._entries():
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                self.urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.responseReceived":
+                response = params["response"]
+                if response.get("fromDiskCache") or response.get("fromMemoryCache") or response.get("status") == 304:
+                    self.cached.add(params["requestId"])
+            elif method == "Network.requestServedFromCache":
+                self.cached.add(params["requestId"])
+            elif method == "Network.loadingFinished":
+                self._count_loaded(self.urls.get(params["requestId"]), params)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                url = self.urls.get(params["requestId"], "")
+                size = self.sizes.get(url) if self.sizes is not None else None
+                self.blocked_requests += 1
+                self.blocked_bytes += size or 0
+                self.unknown_sizes += size is None
+        return self.summary()
+    
+    def _count_loaded(self, url, params):
+        size = int(params.get("encodedDataLength", 0))
+        from_cache = params["requestId"] in self.cached
+        self.loaded_requests += 1
+        self.loaded_bytes += size
+        if url and self.sizes is not None and not from_cache:
+            # A cached or revalidated response transfers headers only
+            self.sizes.add(url, size)
+        if not url or not is_asset(url):
+            return
+        if from_cache:
+            self.asset_hits += 1
+            self.asset_bytes_saved += (self.sizes.get(url) if self.sizes is not None else None) or 0
+        else:
+            self.asset_misses += 1
+            self.asset_bytes_loaded += size
+    
+    def summary(self):
+        return {
+            "loaded_requests": self.loaded_requests,
+            "loaded_bytes": self.loaded_bytes,
+            "blocked_requests": self.blocked_requests,
+            "blocked_bytes": self.blocked_bytes,
+            "blocked_unknown_size": self.unknown_sizes,
+            "asset_hits": self.asset_hits,
+            "asset_misses": self.asset_misses,
+            "asset_bytes_saved": self.asset_bytes_saved,
+            "asset_bytes_loaded": self.asset_bytes_loaded,
+        }
@@ -0,0 +1,244 @@
+"""
+Local run history
+Stores every test's outcome and duration per run in SQLite, scores
+flakiness from outcome flips on the same code, and prints a report
+of the flakiest tests: python -m utils.run_history
+"""
+import argparse
+import logging
+import sqlite3
+import subprocess
+import time
+from collections import defaultdict
+from pathlib import Path
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    code_version TEXT,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    failed_time REAL NOT NULL,
+    attempts INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_test ON results(test, run_id);
+"""
+
+FLAKE_POLICIES = ("off", "retry", "quarantine")
+
+# Marks quarantined tests, so their xfail counts as a failure in the history
+QUARANTINE_REASON = "quarantined"
+
+
+def code_version():
+    """
+    Commit of the test code, with "-dirty" when tracked files have changes
+    Two runs on the same version ran the same code.
+    """
+    root = Path(__file__).parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def add_report(result, report):
+    """
+    Fold one test report into the test's result of this run
+    Args:
+        result: Dict with outcome, duration, failed_time and attempts
+        report: TestReport of any phase, including pytest-rerunfailures reruns
+    """
+    result["duration"] += report.duration
+    wasxfail = getattr(report, "wasxfail", "")
+    if report.outcome == "rerun":
+        # Failed attempt that pytest-rerunfailures runs again
+        result["attempts"] += 1
+        result["failed_time"] += report.duration
+    elif report.failed or (report.skipped and wasxfail.startswith(QUARANTINE_REASON)):
+        result["outcome"] = "failed"
+        result["failed_time"] += report.duration
+    elif report.skipped and result["outcome"] == "passed":
+        result["outcome"] = "skipped"
+    return result
+
+
+class RunHistory:
+    """Per-test outcomes and durations of earlier runs"""
+    
+    def __init__(self, path=None):
+        """
+        Args:
+            path: SQLite file, defaults to Config.RUN_HISTORY_FILE
+        """
+        self.path = Path(path) if path else Config.get_run_history_path()
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(SCHEMA)
+    
+    def close(self):
+        self.connection.close()
+    
+    def record_run(self, results, started_at, version=None):
+        """
+        Store the results of one run
+        Args:
+            results: Dict test id -> result built by add_report()
+            started_at: Start of the run, time.time()
+            version: Code version the run tested, see code_version()
+        Returns:
+            Id of the run
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, code_version, duration) VALUES (?, ?, ?)",
+                (started_at, version, time.time() - started_at)
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, test, r["outcome"], r["duration"], r["failed_time"], r["attempts"])
+                    for test, r in results.items()
+                ]
+            )
+        logger.info(f"Run history: recorded {len(results)} results as run {run_id} in {self.path}")
+        return run_id
+    
+    def _recent_results(self, window):
+        """Last `window` passed or failed results per test, oldest first"""
+        rows = self.connection.execute(
+            """
+            SELECT test, code_version, outcome, duration, failed_time, attempts FROM (
+                SELECT r.*, runs.code_version,
+                       ROW_NUMBER() OVER (PARTITION BY r.test ORDER BY r.run_id DESC) AS age
+                FROM results r JOIN runs ON runs.id = r.run_id
+                WHERE r.outcome IN ('passed', 'failed')
+            ) WHERE age <= ? ORDER BY test, age DESC
+            """,
+            (window,)
+        )
+        by_test = defaultdict(list)
+        for test, *result in rows:
+            by_test[test].append(result)
+        return by_test
+    
+    def flake_stats(self, window=None):
+        """
+        Flakiness of each test over its recent results
+        A flip is a pass followed by a fail, or the reverse, on the same
+        code version; a failure that passed on rerun within one run is a
+        flip too. The score is flips per comparison, so a test that
+        always fails or always passes scores 0.
+        Args:
+            window: Number of recent results per test (Config.FLAKE_WINDOW)
+        Returns:
+            List of dicts sorted by score, then CI time lost
+        """
+        window = window or Config.FLAKE_WINDOW
+        stats = []
+        for test, results in self._recent_results(window).items():
+            flips = comparisons = 0
+            cost = 0.0
+            outcomes_by_version = defaultdict(set)
+            for version, outcome, _, _, attempts in results:
+                outcomes_by_version[version].add(outcome)
+                comparisons += attempts - 1
+                flips += 1 if attempts > 1 and outcome == "passed" else 0
+            for previous, current in zip(results, results[1:]):
+                if previous[0] == current[0] and previous[0] is not None:
+                    comparisons += 1
+                    flips += previous[1] != current[1]
+            for version, outcome, _, failed_time, attempts in results:
+                # Time lost to failures of code that also passed
+                if len(outcomes_by_version[version]) > 1 or attempts > 1:
+                    cost += failed_time
+            stats.append({
+                "test": test,
+                "runs": len(results),
+                "failures": sum(1 for result in results if result[1] == "failed"),
+                "flips": flips,
+                "score": round(flips / comparisons, 3) if comparisons else 0.0,
+                "cost": round(cost, 2),
+                "mean_duration": round(sum(result[2] for result in results) / len(results), 2),
+            })
+        stats.sort(key=lambda s: (s["score"], s["cost"]), reverse=True)
+        return stats
+    
+    def durations(self, window=10):
+        """
+        Expected duration of each test, from its recent passed results
+        Returns:
+            Dict test id -> mean seconds per attempt
+        """
+        rows = self.connection.execute(
+            """
+            SELECT test, AVG(duration / attempts) FROM (
+                SELECT test, duration, attempts,
+                       ROW_NUMBER() OVER (PARTITION BY test ORDER BY run_id DESC) AS age
+                FROM results WHERE outcome = 'passed'
+            ) WHERE age <= ? GROUP BY test
+            """,
+            (window,)
+        )
+        return dict(rows)
+    
+    def flaky_tests(self, threshold=None, min_runs=None):
+        """
+        Tests whose flake score reaches the threshold
+        Returns:
+            Dict test id -> score
+        """
+        threshold = Config.FLAKE_THRESHOLD if threshold is None else threshold
+        min_runs = Config.FLAKE_MIN_RUNS if min_runs is None else min_runs
+        return {
+            s["test"]: s["score"] for s in self.flake_stats()
+            if s["runs"] >= min_runs and s["score"] >= threshold
+        }
+
+
+def format_report(stats, top=10):
+    """Table of the flakiest tests and the CI time their failures cost"""
+    flaky = [s for s in stats if s["score"] > 0][:top]
+    if not flaky:
+        return "No flaky tests in the run history"
+    lines = [f"{'score':>6} {'flips':>5} {'fails':>5} {'runs':>4} {'lost':>8}  test"]
+    for s in flaky:
+        lines.append(
+            f"{s['score']:>6.2f} {s['flips']:>5} {s['failures']:>5} {s['runs']:>4} {s['cost']:>7.1f}s  {s['test']}"
+        )
+    total = sum(s["cost"] for s in stats)
+    lines.append(f"CI time lost to flaky failures and reruns: {total:.1f}s")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the flakiest tests of the run history")
+    parser.add_argument("--db", default=None, help="Run history file (default: RUN_HISTORY_FILE)")
+    parser.add_argument("--top", type=int, default=10, help="Number of tests to show")
+    parser.add_argument("--window", type=int, default=Config.FLAKE_WINDOW, help="Recent results per test")
+    args = parser.parse_args()
+    
+    history = RunHistory(args.db)
+    print(format_report(history.flake_stats(args.window), args.top))
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
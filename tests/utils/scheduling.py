@@ -0,0 +1,78 @@
+"""
+Duration-aware xdist scheduling
+Hands out tests longest-first, using durations from the run history, and
+keeps pytest-xdist's work stealing for tests that run longer than expected
+"""
+import heapq
+import logging
+from statistics import median
+from xdist.scheduler import WorkStealingScheduling
+
+logger = logging.getLogger(__name__)
+
+
+SCHEDULES = ("default", "longest-first")
+
+# Expected duration of every test when there is no history at all
+DEFAULT_DURATION = 1.0
+
+
+class LongestFirstScheduling(WorkStealingScheduling):
+    """
+    Longest-processing-time-first distribution
+    Tests are sorted by expected duration and each one goes to the worker
+    with the least expected work so far, so every worker starts with its
+    longest tests and ends with its shortest ones. A worker that runs
+    out of tests steals the tail of another worker's queue, which holds
+    the short tests that are cheapest to move.
+    """
+    
+    def __init__(self, config, log=None, durations=None):
+        """
+        Args:
+            config: pytest config
+            log: xdist log producer
+            durations: Dict test id -> expected duration in seconds
+        """
+        super().__init__(config, log)
+        self.durations = durations or {}
+        # Tests without history are assumed to take a typical time
+        self.default_duration = median(self.durations.values()) if self.durations else DEFAULT_DURATION
+        self.expected_loads = {}
+    
+    def expected_duration(self, index):
+        return self.durations.get(self.collection[index], self.default_duration)
+    
+    def schedule(self):
+        """Assign the whole collection longest-first, then leave balancing to work stealing"""
+        assert self.collection_is_completed
+        if self.collection is not None:
+            self.check_schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+        
+        order = sorted(range(len(self.collection)), key=self.expected_duration, reverse=True)
+        nodes = [node for node in self.nodes if not node.shutting_down]
+        # (expected load, tie-breaker, node) of every worker
+        loads = [(0.0, position, node) for position, node in enumerate(nodes)]
+        assigned = {node: [] for node in nodes}
+        for index in order:
+            load, position, node = heapq.heappop(loads)
+            assigned[node].append(index)
+            heapq.heappush(loads, (load + self.expected_duration(index), position, node))
+        
+        for load, _, node in loads:
+            self.expected_loads[node.gateway.id] = load
+            if assigned[node]:
+                self.node2pending[node].extend(assigned[node])
+                node.send_runtest_some(assigned[node])
+        logger.info(
+            "Longest-first schedule, expected seconds per worker: "
+            + ", ".join(f"{worker} {load:.1f}" for worker, load in sorted(self.expected_loads.items()))
+        )
+        self.check_schedule()
@@ -0,0 +1,161 @@
+"""
+HTTP test data seeding client
+Creates users, menus, categories and items through the app's API
+instead of clicking through the UI
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class SeedingError(Exception):
+    """Raised when the API rejects a seeding request"""
+
+
+class SeedClient:
+    """
+    Pooled, keep-alive API client for test preconditions
+    One instance is shared by all tests of a worker. Bulk methods run
+    requests concurrently over the same connection pool.
+    """
+    
+    def __init__(self, base_url=None, pool_size=None):
+        """
+        Args:
+            base_url: API root, defaults to Config.API_BASE_URL
+            pool_size: Max open connections and concurrent bulk requests
+        """
+        self.base_url = (base_url or Config.API_BASE_URL).rstrip("/")
+        self.pool_size = pool_size or Config.SEED_POOL_SIZE
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.verify = Config.API_VERIFY_SSL
+        if not Config.API_VERIFY_SSL:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    
+    # Low level
+    def request(self, method, path, **kwargs):
+        """Send a request and return the decoded JSON body (or None)"""
+        response = self.session.request(
+            method, f"{self.base_url}{path}", timeout=Config.API_TIMEOUT, **kwargs
+        )
+        if response.status_code >= 400:
+            raise SeedingError(f"{method} {path} failed with {response.status_code}: {response.text[:200]}")
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+    
+    def bulk(self, func, items):
+        """Run func(item) for every item concurrently, keeping input order"""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(items))) as executor:
+            return list(executor.map(func, items))
+    
+    # Authentication
+    def login(self, email, password):
+        """Authenticate the client; bearer tokens and cookies are reused for later calls"""
+        body = self.request("POST", Config.API_LOGIN_PATH, json={"email": email, "password": password}) or {}
+        token = body.get("token") or body.get("accessToken") or body.get("jwt")
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        return self
+    
+    def login_as_admin(self):
+        """Authenticate with the admin account from Config"""
+        return self.login(Config.ADMIN_USER_EMAIL, Config.ADMIN_USER_PASSWORD)
+    
+    # Users
+    def create_user(self, username, email, phone, password):
+        """Register a user account"""
+        return self.request("POST", Config.API_REGISTER_PATH, json={
+            "username": username,
+            "email": email,
+            "phone": phone,
+            "password": password,
+            "confirmPassword": password
+        })
+    
+    def create_users(self, users):
+        """Register several users (dicts with username, email, phone, password)"""
+        return self.bulk(lambda user: self.create_user(**user), users)
+    
+    def list_users(self):
+        """Get all users (admin only)"""
+        return self.request("GET", Config.API_USERS_PATH) or []
+    
+    def delete_user(self, user_id):
+        """Delete a user account"""
+        return self.request("DELETE", f"{Config.API_USERS_PATH}/{user_id}")
+    
+    # Menus
+    def create_menu(self, name, description):
+        """Create a menu, returns the created menu"""
+        return self.request("POST", Config.API_MENUS_PATH, json={"name": name, "description": description})
+    
+    def create_menus(self, menus):
+        """Create several menus (dicts with name and description)"""
+        return self.bulk(lambda menu: self.create_menu(menu["name"], menu["description"]), menus)
+    
+    def list_menus(self):
+        """Get all menus"""
+        return self.request("GET", Config.API_MENUS_PATH) or []
+    
+    def delete_menu(self, menu_id):
+        """Delete a menu with its categories and items"""
+        return self.request("DELETE", f"{Config.API_MENUS_PATH}/{menu_id}")
+    
+    # Categories and items
+    def create_category(self, menu_id, name, description):
+        """Create a category inside a menu"""
+        return self.request("POST", Config.API_CATEGORIES_PATH, json={
+            "menuId": menu_id,
+            "name": name,
+            "description": description
+        })
+    
+    def create_item(self, category_id, name, description, price):
+        """Create an item inside a category"""
+        return self.request("POST", Config.API_ITEMS_PATH, json={
+            "categoryId": category_id,
+            "name": name,
+            "description": description,
+            "price": price
+        })
+    
+    def seed_menu_tree(self, menus, categories, items):
+        """
+        Create menus, each with all categories, each with all items
+        Typically called with TEST_MENUS, TEST_CATEGORIES and TEST_ITEMS
+        Returns:
+            List of created menus
+        """
+        created_menus = self.create_menus(menus)
+        created_categories = self.bulk(
+            lambda pair: self.create_category(pair[0]["id"], **pair[1]),
+            [(menu, category) for menu in created_menus for category in categories]
+        )
+        self.bulk(
+            lambda pair: self.create_item(pair[0]["id"], **pair[1]),
+            [(category, item) for category in created_categories for item in items]
+        )
+        logger.info(
+            f"Seeded {len(created_menus)} menus, {len(created_categories)} categories, "
+            f"{len(created_categories) * len(items)} items"
+        )
+        return created_menus
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
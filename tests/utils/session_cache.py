@@ -0,0 +1,131 @@
+"""
+Per-role authenticated session cache
+Logs in through the UI once per worker and restores the captured
+cookies and storage into fresh browsers afterwards
+"""
+import logging
+import time
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import Config
+from pages.login_page import LoginPage
+from pages.menu_page import MenuPage
+from pages.wait_policy import WaitPolicy
+
+logger = logging.getLogger(__name__)
+
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+}
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+var state = arguments[0];
+Object.keys(state.local).forEach(function (k) { window.localStorage.setItem(k, state.local[k]); });
+Object.keys(state.session).forEach(function (k) { window.sessionStorage.setItem(k, state.session[k]); });
+"""
+
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+class SessionCache:
+    """Caches authenticated browser state per role"""
+    
+    # Role name -> Config attribute prefix holding its credentials
+    ROLES = {
+        "test_user": "TEST_USER",
+        "admin": "ADMIN_USER",
+    }
+    
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.sessions = {}
+    
+    @classmethod
+    def get_credentials(cls, role):
+        """Get email and password configured for a role"""
+        if role not in cls.ROLES:
+            raise ValueError(f"Unknown role: {role}")
+        prefix = cls.ROLES[role]
+        return {
+            "email": getattr(Config, f"{prefix}_EMAIL"),
+            "password": getattr(Config, f"{prefix}_PASSWORD"),
+            "username": getattr(Config, f"{prefix}_USERNAME")
+        }
+    
+    def login(self, driver, role):
+        """
+        Authenticate the browser as the given role
+        Restores a cached session when available, otherwise logs in via the UI
+        and caches the resulting state. Leaves the browser on the menu page.
+        """
+        session = self.sessions.get(role)
+        if session is not None:
+            if self._restore(driver, session):
+                return
+            logger.info(f"Cached session for '{role}' expired, logging in again")
+            self.invalidate(role)
+        
+        self._ui_login(driver, role)
+        if self.enabled:
+            self.sessions[role] = self._capture(driver)
+    
+    def invalidate(self, role=None):
+        """Drop the cached session for a role, or all roles"""
+        if role is None:
+            self.sessions.clear()
+        else:
+            self.sessions.pop(role, None)
+    
+    def _ui_login(self, driver, role):
+        """Log in through the login form"""
+        credentials = self.get_credentials(role)
+        login_page = LoginPage(driver)
+        login_page.navigate()
+        login_page.login(credentials['email'], credentials['password'])
+        login_page.wait_for_login_success(timeout=10)
+    
+    def _capture(self, driver):
+        """Capture auth cookies and web storage of the current page"""
+        cookies = [
+            {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+            for cookie in driver.get_cookies()
+        ]
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        return {"cookies": cookies, "storage": storage}
+    
+    def _restore(self, driver, session):
+        """
+        Inject a cached session and verify it is still accepted
+        Returns False if the session has expired
+        """
+        now = time.time()
+        if any(cookie.get("expiry", now + 1) <= now for cookie in session["cookies"]):
+            return False
+        
+        # Cookies and storage can only be set while on the app origin
+        driver.get(f"{Config.BASE_URL}{Config.SESSION_BOOTSTRAP_PATH}")
+        for cookie in session["cookies"]:
+            driver.add_cookie(cookie)
+        driver.execute_script(RESTORE_STORAGE_SCRIPT, session["storage"])
+        
+        menu_page = MenuPage(driver)
+        menu_page.navigate_to(menu_page.page_path)
+        return self._is_authenticated(driver)
+    
+    @staticmethod
+    def _is_authenticated(driver):
+        """Wait until the app either renders the menu page or redirects to login"""
+        rendered = WaitPolicy.for_driver(driver).check(EC.any_of(
+            EC.url_contains("/login"),
+            EC.presence_of_element_located(MenuPage.MENU_CARDS),
+            EC.presence_of_element_located(MenuPage.NO_MENUS_MESSAGE)
+        ), "find")
+        return bool(rendered) and "/login" not in driver.current_url
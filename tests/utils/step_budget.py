@@ -0,0 +1,70 @@
+"""
+Per-test step budgets
+Compares each test's WebDriver command count, sleep time and wait time
+with a baseline recorded from an earlier run
+"""
+import json
+import logging
+from pathlib import Path
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class StepBudget:
+    """
+    Baseline of step timing records, keyed by test id
+    A test goes over budget when a metric exceeds its baseline by more
+    than the margin plus a small absolute slack, so tiny baselines do
+    not fail on a single extra command or a few milliseconds of waiting.
+    """
+    
+    METRICS = ("commands", "sleep_time", "wait_time")
+    COMMAND_SLACK = 2
+    
+    def __init__(self, path=None, margin=None, time_slack=None):
+        """
+        Args:
+            path: Baseline JSON file, defaults to Config.STEP_BASELINE_FILE
+            margin: Allowed relative growth, e.g. 0.2 for 20%
+            time_slack: Allowed absolute growth of sleep and wait time in seconds
+        """
+        self.path = Path(path) if path else Config.get_step_baseline_path()
+        self.margin = Config.STEP_BUDGET_MARGIN if margin is None else margin
+        self.time_slack = Config.STEP_BUDGET_TIME_SLACK if time_slack is None else time_slack
+        self.baseline = json.loads(self.path.read_text()) if self.path.exists() else {}
+    
+    def limit(self, metric, baseline_value):
+        """Highest value of a metric still within budget"""
+        slack = self.COMMAND_SLACK if metric == "commands" else self.time_slack
+        return baseline_value * (1 + self.margin) + slack
+    
+    def check(self, record):
+        """
+        Compare a step timing record with its baseline
+        Returns:
+            List of overrun descriptions, empty when within budget or
+            when the test has no baseline yet
+        """
+        baseline = self.baseline.get(record["test"])
+        if not baseline:
+            return []
+        overruns = []
+        for metric in self.METRICS:
+            if metric not in baseline:
+                continue
+            limit = self.limit(metric, baseline[metric])
+            if record[metric] > limit:
+                overruns.append(
+                    f"{metric} {record[metric]} over budget {limit:.2f} (baseline {baseline[metric]})"
+                )
+        return overruns
+    
+    def update(self, records):
+        """Store the metrics of passed tests as the new baseline"""
+        for record in records:
+            if record.get("passed"):
+                self.baseline[record["test"]] = {metric: record[metric] for metric in self.METRICS}
+        self.path.write_text(json.dumps(dict(sorted(self.baseline.items())), indent=2) + "\n")
+        logger.info(f"Step baseline written to {self.path} ({len(self.baseline)} tests)")
+        return self.path